@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+HUGAI Configuration Bundle Builder
+
+This script compiles every configuration file into one binary bundle (marshal
+payloads behind a header and an offset index, see hugai_config/bundle.py) so that
+consumers can memory-map it and decode single configurations instead of parsing the
+YAML tree at startup. The bundle records a digest of its inputs and is only rebuilt
+when a configuration or schema changed; sync-automation.py does the same after every
+run.
+
+Usage:
+    python build-bundle.py [--config-dir <dir>] [--output <file>] [--force] [--check]
+    python build-bundle.py --list
+    python build-bundle.py --benchmark
+
+Examples:
+    # Build or refresh the bundle next to the configurations
+    python build-bundle.py
+
+    # Fail when the bundle is missing or stale (for CI)
+    python build-bundle.py --check
+
+    # Compare bundle reads with YAML parsing
+    python build-bundle.py --benchmark
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError as e:
+    print(f"❌ Missing required dependencies: {e}")
+    print("💡 Install with: pip install pyyaml")
+    sys.exit(1)
+
+from hugai_config.bundle import (
+    BundleError, ConfigBundle, build_bundle, bundle_inputs, inputs_digest, read_bundle_digest
+)
+from hugai_config.documents import parse_yaml
+
+# Bundle file name inside the configuration directory
+DEFAULT_BUNDLE = "hugai-configs.bundle"
+
+
+def list_bundle(bundle_file: Path):
+    """Print the index of a bundle"""
+    with ConfigBundle(bundle_file) as bundle:
+        print(f"📦 {bundle_file}: {len(bundle)} configurations, inputs {bundle.digest[:12]}")
+        for name, entry in bundle.entries.items():
+            status = "✅" if entry.valid else "⚠️ "
+            print(f"   {status} {entry.config_type:<9} {name:<40} {entry.length:>8} bytes  {entry.file}")
+
+
+def benchmark(config_dir: Path, bundle_file: Path):
+    """Time reading every configuration from YAML and from the bundle"""
+    sources = []
+    for _, path in bundle_inputs(config_dir):
+        sources.append(path.read_bytes())
+
+    start = time.perf_counter()
+    parsed = 0
+    for source in sources:
+        try:
+            parse_yaml(source)
+            parsed += 1
+        except yaml.YAMLError:
+            pass
+    yaml_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ConfigBundle(bundle_file) as bundle:
+        open_time = time.perf_counter() - start
+        for name in bundle:
+            bundle[name]
+        bundle_time = time.perf_counter() - start
+
+    print(f"⏱️  YAML parse of {parsed} files: {yaml_time * 1000:.1f}ms")
+    print(f"⏱️  Bundle open (index only):  {open_time * 1000:.2f}ms")
+    print(f"⏱️  Bundle decode of all:      {bundle_time * 1000:.1f}ms "
+          f"({yaml_time / bundle_time if bundle_time else 0:.0f}x faster)")
+
+
+def main():
+    """Main function to handle command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="HUGAI Configuration Bundle Builder",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        "--config-dir",
+        type=str,
+        default=str(Path(__file__).parent),
+        help="Configuration directory (default: the directory of this script)"
+    )
+
+    parser.add_argument(
+        "--output", "-o",
+        type=str,
+        help=f"Bundle file (default: <config-dir>/{DEFAULT_BUNDLE})"
+    )
+
+    parser.add_argument(
+        "--force", "-f",
+        action="store_true",
+        help="Rebuild even if the bundle is up to date"
+    )
+
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero if the bundle is missing or stale instead of building it"
+    )
+
+    parser.add_argument(
+        "--list", "-l",
+        action="store_true",
+        help="Print the index of the bundle"
+    )
+
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Compare reading the bundle with parsing the YAML files"
+    )
+
+    args = parser.parse_args()
+
+    config_dir = Path(args.config_dir)
+    bundle_file = Path(args.output) if args.output else config_dir / DEFAULT_BUNDLE
+
+    if args.list or args.benchmark:
+        try:
+            if args.list:
+                list_bundle(bundle_file)
+            if args.benchmark:
+                benchmark(config_dir, bundle_file)
+        except (OSError, BundleError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        return
+
+    current = inputs_digest(config_dir)
+    if not args.force and read_bundle_digest(bundle_file) == current:
+        print(f"✅ Bundle is up to date: {bundle_file}")
+        return
+
+    if args.check:
+        print(f"❌ Bundle is missing or stale. Run: python {Path(__file__).name}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    stats = build_bundle(config_dir, bundle_file)
+    duration = time.perf_counter() - start
+
+    print(f"📦 Bundled {stats['configs']} configurations into {bundle_file} "
+          f"({stats['size'] / 1024:.0f} KiB) in {duration:.2f}s")
+    if stats["invalid"]:
+        print(f"   ⚠️  {stats['invalid']} configurations do not match their schema")
+    for file, error in stats["errors"]:
+        print(f"   ❌ {file}: {error} (not bundled)")
+
+
+if __name__ == "__main__":
+    main()
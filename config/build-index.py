@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+HUGAI Configuration Catalog Builder
+
+This script keeps config/index.yaml in step with the configuration files. Entries are
+derived from each file's metadata and dependencies; only files whose content hash
+changed since the last build are parsed again. The catalog also carries a precomputed
+dependency graph (adjacency, topological order, cycles and transitive closure).
+
+Usage:
+    python build-index.py [--config-dir <dir>] [--index <file>] [--check]
+
+Examples:
+    # Rebuild the catalog next to this script
+    python build-index.py
+
+    # Fail when the catalog is out of date (for CI)
+    python build-index.py --check
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError as e:
+    print(f"❌ Missing required dependencies: {e}")
+    print("💡 Install with: pip install pyyaml")
+    sys.exit(1)
+
+from hugai_config.catalog import CatalogBuilder, dump_catalog
+from hugai_config.documents import load_yaml
+
+# Written above the generated catalog
+INDEX_HEADER = """# HUGAI Configuration Catalog
+# Central index of all HUGAI configuration files and their relationships.
+# Maintained by config/build-index.py: entries under `catalog` and the `graph`
+# section are derived from the configuration files. Fields added by hand to an
+# entry or a group, and the other top-level sections, are preserved.
+
+"""
+
+
+def main():
+    """Main function to handle command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="HUGAI Configuration Catalog Builder",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        "--config-dir",
+        type=str,
+        default=str(Path(__file__).parent),
+        help="Configuration directory (default: the directory of this script)"
+    )
+
+    parser.add_argument(
+        "--index",
+        type=str,
+        help="Catalog file (default: <config-dir>/index.yaml)"
+    )
+
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero if the catalog is out of date instead of writing it"
+    )
+
+    args = parser.parse_args()
+
+    config_dir = Path(args.config_dir)
+    index_file = Path(args.index) if args.index else config_dir / "index.yaml"
+
+    try:
+        previous = load_yaml(index_file) if index_file.exists() else {}
+    except yaml.YAMLError as e:
+        print(f"❌ Error loading catalog {index_file}: {e}")
+        sys.exit(1)
+
+    catalog, stats = CatalogBuilder(config_dir).build(previous)
+    content = dump_catalog(catalog, INDEX_HEADER)
+    current = index_file.read_text(encoding='utf-8') if index_file.exists() else None
+
+    print(f"📚 {catalog['system']['total_configurations']} configurations: "
+          f"{stats['added']} added, {stats['updated']} updated, {stats['removed']} removed, "
+          f"{stats['unchanged']} unchanged")
+    graph = catalog["graph"]
+    print(f"🔗 Graph: {graph['nodes']} nodes, {graph['edges']} edges, {len(graph['cycles'])} cycles")
+    for cycle in graph["cycles"]:
+        print(f"   ⚠️  Cycle: {' → '.join(cycle + cycle[:1])}")
+
+    for group in catalog["catalog"].values():
+        for entry in group["configurations"]:
+            if "error" in entry:
+                print(f"   ❌ {entry['file']}: {entry['error']}")
+
+    if content == current:
+        print("✅ Catalog is up to date")
+        return
+
+    if args.check:
+        print(f"❌ Catalog is out of date. Run: python {Path(__file__).name}")
+        sys.exit(1)
+
+    temp_path = index_file.with_name(f".{index_file.name}.tmp")
+    temp_path.write_text(content, encoding='utf-8')
+    temp_path.replace(index_file)
+    print(f"✅ Updated {index_file}")
+
+
+if __name__ == "__main__":
+    main()
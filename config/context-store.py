@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+HUGAI Context Store (SQLite)
+
+This script manages an embedded SQLite context store that follows the schema of
+tools/context-store.yaml (see hugai_config/context_store.py): the projects, agents,
+sessions and decisions tables with their declared indexes, the agent memory tables,
+FTS5 full-text search and the retention policies. It is a reference implementation to
+develop and test against, not a replacement for the PostgreSQL deployment.
+
+Usage:
+    python context-store.py [--db <file>] --init
+    python context-store.py [--db <file>] --search <query> [--table <table>] [--agent-id <id>]
+    python context-store.py [--db <file>] --sweep
+    python context-store.py [--db <file>] --stats
+    python context-store.py --benchmark [<rows>]
+
+Examples:
+    # Create the store next to the current directory
+    python context-store.py --db context.db --init
+
+    # Search agent memory of one agent
+    python context-store.py --db context.db --search "authentication patterns" --agent-id agent-001
+
+    # Delete rows past their retention
+    python context-store.py --db context.db --sweep
+
+    # Insert and query throughput with a million decisions
+    python context-store.py --benchmark 1000000
+"""
+
+import argparse
+import itertools
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError as e:
+    print(f"❌ Missing required dependencies: {e}")
+    print("💡 Install with: pip install pyyaml")
+    sys.exit(1)
+
+from hugai_config.context_store import ContextStore
+from hugai_config.documents import load_yaml
+from hugai_config.planner import parse_duration
+
+DEFAULT_DB = "context-store.db"
+
+# Synthetic decision reasoning of the benchmark: topic words plus terms drawn from a
+# Zipf distribution, so full-text queries range from common to rare words
+BENCHMARK_TOPICS = (
+    "oauth2 jwt session token cache latency schema migration index replica shard queue "
+    "retry backoff timeout rollback canary feature flag encryption audit compliance gdpr "
+    "microservice monolith gateway graphql rest grpc kafka redis postgres neo4j vector "
+    "embedding prompt agent review approval security threat model performance budget"
+).split()
+
+BENCHMARK_TERMS = 5000
+BENCHMARK_WORDS_PER_ROW = 12
+BENCHMARK_QUERIES = 10000
+BENCHMARK_SEARCHES = 1000
+BENCHMARK_EXPIRED = 0.1
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def timed(operation, arguments: list) -> tuple:
+    """Run an operation per argument; (operations per second, p50 and p95 latency in ms)"""
+    samples = []
+    start = time.perf_counter()
+    for argument in arguments:
+        begin = time.perf_counter()
+        operation(argument)
+        samples.append(time.perf_counter() - begin)
+    total = time.perf_counter() - start
+    return len(arguments) / total, percentile(samples, 0.5) * 1000, percentile(samples, 0.95) * 1000
+
+
+def benchmark(store: ContextStore, rows: int, target_p95: float):
+    """Insert synthetic decisions and measure insert, query, search and sweep throughput"""
+    rng = random.Random(0)
+    now = time.time()
+    vocabulary = BENCHMARK_TOPICS + [f"term{n}" for n in range(BENCHMARK_TERMS)]
+    weights = list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+    retention = store.tables["decisions"].retention
+
+    projects = store.insert("projects", [{"name": f"project-{n}", "description": "benchmark project"}
+                                         for n in range(50)])
+    agents = store.insert("agents", [{"id": f"agent-{n}", "name": f"Agent {n}", "type": "benchmark",
+                                      "status": "active"} for n in range(25)])
+    sessions = store.insert("sessions", [{"project_id": rng.choice(projects), "agent_id": rng.choice(agents),
+                                          "start_time": now - rng.random() * 86400}
+                                         for _ in range(max(1, rows // 100))])
+
+    print(f"📝 Inserting {rows:,} decisions in batches of {store.batch_size:,}...")
+    start = time.perf_counter()
+    with store.writer("decisions") as writer:
+        for n in range(rows):
+            expired = retention is not None and n % int(1 / BENCHMARK_EXPIRED) == 0
+            writer.add({
+                "session_id": sessions[n % len(sessions)],
+                "decision_type": BENCHMARK_TOPICS[n % len(BENCHMARK_TOPICS)],
+                "reasoning": " ".join(rng.choices(vocabulary, cum_weights=weights, k=BENCHMARK_WORDS_PER_ROW)),
+                "confidence_score": round(rng.random(), 2),
+                "timestamp": now - retention - 86400 if expired else now - rng.random() * 86400
+            })
+    insert_time = time.perf_counter() - start
+    print(f"⏱️  Insert: {rows / insert_time:,.0f} rows/s ({insert_time:.1f}s, with indexes and FTS)")
+
+    start = time.perf_counter()
+    store.optimize()
+    print(f"⏱️  Optimize: {time.perf_counter() - start:.1f}s")
+
+    ids = [row["id"] for row in store.select("decisions", limit=BENCHMARK_QUERIES)]
+    checks = [
+        ("Lookup by id", lambda row_id: store.get("decisions", row_id), ids),
+        ("Decisions of a session", lambda session: store.select("decisions", {"session_id": session}),
+         rng.choices(sessions, k=BENCHMARK_QUERIES)),
+        ("Confidence range (top 20)",
+         lambda low: store.select("decisions", {"confidence_score": (low, low + 0.01)}, limit=20),
+         [round(rng.random(), 2) for _ in range(BENCHMARK_QUERIES)]),
+        ("Full-text search, one word (top 20)", lambda query: store.search(query, tables=["decisions"]),
+         rng.choices(vocabulary, k=BENCHMARK_SEARCHES)),
+        ("Full-text search, two words (top 20)", lambda query: store.search(query, tables=["decisions"]),
+         [" ".join(rng.choices(vocabulary, k=2)) for _ in range(BENCHMARK_SEARCHES)]),
+    ]
+    for title, operation, arguments in checks:
+        rate, p50, p95 = timed(operation, arguments)
+        status = "✅" if target_p95 is None or p95 <= target_p95 else "⚠️ "
+        print(f"{status} {title}: {rate:,.0f} queries/s, p50 {p50:.2f}ms, p95 {p95:.2f}ms")
+
+    start = time.perf_counter()
+    deleted = store.sweep()
+    sweep_time = time.perf_counter() - start
+    print(f"🧹 Retention sweep: {sum(deleted.values()):,} rows in {sweep_time:.1f}s")
+
+
+def main():
+    """Main function to handle command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="HUGAI Context Store (SQLite)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=str(Path(__file__).parent / "tools" / "context-store.yaml"),
+        help="Context store configuration (default: tools/context-store.yaml)"
+    )
+
+    parser.add_argument(
+        "--db",
+        type=str,
+        help=f"SQLite database file (default: {DEFAULT_DB}, a temporary file for --benchmark)"
+    )
+
+    parser.add_argument(
+        "--init",
+        action="store_true",
+        help="Create the tables, indexes and full-text indexes"
+    )
+
+    parser.add_argument(
+        "--search", "-s",
+        type=str,
+        help="Full-text search (FTS5 query syntax)"
+    )
+
+    parser.add_argument(
+        "--table",
+        action="append",
+        help="Table to search (repeatable, default: all searchable tables)"
+    )
+
+    parser.add_argument(
+        "--agent-id",
+        type=str,
+        help="Only search the memory of this agent"
+    )
+
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Maximum search results (default: 20)"
+    )
+
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Delete rows past their retention period"
+    )
+
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print rows per table"
+    )
+
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        nargs="?",
+        const=1000000,
+        metavar="ROWS",
+        help="Measure insert and query throughput (default: 1000000 decisions)"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        configuration = load_yaml(Path(args.config)) or {}
+    except (OSError, yaml.YAMLError) as e:
+        print(f"❌ Error loading {args.config}: {e}")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.db:
+            db = args.db
+        elif args.benchmark:
+            db = str(Path(temp_dir) / DEFAULT_DB)
+        else:
+            db = DEFAULT_DB
+
+        try:
+            with ContextStore(db, configuration) as store:
+                if args.init:
+                    for statement in store.skipped_indexes:
+                        print(f"⚠️  Not supported by SQLite, skipped: {statement}")
+                    print(f"✅ Context store ready: {db} ({len(store.tables)} tables)")
+
+                if args.search:
+                    hits = store.search(args.search, args.table, args.limit, args.agent_id)
+                    print(f"🔍 {len(hits)} results for {args.search!r}")
+                    for hit in hits:
+                        text = " ".join(str(hit[column]) for column in store.tables[hit["table"]].fts_columns)
+                        print(f"   {hit['table']:<20} {hit['id']}  {text[:80]}")
+
+                if args.sweep:
+                    for table, count in store.sweep().items():
+                        print(f"🧹 {table}: {count} expired rows deleted")
+                    store.optimize()
+
+                if args.stats:
+                    for table, count in store.counts().items():
+                        print(f"   {table:<20} {count:>10,}")
+
+                if args.benchmark:
+                    target = ((configuration.get("configuration") or {}).get("performance_validation") or {}) \
+                        .get("query_performance", "")
+                    try:
+                        target_p95 = parse_duration(target.split("_")[0].lstrip("<")) * 1000
+                    except ValueError:
+                        target_p95 = None
+                    benchmark(store, args.benchmark, target_p95)
+        except sqlite3.Error as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        except KeyError as e:
+            print(f"❌ {e.args[0]}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
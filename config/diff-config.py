@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+HUGAI Configuration Semantic Diff
+
+This script prints compact "what changed" summaries of HUGAI configuration files.
+Files are compared as parsed trees, so formatting, comments and key order are ignored
+and list items are matched by their name or id.
+
+Usage:
+    python diff-config.py <old> <new> [--limit <n>] [--markdown]
+    python diff-config.py --base <git-ref> [<path>...] [--limit <n>] [--markdown]
+
+Examples:
+    # Compare two files
+    python diff-config.py model-llm.old.yaml llms/model-llm.yaml
+
+    # Summarize every configuration changed since main
+    python diff-config.py --base origin/main
+
+    # Write a summary for a GitHub Actions job
+    python diff-config.py --base origin/main --markdown >> $GITHUB_STEP_SUMMARY
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    import yaml
+except ImportError as e:
+    print(f"❌ Missing required dependencies: {e}")
+    print("💡 Install with: pip install pyyaml")
+    sys.exit(1)
+
+from hugai_config.config_types import TYPE_DIRECTORIES
+from hugai_config.documents import load_yaml, parse_yaml
+from hugai_config.semantic_diff import ADDED, REMOVED, Change, diff_trees, format_summary
+
+
+def git_changed_files(base: str, paths: List[str]) -> List[str]:
+    """List YAML files changed between a git ref and the working tree"""
+    result = subprocess.run(
+        ["git", "diff", "--name-only", "--relative", "--no-renames", base, "--"] + paths,
+        check=True, capture_output=True, text=True
+    )
+    return [line for line in result.stdout.splitlines() if line.endswith((".yaml", ".yml"))]
+
+
+def git_show(base: str, path: str) -> Optional[bytes]:
+    """Content of a file at a git ref, or None if it did not exist there"""
+    result = subprocess.run(["git", "show", f"{base}:./{path}"], capture_output=True)
+    return result.stdout if result.returncode == 0 else None
+
+
+def diff_against_base(base: str, paths: List[str]) -> List[Tuple[str, List[Change]]]:
+    """Semantic changes of every configuration file changed since base"""
+    results = []
+    for path in git_changed_files(base, paths):
+        old_source = git_show(base, path)
+        if old_source is None:
+            # Whole files added or removed are one file-level change
+            changes = [Change(ADDED, "$", None, load_yaml(Path(path)))]
+        elif not Path(path).exists():
+            changes = [Change(REMOVED, "$", parse_yaml(old_source), None)]
+        else:
+            changes = diff_trees(parse_yaml(old_source), load_yaml(Path(path)))
+        results.append((path, changes))
+    return results
+
+
+def print_summary(results: List[Tuple[str, List[Change]]], limit: int, markdown: bool):
+    """Print a summary per file"""
+    if markdown:
+        print("## 🔍 Configuration Changes\n")
+        if not results:
+            print("No configuration changes.")
+        for path, changes in results:
+            print(f"### `{path}`\n")
+            print("```diff")
+            print(format_summary(changes, limit))
+            print("```\n")
+        return
+
+    if not results:
+        print("✅ No configuration changes")
+    for path, changes in results:
+        print(f"📄 {path}")
+        for line in format_summary(changes, limit).splitlines():
+            print(f"   {line}")
+        print()
+
+
+def main():
+    """Main function to handle command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="HUGAI Configuration Semantic Diff",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help="Two files to compare, or paths to scan with --base"
+    )
+
+    parser.add_argument(
+        "--base", "-b",
+        type=str,
+        help="Git ref to compare the working tree against"
+    )
+
+    parser.add_argument(
+        "--limit", "-l",
+        type=int,
+        default=50,
+        help="Maximum number of changes listed per file (default: 50)"
+    )
+
+    parser.add_argument(
+        "--markdown",
+        action="store_true",
+        help="Print the summary as Markdown"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if args.base:
+            # Default to the configuration type directories next to this script
+            config_dir = Path(__file__).parent
+            paths = args.paths or [
+                str(config_dir / directory) for directory in TYPE_DIRECTORIES.values()
+                if (config_dir / directory).is_dir()
+            ]
+            results = diff_against_base(args.base, paths)
+        elif len(args.paths) == 2:
+            old_path, new_path = map(Path, args.paths)
+            results = [(str(new_path), diff_trees(load_yaml(old_path), load_yaml(new_path)))]
+        else:
+            parser.error("pass two files to compare, or --base <git-ref>")
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Git error: {e.stderr.strip() if e.stderr else e}")
+        sys.exit(1)
+    except (OSError, yaml.YAMLError) as e:
+        print(f"❌ Error loading configuration: {e}")
+        sys.exit(1)
+
+    print_summary(results, args.limit, args.markdown)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,26 @@ It supports creating new configurations based on predefined templates and custom
 
 Usage:
     python generate-config.py --type <type> --name <name> [--template <template>] [--params <params>]
+    python generate-config.py --batch <manifest> [--workers <n>]
+    python generate-config.py --catalog [<index>] [--workers <n>]
+
+Every configuration is rendered in memory, parsed and validated against the compiled
+schema of its type, then written atomically. Existing files are only replaced with
+--force; --check renders and validates without writing anything.
+
+Batch manifest format:
+    defaults:                  # optional, parameters shared by every entry
+      author: Platform Team
+    configs:
+      - type: tool
+        name: billing-search
+        params:                # inline parameters ...
+          purpose: Search billing records
+      - type: agent
+        name: billing-agent
+        params_file: params/billing-agent.yaml   # ... or a file relative to the manifest
+        template: agent-template.yaml            # optional
+        output: config/agents/billing-agent.yaml # optional
     
 Examples:
     # Generate agent configuration
@@ -18,57 +38,131 @@ Examples:
     # Generate tool configuration with custom template
     python generate-config.py --type tool --name custom-tool --template custom-tool-template.yaml
     
+    # Regenerate an existing configuration, or only check that it would render valid
+    python generate-config.py --type agent --name security-scanner --params params.yaml --force
+    python generate-config.py --type agent --name security-scanner --params params.yaml --check
+    
+    # Generate many configurations from a manifest in one process
+    python generate-config.py --batch platform-tools.yaml --workers 8
+    
+    # Generate every configuration listed in the catalog that does not exist yet
+    python generate-config.py --catalog config/index.yaml
+    
     # Interactive mode
     python generate-config.py --interactive
 """
 
 import argparse
+import importlib.util
 import json
 import os
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 try:
     import yaml
-    from jinja2 import Environment, FileSystemLoader, Template
+    # Used through hugai_config.generator; checked here for the install hint
+    for module in ("jsonschema", "jinja2"):
+        if importlib.util.find_spec(module) is None:
+            raise ImportError(f"No module named '{module}'")
 except ImportError as e:
     print(f"❌ Missing required dependencies: {e}")
-    print("💡 Install with: pip install jinja2 pyyaml")
+    print("💡 Install with: pip install jinja2 pyyaml jsonschema")
     sys.exit(1)
 
+from hugai_config.config_types import DIRECTORY_TYPES, detect_type_from_path, directory_for_type
+from hugai_config.documents import load_yaml, parse_yaml
+from hugai_config.generator import ConfigBuilder, ConfigExistsError, GenerationError
+
+# Sample parameters per configuration type; also the base of catalog scaffolds
+SAMPLE_PARAMETERS: Dict[str, Dict[str, Any]] = {
+    'agent': {
+        'description': 'Specialized AI assistant for analysis, generation and validation tasks',
+        'category': 'specialized',
+        'primary_role': 'Specialized AI assistant',
+        'capabilities': ['analysis', 'generation', 'validation'],
+        'llm_model': 'gpt-4',
+        'temperature': 0.7,
+        'timeout': 300,
+        'inputs': [
+            {'name': 'task_description', 'type': 'string', 'required': True},
+            {'name': 'context', 'type': 'object', 'required': False}
+        ],
+        'outputs': [
+            {'name': 'result', 'type': 'object'},
+            {'name': 'confidence', 'type': 'number'}
+        ]
+    },
+    'lifecycle': {
+        'description': 'Implementation phase turning designs into tested, reviewed code',
+        'phase': 'implementation',
+        'objectives': ['Implement features', 'Ensure code quality'],
+        'deliverables': [
+            {'name': 'source_code', 'type': 'code', 'description': 'Implementation code'},
+            {'name': 'unit_tests', 'type': 'code', 'description': 'Test suite'}
+        ],
+        'agents': [
+            {'name': 'implementation-agent', 'role': 'primary', 'responsibilities': ['Code development']},
+            {'name': 'test-agent', 'role': 'secondary', 'responsibilities': ['Test creation']}
+        ]
+    },
+    'tool': {
+        'description': 'Development productivity tool for code analysis and automation',
+        'category': 'development',
+        'purpose': 'Development productivity tool',
+        'capabilities': ['code_analysis', 'automation', 'reporting'],
+        'interfaces': [
+            {'type': 'cli', 'endpoint': 'tool-command'},
+            {'type': 'api', 'endpoint': 'http://localhost:8080/api'}
+        ],
+        'health_checks': [
+            {'name': 'api_health', 'endpoint': '/health', 'interval': 30}
+        ]
+    },
+    'llm': {
+        'description': 'Language model providers, models and routing rules',
+        'providers': [
+            {
+                'name': 'openai',
+                'type': 'openai',
+                'endpoint': 'https://api.openai.com/v1',
+                'authentication': {'method': 'api_key', 'key_env_var': 'OPENAI_API_KEY'}
+            }
+        ],
+        'models': [
+            {
+                'id': 'gpt-4',
+                'provider': 'openai',
+                'capabilities': {'max_tokens': 4000, 'context_window': 8192},
+                'cost': {'input_cost': 0.03, 'output_cost': 0.06},
+                'parameters': {'temperature': 0.7}
+            }
+        ],
+        'routing_rules': [
+            {'name': 'code-tasks', 'condition': {'task_type': 'code'}, 'target_model': 'gpt-4'}
+        ]
+    }
+}
+
 
 class ConfigGenerator:
     """HUGAI Configuration Generator"""
     
-    def __init__(self, templates_dir: str = "config/templates", output_dir: str = "config"):
+    def __init__(self, templates_dir: str = "config/templates", output_dir: str = "config",
+                 schemas_dir: str = "config/schemas"):
         self.templates_dir = Path(templates_dir)
         self.output_dir = Path(output_dir)
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Add custom filters
-        self.env.filters['to_yaml'] = self._to_yaml
-        self.env.filters['current_date'] = self._current_date
         
         # Verify templates directory exists
         if not self.templates_dir.exists():
             print(f"❌ Templates directory not found: {self.templates_dir}")
             sys.exit(1)
-    
-    def _to_yaml(self, value: Any) -> str:
-        """Convert value to YAML string"""
-        if value is None:
-            return ""
-        return yaml.dump(value, default_flow_style=False, sort_keys=False).strip()
-    
-    def _current_date(self, value: Any = None) -> str:
-        """Get current date in YYYY-MM-DD format"""
-        return datetime.now().strftime("%Y-%m-%d")
+        
+        # Rendering, parsing and validation are done by the embeddable library
+        self.builder = ConfigBuilder(str(self.templates_dir), schemas_dir=schemas_dir)
     
     def get_available_templates(self) -> Dict[str, list]:
         """Get list of available templates by type"""
@@ -102,73 +196,181 @@ class ConfigGenerator:
                 if params_file.suffix.lower() == '.json':
                     return json.load(f)
                 else:
-                    return yaml.safe_load(f) or {}
+                    return parse_yaml(f) or {}
         except Exception as e:
             print(f"❌ Error loading parameters from {params_file}: {e}")
             return {}
     
+    def get_output_file(self, config_type: str, name: str) -> Path:
+        """Default output path of a configuration"""
+        return self.output_dir / directory_for_type(config_type) / f"{name}.yaml"
+    
     def generate_config(self, 
                        config_type: str, 
                        name: str, 
                        template_name: Optional[str] = None,
                        parameters: Optional[Dict[str, Any]] = None,
-                       output_file: Optional[Path] = None) -> bool:
+                       output_file: Optional[Path] = None,
+                       force: bool = False,
+                       check: bool = False) -> bool:
         """Generate configuration file from template"""
         
-        # Determine template name
-        if template_name is None:
-            template_name = f"{config_type}-template.yaml"
+        # Determine output file
+        if output_file is None:
+            output_file = self.get_output_file(config_type, name)
         
-        # Check if template exists
-        template_path = self.templates_dir / template_name
-        if not template_path.exists():
-            print(f"❌ Template not found: {template_path}")
+        if output_file.exists() and not force and not check:
+            print(f"❌ Configuration already exists: {output_file}")
+            print("💡 Use --force to replace it")
             return False
         
-        # Load template
+        # Render, parse and validate before anything is written
         try:
-            template = self.env.get_template(template_name)
-        except Exception as e:
-            print(f"❌ Error loading template {template_name}: {e}")
+            config = self.builder.build(config_type, name, parameters, template_name)
+        except GenerationError as e:
+            print(f"❌ {e}")
             return False
         
-        # Prepare parameters
-        if parameters is None:
-            parameters = {}
-        
-        # Add default parameters
-        default_params = {
-            'name': name,
-            'current_date': datetime.now().strftime("%Y-%m-%d"),
-            'component_type': config_type
-        }
-        
-        # Merge parameters (user params override defaults)
-        render_params = {**default_params, **parameters}
-        
-        # Render template
-        try:
-            rendered_content = template.render(**render_params)
-        except Exception as e:
-            print(f"❌ Error rendering template: {e}")
-            return False
-        
-        # Determine output file
-        if output_file is None:
-            output_subdir = self.output_dir / f"{config_type}s"
-            output_subdir.mkdir(parents=True, exist_ok=True)
-            output_file = output_subdir / f"{name}.yaml"
+        if check:
+            print(f"✅ Configuration is valid: {output_file}")
+            return True
         
         # Write output file
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(rendered_content)
+            self.builder.write(config, output_file, force=force)
             print(f"✅ Generated configuration: {output_file}")
             return True
         except Exception as e:
             print(f"❌ Error writing output file {output_file}: {e}")
             return False
     
+    def load_manifest(self, manifest_file: Path) -> List[Dict[str, Any]]:
+        """Load batch entries from a manifest, resolving parameter files and defaults"""
+        manifest = load_yaml(manifest_file) or {}
+        defaults = manifest.get('defaults') or {}
+        entries = []
+        
+        for index, item in enumerate(manifest.get('configs') or []):
+            if not isinstance(item, dict) or not item.get('type') or not item.get('name'):
+                raise ValueError(f"{manifest_file}: entry {index} needs a type and a name")
+            
+            parameters = dict(defaults)
+            if item.get('params_file'):
+                params_path = manifest_file.parent / item['params_file']
+                if not params_path.exists():
+                    raise FileNotFoundError(f"Parameters file not found: {params_path}")
+                parameters.update(self.load_parameters(params_path))
+            parameters.update(item.get('params') or {})
+            
+            entries.append({
+                'type': item['type'],
+                'name': item['name'],
+                'template': item.get('template'),
+                'params': parameters,
+                'output': Path(item['output']) if item.get('output') else None
+            })
+        
+        return entries
+    
+    def load_catalog(self, index_file: Path) -> List[Dict[str, Any]]:
+        """Build batch entries for every configuration listed in the catalog"""
+        catalog = (load_yaml(index_file) or {}).get('catalog') or {}
+        entries = []
+        
+        for group, section in catalog.items():
+            for item in (section or {}).get('configurations') or []:
+                config_type = (detect_type_from_path(Path(item.get('file', '')))
+                               or DIRECTORY_TYPES.get(group) or group)
+                entries.append({
+                    'type': config_type,
+                    'name': item['name'],
+                    'template': None,
+                    'params': self.catalog_parameters(config_type, item),
+                    'output': None
+                })
+        
+        return entries
+    
+    def catalog_parameters(self, config_type: str, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Template parameters for a catalog entry: the type's sample parameters overlaid
+        with the entry's description, category and dependencies"""
+        parameters = dict(SAMPLE_PARAMETERS.get(config_type, {}))
+        parameters.update({
+            'description': item.get('description', ''),
+            'category': item.get('category') or item.get('type', ''),
+            'config_dependencies': item.get('dependencies', [])
+        })
+        
+        if config_type == 'agent':
+            parameters['agent_dependencies'] = item.get('dependencies', [])
+        elif config_type == 'lifecycle' and item.get('phase'):
+            parameters['phase'] = item['phase']
+        
+        return parameters
+    
+    def generate_entry(self, entry: Dict[str, Any], force: bool = False, check: bool = False) -> Dict[str, Any]:
+        """Build and write one batch entry, returning its result instead of printing"""
+        output_file = entry['output'] or self.get_output_file(entry['type'], entry['name'])
+        result = {'type': entry['type'], 'name': entry['name'], 'output': str(output_file)}
+        
+        if output_file.exists() and not force and not check:
+            result['status'] = 'skipped'
+            return result
+        
+        try:
+            config = self.builder.build(entry['type'], entry['name'], entry['params'], entry['template'])
+            if not check:
+                self.builder.write(config, output_file, force=force)
+            result['status'] = 'checked' if check else 'generated'
+        except ConfigExistsError:
+            # Created by someone else since the check above
+            result['status'] = 'skipped'
+        except (GenerationError, OSError) as e:
+            result['status'] = 'failed'
+            result['error'] = str(e)
+        
+        return result
+    
+    def generate_batch(self, entries: List[Dict[str, Any]], workers: int = 4,
+                       force: bool = False, check: bool = False) -> List[Dict[str, Any]]:
+        """Generate many configurations in one process.
+        
+        Every distinct template is compiled once up front; entries are then rendered,
+        validated and written concurrently. Existing files are skipped unless force is
+        set. Results are returned in entry order.
+        """
+        template_names = {entry['template'] or f"{entry['type']}-template.yaml" for entry in entries}
+        for template_name in template_names:
+            try:
+                self.builder.get_template(template_name)
+            except GenerationError:
+                # Reported per entry
+                pass
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="hugai-generate") as executor:
+            return list(executor.map(lambda entry: self.generate_entry(entry, force, check), entries))
+    
+    def print_batch_summary(self, results: List[Dict[str, Any]], duration: float):
+        """Print one summary for a batch run"""
+        failed = [result for result in results if result['status'] == 'failed']
+        counts = {status: sum(1 for result in results if result['status'] == status)
+                  for status in ('generated', 'checked', 'skipped')}
+        
+        print("\n📊 Batch Generation Summary")
+        print("=" * 50)
+        for status, count in counts.items():
+            if count:
+                print(f"{status.capitalize()}: {count}")
+        if counts['skipped']:
+            print("💡 Skipped configurations already exist; use --force to replace them")
+        print(f"Failed: {len(failed)}")
+        print(f"Duration: {duration:.2f}s")
+        
+        if failed:
+            print("\n❌ Failed configurations:")
+            for result in failed:
+                print(f"  • {result['type']}/{result['name']}: {result['error']}")
+    
     def interactive_mode(self):
         """Interactive configuration generation"""
         print("🔧 HUGAI Configuration Generator - Interactive Mode")
@@ -215,76 +417,19 @@ class ConfigGenerator:
         
         if success:
             print(f"\n🎉 Successfully generated {config_type} configuration for '{name}'!")
-            print(f"📁 Location: {self.output_dir}/{config_type}s/{name}.yaml")
+            print(f"📁 Location: {self.output_dir}/{directory_for_type(config_type)}/{name}.yaml")
             print(f"🔧 Next steps:")
             print(f"   1. Review and customize the generated configuration")
-            print(f"   2. Validate with: python config/validate-config.py --file {self.output_dir}/{config_type}s/{name}.yaml")
+            print(f"   2. Re-validate after editing: python config/validate-config.py --file {self.output_dir}/{directory_for_type(config_type)}/{name}.yaml")
             print(f"   3. Test with: hugai {config_type} start {name}")
         else:
             print(f"\n❌ Failed to generate configuration for '{name}'")
     
     def create_sample_parameters(self, config_type: str, output_file: Path):
         """Create sample parameters file for a configuration type"""
-        sample_params = {
-            'agent': {
-                'primary_role': 'Specialized AI assistant',
-                'capabilities': ['analysis', 'generation', 'validation'],
-                'llm_model': 'gpt-4',
-                'temperature': 0.7,
-                'timeout': 300,
-                'inputs': [
-                    {'name': 'task_description', 'type': 'string', 'required': True},
-                    {'name': 'context', 'type': 'object', 'required': False}
-                ],
-                'outputs': [
-                    {'name': 'result', 'type': 'object'},
-                    {'name': 'confidence', 'type': 'number'}
-                ]
-            },
-            'lifecycle': {
-                'phase': 'implementation',
-                'objectives': ['Implement features', 'Ensure code quality'],
-                'deliverables': [
-                    {'name': 'source_code', 'type': 'code', 'description': 'Implementation code'},
-                    {'name': 'unit_tests', 'type': 'code', 'description': 'Test suite'}
-                ],
-                'agents': [
-                    {'name': 'implementation-agent', 'role': 'primary', 'responsibilities': ['Code development']},
-                    {'name': 'test-agent', 'role': 'secondary', 'responsibilities': ['Test creation']}
-                ]
-            },
-            'tool': {
-                'purpose': 'Development productivity tool',
-                'capabilities': ['code_analysis', 'automation', 'reporting'],
-                'interfaces': [
-                    {'type': 'cli', 'endpoint': 'tool-command'},
-                    {'type': 'api', 'endpoint': 'http://localhost:8080/api'}
-                ],
-                'health_checks': [
-                    {'name': 'api_health', 'endpoint': '/health', 'interval': 30}
-                ]
-            },
-            'llm': {
-                'providers': [
-                    {'name': 'openai', 'type': 'openai', 'endpoint': 'https://api.openai.com/v1'}
-                ],
-                'models': [
-                    {
-                        'id': 'gpt-4',
-                        'provider': 'openai',
-                        'capabilities': {'max_tokens': 4000, 'context_window': 8192},
-                        'cost': {'input_cost': 0.03, 'output_cost': 0.06}
-                    }
-                ],
-                'routing_rules': [
-                    {'condition': {'task_type': 'code'}, 'target_model': 'gpt-4'}
-                ]
-            }
-        }
-        
-        if config_type in sample_params:
+        if config_type in SAMPLE_PARAMETERS:
             with open(output_file, 'w', encoding='utf-8') as f:
-                yaml.dump(sample_params[config_type], f, default_flow_style=False, sort_keys=False)
+                yaml.dump(SAMPLE_PARAMETERS[config_type], f, default_flow_style=False, sort_keys=False)
             print(f"✅ Created sample parameters file: {output_file}")
         else:
             print(f"❌ No sample parameters available for type: {config_type}")
@@ -329,6 +474,39 @@ def main():
         help="Output file path"
     )
     
+    parser.add_argument(
+        "--batch", "-b",
+        type=str,
+        help="Manifest file listing configurations to generate"
+    )
+    
+    parser.add_argument(
+        "--catalog",
+        type=str,
+        nargs="?",
+        const="config/index.yaml",
+        help="Generate every configuration listed in a catalog (default: config/index.yaml)"
+    )
+    
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help="Concurrent renders and writes in batch mode (default: min(8, CPUs))"
+    )
+    
+    parser.add_argument(
+        "--force", "-f",
+        action="store_true",
+        help="Replace configurations that already exist"
+    )
+    
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Render and validate only; write nothing and exit non-zero on failure"
+    )
+    
     parser.add_argument(
         "--interactive", "-i",
         action="store_true",
@@ -355,10 +533,17 @@ def main():
         help="Output directory (default: config)"
     )
     
+    parser.add_argument(
+        "--schemas-dir",
+        type=str,
+        default="config/schemas",
+        help="Schemas directory used to validate generated configurations (default: config/schemas)"
+    )
+    
     args = parser.parse_args()
     
     # Initialize generator
-    generator = ConfigGenerator(args.templates_dir, args.output_dir)
+    generator = ConfigGenerator(args.templates_dir, args.output_dir, args.schemas_dir)
     
     # Handle sample parameters generation
     if args.sample_params:
@@ -366,6 +551,30 @@ def main():
         generator.create_sample_parameters(args.sample_params, output_file)
         return
     
+    # Handle batch and catalog modes
+    if args.batch or args.catalog:
+        try:
+            if args.batch:
+                entries = generator.load_manifest(Path(args.batch))
+            else:
+                entries = generator.load_catalog(Path(args.catalog))
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            print(f"❌ Error loading batch: {e}")
+            sys.exit(1)
+        
+        if not entries:
+            print("✅ Nothing to generate")
+            return
+        
+        print(f"🚀 Generating {len(entries)} configurations with {args.workers} workers...")
+        start = time.perf_counter()
+        results = generator.generate_batch(entries, args.workers, args.force, args.check)
+        generator.print_batch_summary(results, time.perf_counter() - start)
+        
+        if any(result['status'] == 'failed' for result in results):
+            sys.exit(1)
+        return
+    
     # Handle interactive mode
     if args.interactive:
         generator.interactive_mode()
@@ -392,7 +601,9 @@ def main():
         args.name,
         args.template,
         parameters,
-        output_file
+        output_file,
+        args.force,
+        args.check
     )
     
     if not success:
@@ -0,0 +1,23 @@
+"""
+HUGAI Configuration Tooling
+
+Shared library code used by the configuration scripts in this directory
+(validate-config.py, generate-config.py, sync-automation.py, build-index.py,
+build-bundle.py, query-config.py, plan-execution.py, route-model.py,
+simulate-costs.py, context-store.py and vector-index.py).
+
+The package namespace holds only the shared configuration API: type detection,
+document loading and schemas. Everything else is imported from its own module
+(for example ``from hugai_config.metrics import MetricsRegistry``), so a tool only
+pays for the dependencies of the modules it uses.
+"""
+
+from .config_types import TYPE_DIRECTORIES, detect_config_type, directory_for_type
+from .documents import DOCUMENTS, Document, DocumentCache, load_yaml, parse_yaml
+from .schemas import SCHEMA_FILES, SchemaRegistry, get_schema_registry
+
+__all__ = [
+    "TYPE_DIRECTORIES", "detect_config_type", "directory_for_type",
+    "DOCUMENTS", "Document", "DocumentCache", "load_yaml", "parse_yaml",
+    "SCHEMA_FILES", "SchemaRegistry", "get_schema_registry",
+]
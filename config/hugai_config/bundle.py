@@ -0,0 +1,283 @@
+"""
+HUGAI Configuration Bundle
+
+Every parsed configuration compiled into one binary file, so consumers can skip YAML
+parsing at startup. The bundle is a fixed header, one marshal payload per
+configuration, and a marshal-encoded offset index at the end:
+
+    header   magic, format version, marshal version, entry count,
+             index offset and length, SHA-256 of the inputs
+    payloads parsed configuration data, one marshal blob each
+    index    name -> (type, file, source digest, schema valid, offset, length, tagged)
+
+Readers memory-map the file, load only the index, and decode a configuration the first
+time it is requested. marshal is only stable within a marshal version, so the version
+that wrote a bundle is recorded and other versions refuse it; a bundle is a build
+artifact to rebuild, not an exchange format. The inputs digest covers every
+configuration file, the schemas and the format, so a stale bundle is detected without
+parsing anything.
+
+Example:
+    build_bundle(Path("config"), Path("config/hugai-configs.bundle"))
+    with ConfigBundle(Path("config/hugai-configs.bundle")) as bundle:
+        router = bundle["router-agent"]
+"""
+
+import marshal
+import mmap
+import os
+import struct
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from .cache import cache_key
+from .config_types import TYPE_DIRECTORIES
+from .documents import DOCUMENTS
+from .schemas import SchemaRegistry, get_schema_registry
+
+BUNDLE_MAGIC = b"HUGAICFG"
+BUNDLE_FORMAT_VERSION = 1
+
+# magic, format version, marshal version, entries, index offset, index length, inputs digest
+_HEADER = struct.Struct("<8sHHIQQ32s")
+
+# Tags of values marshal cannot encode; YAML timestamps are stored as ISO strings
+_DATETIME_TAG = "!datetime"
+_DATE_TAG = "!date"
+
+
+class BundleError(ValueError):
+    """The file is not a bundle this reader can decode"""
+
+
+class BundleEntry:
+    """Index entry of a bundled configuration"""
+
+    __slots__ = ("name", "config_type", "file", "digest", "valid", "offset", "length", "tagged")
+
+    def __init__(self, name: str, config_type: str, file: str, digest: str, valid: bool,
+                 offset: int, length: int, tagged: bool):
+        self.name = name
+        self.config_type = config_type
+        self.file = file
+        self.digest = digest
+        self.valid = valid
+        self.offset = offset
+        self.length = length
+        self.tagged = tagged
+
+
+def _encode(value: Any) -> Any:
+    """Replace values marshal cannot encode with tagged tuples, which YAML never produces"""
+    if isinstance(value, datetime):
+        return (_DATETIME_TAG, value.isoformat())
+    if isinstance(value, date):
+        return (_DATE_TAG, value.isoformat())
+    if isinstance(value, dict):
+        return {_encode(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, tuple) and len(value) == 2:
+        if value[0] == _DATETIME_TAG:
+            return datetime.fromisoformat(value[1])
+        if value[0] == _DATE_TAG:
+            return date.fromisoformat(value[1])
+    if isinstance(value, dict):
+        return {_decode(key): _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def bundle_inputs(config_dir: Path) -> List[Tuple[str, Path]]:
+    """(configuration type, path) of every configuration file a bundle is built from"""
+    config_dir = Path(config_dir)
+    return [
+        (config_type, path)
+        for config_type, directory in TYPE_DIRECTORIES.items()
+        for path in sorted((config_dir / directory).glob("*.yaml"))
+    ]
+
+
+def inputs_digest(config_dir: Path, schema_registry: Optional[SchemaRegistry] = None) -> str:
+    """SHA-256 over the bundle format, every configuration file and the schemas"""
+    config_dir = Path(config_dir)
+    schema_registry = schema_registry or get_schema_registry(config_dir / "schemas")
+    parts: List[Any] = [BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION, marshal.version]
+    for config_type, path in bundle_inputs(config_dir):
+        parts.extend((path.relative_to(config_dir).as_posix(), DOCUMENTS.load(path).digest))
+    for config_type in TYPE_DIRECTORIES:
+        parts.extend((config_type, schema_registry.digest(config_type) or ""))
+    return cache_key(*parts)
+
+
+def read_bundle_digest(bundle_file: Path) -> Optional[str]:
+    """Inputs digest recorded in a bundle, or None if it is missing or unreadable"""
+    try:
+        with open(bundle_file, "rb") as f:
+            header = f.read(_HEADER.size)
+        magic, format_version, marshal_version, _, _, _, digest = _HEADER.unpack(header)
+    except (OSError, struct.error):
+        return None
+    if magic != BUNDLE_MAGIC or format_version != BUNDLE_FORMAT_VERSION or marshal_version != marshal.version:
+        return None
+    return digest.hex()
+
+
+def build_bundle(config_dir: Path, bundle_file: Path,
+                 schema_registry: Optional[SchemaRegistry] = None) -> Dict[str, Any]:
+    """Compile every parseable configuration into an atomically replaced bundle.
+
+    Files that fail to parse are left out and reported; schema validity is recorded
+    per entry. Returns the counts, the skipped files and the bundle size.
+    """
+    config_dir = Path(config_dir)
+    bundle_file = Path(bundle_file)
+    schema_registry = schema_registry or get_schema_registry(config_dir / "schemas")
+    digest = inputs_digest(config_dir, schema_registry)
+
+    index: Dict[str, tuple] = {}
+    errors: List[Tuple[str, str]] = []
+    invalid = 0
+
+    bundle_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = bundle_file.with_name(f".{bundle_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(b"\0" * _HEADER.size)
+            for config_type, path in bundle_inputs(config_dir):
+                relative = path.relative_to(config_dir).as_posix()
+                document = DOCUMENTS.load(path)
+                try:
+                    data = document.data
+                except yaml.YAMLError as e:
+                    errors.append((relative, str(e).splitlines()[0]))
+                    continue
+                if path.stem in index:
+                    raise BundleError(f"Duplicate configuration name {path.stem}: {relative}")
+
+                try:
+                    payload, tagged = marshal.dumps(data), False
+                except ValueError:
+                    payload, tagged = marshal.dumps(_encode(data)), True
+
+                valid = not schema_registry.validate(data, config_type)
+                invalid += not valid
+                index[path.stem] = (config_type, relative, document.digest, valid,
+                                    f.tell(), len(payload), tagged)
+                f.write(payload)
+
+            index_payload = marshal.dumps(index)
+            index_offset = f.tell()
+            f.write(index_payload)
+            f.seek(0)
+            f.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION, marshal.version, len(index),
+                                 index_offset, len(index_payload), bytes.fromhex(digest)))
+        os.replace(temp_path, bundle_file)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+    return {
+        "configs": len(index),
+        "invalid": invalid,
+        "errors": errors,
+        "size": bundle_file.stat().st_size,
+        "digest": digest
+    }
+
+
+class ConfigBundle:
+    """Memory-mapped reader of a configuration bundle; configurations are decoded on
+    first access and shared afterwards, so they must be treated as read-only"""
+
+    def __init__(self, bundle_file: Path):
+        self.path = Path(bundle_file)
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise BundleError(f"Empty bundle: {self.path}") from None
+
+        try:
+            magic, format_version, marshal_version, count, index_offset, index_length, digest = \
+                _HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            self.close()
+            raise BundleError(f"Truncated bundle: {self.path}") from None
+        if magic != BUNDLE_MAGIC:
+            self.close()
+            raise BundleError(f"Not a configuration bundle: {self.path}")
+        if format_version != BUNDLE_FORMAT_VERSION or marshal_version != marshal.version:
+            self.close()
+            raise BundleError(
+                f"Bundle {self.path} has format {format_version}/marshal {marshal_version}, "
+                f"this reader needs {BUNDLE_FORMAT_VERSION}/{marshal.version}; rebuild it"
+            )
+
+        self.digest = digest.hex()
+        index = marshal.loads(self._map[index_offset:index_offset + index_length])
+        self.entries: Dict[str, BundleEntry] = {
+            name: BundleEntry(name, *fields) for name, fields in index.items()
+        }
+        if len(self.entries) != count:
+            self.close()
+            raise BundleError(f"Corrupt bundle index: {self.path}")
+
+        self._decoded: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ConfigBundle":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def names(self, config_type: Optional[str] = None) -> List[str]:
+        """Names of the bundled configurations, optionally of one type"""
+        return [name for name, entry in self.entries.items()
+                if config_type is None or entry.config_type == config_type]
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._decoded[name]
+        except KeyError:
+            pass
+
+        entry = self.entries[name]
+        data = marshal.loads(self._map[entry.offset:entry.offset + entry.length])
+        if entry.tagged:
+            data = _decode(data)
+        with self._lock:
+            return self._decoded.setdefault(name, data)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self.entries else default
+
+    def items(self, config_type: Optional[str] = None) -> Iterable[Tuple[str, Any]]:
+        for name in self.names(config_type):
+            yield name, self[name]
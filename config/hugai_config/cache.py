@@ -0,0 +1,133 @@
+"""
+HUGAI Result Cache
+
+Content-addressed, per-process cache of render and validation results. Keys are hashes
+of every input of a result (source bytes, template or schema, tool version), so an entry
+can never be stale and the cache can be carried between machines. ``export`` writes the
+entries used or produced by this process to a gzip-compressed JSON artifact (for the
+GitHub Actions cache) and ``import_file`` loads one back.
+
+Example:
+    key = cache_key(TOOL_VERSION, config_bytes, template_source)
+    content = CACHE.get("render", key)
+    if content is None:
+        content = render(...)
+        CACHE.put("render", key, content)
+    CACHE.export(Path(".hugai-cache.json.gz"))
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+# Bump when the artifact layout changes
+CACHE_FORMAT = "hugai-result-cache"
+CACHE_FORMAT_VERSION = 1
+
+# Entries kept in memory per namespace, so watch sessions stay bounded
+MAX_ENTRIES = 4096
+
+
+def cache_key(*parts) -> str:
+    """SHA-256 over the given parts (str or bytes), length-prefixed to avoid collisions"""
+    hasher = hashlib.sha256()
+    for part in parts:
+        data = part if isinstance(part, bytes) else str(part).encode('utf-8')
+        hasher.update(len(data).to_bytes(8, "big"))
+        hasher.update(data)
+    return hasher.hexdigest()
+
+
+class ResultCache:
+    """Namespaced LRU cache of JSON-serializable results keyed by input hash"""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: Dict[str, "OrderedDict[str, Any]"] = {}
+        self._used: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            entries = self._entries.get(namespace)
+            if entries is None or key not in entries:
+                self.misses += 1
+                return None
+            entries.move_to_end(key)
+            self._used.add((namespace, key))
+            self.hits += 1
+            return entries[key]
+
+    def put(self, namespace: str, key: str, value: Any):
+        with self._lock:
+            self._store(namespace, key, value)
+            self._used.add((namespace, key))
+
+    def _store(self, namespace: str, key: str, value: Any):
+        entries = self._entries.setdefault(namespace, OrderedDict())
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            evicted, _ = entries.popitem(last=False)
+            self._used.discard((namespace, evicted))
+
+    def export(self, path: Path, used_only: bool = True) -> int:
+        """Atomically write the cache artifact and return the number of entries written.
+
+        By default only entries used or produced by this process are exported, so an
+        artifact restored and re-exported on every run does not grow without bound.
+        """
+        with self._lock:
+            namespaces = {
+                namespace: {
+                    key: value for key, value in entries.items()
+                    if not used_only or (namespace, key) in self._used
+                }
+                for namespace, entries in self._entries.items()
+            }
+
+        data = {
+            "format": CACHE_FORMAT,
+            "version": CACHE_FORMAT_VERSION,
+            "namespaces": namespaces
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+        return sum(len(entries) for entries in namespaces.values())
+
+    def import_file(self, path: Path) -> int:
+        """Load a cache artifact and return the number of entries loaded"""
+        with gzip.open(Path(path), 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if data.get("format") != CACHE_FORMAT or data.get("version") != CACHE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported cache artifact: {path}")
+
+        count = 0
+        with self._lock:
+            for namespace, entries in data.get("namespaces", {}).items():
+                for key, value in entries.items():
+                    self._store(namespace, key, value)
+                    count += 1
+        return count
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._used.clear()
+            self.hits = self.misses = 0
+
+
+# Shared by every tool running in this process
+CACHE = ResultCache()
@@ -0,0 +1,311 @@
+"""
+HUGAI Configuration Catalog
+
+Builds the config/index.yaml catalog from the configuration files themselves. Entries
+are derived from each file's ``metadata`` and carry the SHA-256 of their source, so an
+incremental rebuild re-parses only files whose hash changed. Hand-curated entry fields
+and top-level sections are preserved.
+
+The catalog also carries a precomputed ``graph`` section over the declared
+dependencies between configurations: adjacency lists, a dependencies-first
+topological order over strongly connected components, the cycles, and the transitive
+closure of every node. Dependencies resolve by name, by a curated ``aliases`` list on
+an entry (``ci-cd-pipelines`` for ``cicd-pipelines``) or by the ``-phase`` suffix.
+Declared dependencies that name no configuration (external systems such as
+``vector-database``) stay on the entry but are not graph edges.
+
+Example:
+    builder = CatalogBuilder(Path("config"))
+    catalog, stats = builder.build(load_yaml(Path("config/index.yaml")))
+    print(catalog["graph"]["topological_order"])
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from .config_types import TYPE_DIRECTORIES
+from .documents import DOCUMENTS
+from .schemas import SCHEMA_FILES
+
+# Entry fields derived from the configuration file on every rebuild; any other
+# field of an existing entry is hand-curated and kept as is. Categories are curated:
+# catalog categories follow the schema enums, metadata categories are free-form.
+DERIVED_FIELDS = ("name", "description", "version", "file", "dependencies", "hash")
+
+# Suffix some configurations use when depending on a lifecycle phase by name
+PHASE_SUFFIX = "-phase"
+
+
+def alias_map(nodes: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+    """Curated ``aliases`` of catalog entries, mapped to the name of their entry"""
+    return {alias: name for name, entry in nodes.items() for alias in entry.get("aliases") or []}
+
+
+def resolve_dependency(dependency: str, nodes: Dict[str, Any],
+                       aliases: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """Map a declared dependency to a configuration name, or None for external ones"""
+    if dependency in nodes:
+        return dependency
+    if aliases and dependency in aliases:
+        return aliases[dependency]
+    if dependency.endswith(PHASE_SUFFIX) and dependency[:-len(PHASE_SUFFIX)] in nodes:
+        return dependency[:-len(PHASE_SUFFIX)]
+    return None
+
+
+def resolve_adjacency(nodes: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Resolved dependency lists of catalog entries keyed by name; external ones are dropped.
+
+    An entry depending on one of its own aliases (a tool declaring the engine it wraps)
+    gets no self-edge.
+    """
+    aliases = alias_map(nodes)
+    return {
+        name: sorted({
+            resolved for dependency in entry.get("dependencies") or []
+            for resolved in [resolve_dependency(dependency, nodes, aliases)]
+            if resolved is not None and (resolved != name or dependency == name)
+        })
+        for name, entry in nodes.items()
+    }
+
+
+def strongly_connected_components(adjacency: Dict[str, List[str]]) -> List[List[str]]:
+    """Tarjan's algorithm, iterative. Components are returned dependencies first:
+    every component comes after all components reachable from it."""
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+
+    for root in adjacency:
+        if root in index:
+            continue
+        work = [(root, iter(adjacency[root]))]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(adjacency[successor])))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+
+    return components
+
+
+def closure_bitsets(adjacency: Dict[str, List[str]], components: List[List[str]],
+                    bit: Dict[str, int]) -> Dict[str, int]:
+    """Transitive closure of every node as an integer bitset, given the strongly
+    connected components in dependencies-first order and each node's bit"""
+    closure: Dict[str, int] = {}
+    for component in components:
+        reach = 0
+        for member in component:
+            for dependency in adjacency[member]:
+                reach |= bit[dependency] | closure.get(dependency, 0)
+        for member in component:
+            closure[member] = reach
+    return closure
+
+
+def compute_graph(adjacency: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Precompute the graph section: adjacency, topological order, cycles and closure"""
+    nodes = sorted(adjacency)
+    components = strongly_connected_components({node: sorted(adjacency[node]) for node in nodes})
+
+    # Closures as integer bitsets over the node order, built dependencies first
+    bit = {node: 1 << position for position, node in enumerate(nodes)}
+    closure = closure_bitsets(adjacency, components, bit)
+
+    cycles = [
+        component for component in components
+        if len(component) > 1 or component[0] in adjacency[component[0]]
+    ]
+
+    def names(mask: int, exclude: str) -> List[str]:
+        return [node for node in nodes if mask & bit[node] and node != exclude]
+
+    return {
+        "nodes": len(nodes),
+        "edges": sum(len(dependencies) for dependencies in adjacency.values()),
+        "adjacency": {node: sorted(adjacency[node]) for node in nodes},
+        "topological_order": [member for component in components for member in component],
+        "cycles": cycles,
+        "transitive_closure": {node: names(closure[node], node) for node in nodes}
+    }
+
+
+class CatalogBuilder:
+    """Incrementally rebuilds the catalog of a configuration directory"""
+
+    def __init__(self, config_dir: Path, root_dir: Optional[Path] = None):
+        self.config_dir = Path(config_dir)
+        # Entry paths are written relative to the repository root, like "config/agents/x.yaml"
+        self.root_dir = Path(root_dir) if root_dir else self.config_dir.parent
+
+    def config_files(self) -> Iterable[Tuple[str, Path]]:
+        """Yield (configuration type, path) for every configuration file"""
+        for config_type, directory in TYPE_DIRECTORIES.items():
+            for path in sorted((self.config_dir / directory).glob("*.yaml")):
+                yield config_type, path
+
+    def relative_path(self, path: Path) -> str:
+        try:
+            return path.resolve().relative_to(self.root_dir.resolve()).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def build_entry(self, path: Path, digest: str, previous: Dict[str, Any]) -> Dict[str, Any]:
+        """Derive an entry from a configuration file, keeping curated fields of the previous one"""
+        metadata = DOCUMENTS.load(path).data.get("metadata") or {}
+        # Configurations refer to each other by file stem, which metadata names do not always match
+        derived = {
+            "name": path.stem,
+            "description": metadata.get("description", ""),
+            "version": metadata.get("version"),
+            "file": self.relative_path(path),
+            "dependencies": list(metadata.get("dependencies") or []),
+            "hash": digest
+        }
+        curated = {key: value for key, value in previous.items()
+                   if key not in DERIVED_FIELDS and key != "error"}
+        return {**derived, **curated}
+
+    def build(self, previous: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """Rebuild the catalog from the previous one and return it with change counts.
+
+        Files whose source hash matches their previous entry are not parsed again. A
+        file that fails to parse keeps its previous entry, marked with the error.
+        """
+        previous = dict(previous or {})
+        previous_groups = previous.get("catalog") or {}
+        previous_entries = {
+            entry.get("file"): entry
+            for group in previous_groups.values()
+            for entry in (group or {}).get("configurations") or []
+        }
+
+        stats = {"unchanged": 0, "updated": 0, "added": 0, "removed": 0, "errors": 0}
+        groups: Dict[str, Dict[str, Any]] = {}
+        seen = set()
+
+        for config_type, path in self.config_files():
+            relative = self.relative_path(path)
+            seen.add(relative)
+            old = previous_entries.get(relative, {})
+            digest = DOCUMENTS.load(path).digest
+
+            if old.get("hash") == digest and "error" not in old:
+                entry = old
+                stats["unchanged"] += 1
+            else:
+                try:
+                    entry = self.build_entry(path, digest, old)
+                    stats["updated" if old else "added"] += 1
+                except (yaml.YAMLError, AttributeError) as e:
+                    entry = {**old, "name": old.get("name", path.stem), "file": relative,
+                             "error": str(e).splitlines()[0]}
+                    stats["errors"] += 1
+
+            directory = TYPE_DIRECTORIES[config_type]
+            groups.setdefault(directory, self.group_header(config_type, previous_groups))
+            groups[directory]["configurations"].append(entry)
+
+        stats["removed"] = len(set(previous_entries) - seen)
+
+        for group in groups.values():
+            group["count"] = len(group["configurations"])
+
+        nodes = {entry["name"]: entry for group in groups.values() for entry in group["configurations"]}
+        adjacency = resolve_adjacency(nodes)
+
+        catalog = dict(previous)
+        system = dict(previous.get("system") or {})
+        system.update({
+            "total_configurations": len(nodes),
+            "validation_status": "failing" if any("error" in entry for entry in nodes.values()) else "passing"
+        })
+        if groups != previous_groups or "last_updated" not in system:
+            system["last_updated"] = datetime.now().strftime("%Y-%m-%d")
+
+        catalog["system"] = system
+        catalog["catalog"] = groups
+        catalog["graph"] = compute_graph(adjacency)
+        return catalog, stats
+
+    def group_header(self, config_type: str, previous_groups: Dict[str, Any]) -> Dict[str, Any]:
+        """Group fields for a configuration type, keeping curated ones of the previous catalog"""
+        directory = TYPE_DIRECTORIES[config_type]
+        location = f"{self.relative_path(self.config_dir / directory)}/"
+        previous = next(
+            (group for key, group in previous_groups.items()
+             if key == directory or (group or {}).get("location") == location),
+            None
+        ) or {}
+
+        header = {key: value for key, value in previous.items() if key != "configurations"}
+        header.update({
+            "location": location,
+            "schema": self.relative_path(self.config_dir / "schemas" / SCHEMA_FILES[config_type])
+        })
+        header.setdefault("category", directory.title())
+        header["configurations"] = []
+        return header
+
+
+class _FlowList(list):
+    """List dumped in flow style, to keep the graph section compact"""
+
+
+def _represent_flow_list(dumper, data):
+    return dumper.represent_sequence("tag:yaml.org,2002:seq", data, flow_style=True)
+
+
+class _CatalogDumper(yaml.SafeDumper):
+    pass
+
+
+_CatalogDumper.add_representer(_FlowList, _represent_flow_list)
+
+
+def _flow_scalar_lists(node: Any) -> Any:
+    if isinstance(node, dict):
+        return {key: _flow_scalar_lists(value) for key, value in node.items()}
+    if isinstance(node, list):
+        items = [_flow_scalar_lists(item) for item in node]
+        return _FlowList(items) if all(not isinstance(item, (dict, list)) for item in items) else items
+    return node
+
+
+def dump_catalog(catalog: Dict[str, Any], header: str = "") -> str:
+    """Serialize a catalog, with lists of names in flow style"""
+    body = yaml.dump(_flow_scalar_lists(catalog), Dumper=_CatalogDumper, sort_keys=False,
+                     allow_unicode=True, width=2 ** 31)
+    return header + body
+
@@ -0,0 +1,72 @@
+"""
+HUGAI Configuration Types
+
+The single configuration type detector shared by the configuration tools. The type is
+taken from the nearest enclosing type directory (agents/, lifecycle/, tools/, llms/)
+and, for files outside those directories, from the document's metadata.
+
+Example:
+    detect_config_type(Path("config/agents/router-agent.yaml"))  # "agent"
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Configuration directory name for each configuration type
+TYPE_DIRECTORIES: Dict[str, str] = {
+    "agent": "agents",
+    "lifecycle": "lifecycle",
+    "tool": "tools",
+    "llm": "llms"
+}
+
+DIRECTORY_TYPES: Dict[str, str] = {directory: config_type for config_type, directory in TYPE_DIRECTORIES.items()}
+
+AGENT_CATEGORIES = {"core", "specialized", "utility", "governance"}
+TOOL_CATEGORIES = {"development", "testing", "deployment", "monitoring", "security", "collaboration"}
+
+
+def directory_for_type(config_type: str) -> str:
+    """Configuration directory of a configuration type"""
+    return TYPE_DIRECTORIES.get(config_type, f"{config_type}s")
+
+
+def detect_type_from_path(config_path: Path) -> Optional[str]:
+    """Detect the configuration type from the nearest enclosing type directory"""
+    for part in reversed(Path(config_path).parts[:-1]):
+        if part in DIRECTORY_TYPES:
+            return DIRECTORY_TYPES[part]
+    return None
+
+
+def detect_type_from_content(content: Any) -> Optional[str]:
+    """Detect the configuration type from parsed configuration metadata"""
+    if not isinstance(content, dict) or not isinstance(content.get("metadata"), dict):
+        return None
+
+    metadata = content["metadata"]
+    if "category" in metadata:
+        if metadata["category"] in AGENT_CATEGORIES:
+            return "agent"
+        if metadata["category"] in TOOL_CATEGORIES:
+            return "tool"
+    elif "phase" in metadata:
+        return "lifecycle"
+    elif "providers" in (content.get("configuration") or {}):
+        return "llm"
+    return None
+
+
+def detect_config_type(config_path: Path, content: Any = None) -> Optional[str]:
+    """Detect the configuration type of a file, loading it only when the path is ambiguous"""
+    config_type = detect_type_from_path(config_path)
+    if config_type is not None:
+        return config_type
+
+    if content is None:
+        from .documents import load_yaml
+        try:
+            content = load_yaml(config_path)
+        except Exception:
+            return None
+    return detect_type_from_content(content)
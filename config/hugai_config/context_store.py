@@ -0,0 +1,445 @@
+"""
+HUGAI Context Store (SQLite)
+
+Embedded reference implementation of the context store of tools/context-store.yaml,
+for local development and tests. The schema is derived from the configuration:
+
+  • ``storage_architecture.metadata_store.schema_design.entities`` become tables, with
+    the PostgreSQL column types mapped to SQLite (UUID, VARCHAR and JSONB to TEXT,
+    timestamps to REAL epoch seconds, DECIMAL to REAL, BOOLEAN to INTEGER) and the
+    declared indexes created as written; SQLite has no GIN indexes, so those are
+    listed in ``skipped_indexes`` instead
+  • ``agent_memory.episodic_memory.memory_types`` stored in PostgreSQL become memory
+    tables (agent, session, task type, outcome, content, metadata, timestamp) with
+    their ``indexed_fields`` indexed
+  • decisions, projects and memory content are indexed for full-text search with FTS5
+    tables that triggers keep in sync
+  • memory tables expire after their ``retention`` and decisions after the
+    ``agent_decisions`` retention of ``data_lifecycle``; sweeps delete expired rows in
+    batches, each in its own transaction, using an index on the timestamp
+
+Writes are batched: insert() writes a list of rows in one transaction, and writer()
+buffers rows and flushes every ``batch_size``. The full-text indexes merge lazily during
+writes; optimize() compacts them after bulk loads and sweeps. JSON columns accept and return Python
+objects; ids default to time-ordered (version 7) UUIDs and timestamps to the current
+time. Inserts are indexed for search per batch; rows inserted by other clients need
+rebuild_search_index().
+
+Example:
+    store = ContextStore.load(Path("context.db"), Path("config/tools/context-store.yaml"))
+    store.insert("decisions", [{"session_id": session, "reasoning": "OAuth2 with JWT"}])
+    store.search("oauth2", tables=["decisions"])
+    store.sweep()
+    store.optimize()
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .documents import load_yaml
+from .planner import parse_duration
+
+DEFAULT_BATCH_SIZE = 10000
+
+# FTS5 merges index segments once this many of a level exist (SQLite's default is 4);
+# merging less often speeds up bulk writes, and optimize() merges them afterwards
+FTS_AUTOMERGE = 16
+
+# PostgreSQL column types of the configuration -> SQLite declarations
+_TYPE_REPLACEMENTS = (
+    (re.compile(r"\bUUID\b", re.I), "TEXT"),
+    (re.compile(r"\bVARCHAR\s*\(\d+\)", re.I), "TEXT"),
+    (re.compile(r"\bJSONB?\b", re.I), "TEXT"),
+    (re.compile(r"\bTIMESTAMP(\s+WITH(OUT)?\s+TIME\s+ZONE)?\b", re.I), "REAL"),
+    (re.compile(r"\bDECIMAL\s*\(\d+\s*,\s*\d+\)", re.I), "REAL"),
+    (re.compile(r"\bBOOLEAN\b", re.I), "INTEGER"),
+    (re.compile(r"\bDEFAULT\s+FALSE\b", re.I), "DEFAULT 0"),
+    (re.compile(r"\bDEFAULT\s+TRUE\b", re.I), "DEFAULT 1"),
+)
+
+_DEFAULT_PATTERN = re.compile(r"\bDEFAULT\s+(-?\d+(?:\.\d+)?)\b", re.I)
+
+_INDEX_PATTERN = re.compile(
+    r"^\s*CREATE\s+(UNIQUE\s+)?INDEX\s+(\w+)\s+ON\s+(\w+)\s*(USING\s+\w+\s*)?\(([^)]*)\)\s*;?\s*$", re.I
+)
+
+# Columns of the agent memory tables, which the configuration names but does not define
+MEMORY_COLUMNS = (
+    "id UUID PRIMARY KEY",
+    "agent_id UUID REFERENCES agents(id)",
+    "session_id UUID REFERENCES sessions(id)",
+    "task_type VARCHAR(100)",
+    "outcome VARCHAR(100)",
+    "content TEXT",
+    "metadata JSONB",
+    "timestamp TIMESTAMP WITH TIME ZONE",
+)
+
+# Free-text columns indexed with FTS5, per table (memory tables index their content)
+FTS_COLUMNS = {
+    "projects": ("name", "description"),
+    "decisions": ("reasoning",),
+}
+MEMORY_FTS_COLUMNS = ("content",)
+
+# Tables expiring with a data_lifecycle retention policy: table -> (policy, column)
+LIFECYCLE_RETENTION = {
+    "decisions": ("agent_decisions", "timestamp"),
+}
+
+# Columns set to the current time when a row is written without them
+_CREATED_COLUMNS = ("created_at", "timestamp", "start_time")
+
+
+def time_ordered_uuid() -> str:
+    """Version 7 UUID: a millisecond timestamp followed by random bits, so new primary
+    keys are appended to the index instead of scattered across it"""
+    value = (time.time_ns() // 1000000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return str(uuid.UUID(int=value))
+
+
+class Column(NamedTuple):
+    name: str
+    declaration: str
+    kind: str  # "json", "time", "bool" or "plain"
+    default: Any
+
+
+class TableSpec(NamedTuple):
+    """SQLite layout of one context store table"""
+    name: str
+    columns: Tuple[Column, ...]
+    indexes: Tuple[str, ...]
+    fts_columns: Tuple[str, ...]
+    retention: Optional[float]
+    retention_column: Optional[str]
+
+
+def _column(definition: str) -> Column:
+    name, _, declaration = definition.strip().partition(" ")
+    upper = declaration.upper()
+    kind = "json" if "JSON" in upper else "time" if "TIMESTAMP" in upper \
+        else "bool" if "BOOLEAN" in upper else "plain"
+    for pattern, replacement in _TYPE_REPLACEMENTS:
+        declaration = pattern.sub(replacement, declaration)
+    # Rows are inserted with every column, so numeric defaults are applied on write
+    default = _DEFAULT_PATTERN.search(declaration)
+    return Column(name, f"{name} {declaration}", kind,
+                  float(default.group(1)) if default and "." in default.group(1)
+                  else int(default.group(1)) if default else None)
+
+
+def _retention(value: Any) -> Optional[float]:
+    try:
+        return parse_duration(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def load_spec(configuration: Dict[str, Any]) -> Tuple[Dict[str, TableSpec], List[str]]:
+    """Table layouts from a context store configuration, and the indexes SQLite cannot
+    create"""
+    if "configuration" in configuration:
+        configuration = configuration["configuration"] or {}
+    metadata_store = (configuration.get("storage_architecture") or {}).get("metadata_store") or {}
+    entities = (metadata_store.get("schema_design") or {}).get("entities") or {}
+    policies = (configuration.get("data_lifecycle") or {}).get("retention_policies") or {}
+    memory_types = (((configuration.get("agent_memory") or {}).get("episodic_memory") or {})
+                    .get("memory_types") or {})
+
+    tables: Dict[str, TableSpec] = {}
+    skipped: List[str] = []
+
+    def add(name: str, definitions: Iterable[str], index_sql: Iterable[str],
+            fts_columns: Tuple[str, ...], retention: Optional[float], retention_column: Optional[str]):
+        columns = tuple(_column(definition) for definition in definitions)
+        names = {column.name for column in columns}
+        indexes = []
+        for statement in index_sql:
+            match = _INDEX_PATTERN.match(statement)
+            if not match or match.group(4):
+                skipped.append(statement)
+                continue
+            unique, index, table, _, indexed = match.groups()
+            indexes.append(f"CREATE {unique or ''}INDEX IF NOT EXISTS {index} ON {table}({indexed.strip()})")
+        if retention is not None and not any(
+                f"({retention_column}" in statement.replace(" ", "") for statement in indexes):
+            indexes.append(f"CREATE INDEX IF NOT EXISTS idx_{name}_retention ON {name}({retention_column})")
+        tables[name] = TableSpec(name, columns, tuple(indexes),
+                                 tuple(column for column in fts_columns if column in names),
+                                 retention, retention_column if retention is not None else None)
+
+    for name, entity in entities.items():
+        policy, column = LIFECYCLE_RETENTION.get(name, (None, None))
+        retention = _retention((policies.get(policy) or {}).get("retention_period")) if policy else None
+        add(name, entity.get("columns") or [], entity.get("indexes") or [],
+            FTS_COLUMNS.get(name, ()), retention, column)
+
+    for memory in memory_types.values():
+        if memory.get("storage") != "postgresql" or not memory.get("table"):
+            continue
+        name = memory["table"]
+        fields = list(dict.fromkeys(["agent_id, timestamp"] + list(memory.get("indexed_fields") or [])))
+        index_sql = [f"CREATE INDEX idx_{name}_{field.split(',')[0]} ON {name}({field})" for field in fields]
+        add(name, MEMORY_COLUMNS, index_sql, MEMORY_FTS_COLUMNS,
+            _retention(memory.get("retention")), "timestamp")
+
+    return tables, skipped
+
+
+class ContextStore:
+    """SQLite context store with FTS5 search, batched writes and retention sweeps"""
+
+    def __init__(self, path: Any, configuration: Dict[str, Any], batch_size: int = DEFAULT_BATCH_SIZE):
+        self.path = str(path)
+        self.batch_size = batch_size
+        self.tables, self.skipped_indexes = load_spec(configuration)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        for pragma in ("journal_mode = WAL", "synchronous = NORMAL", "foreign_keys = ON",
+                       "temp_store = MEMORY", "cache_size = -65536"):
+            self._conn.execute(f"PRAGMA {pragma}")
+        self._create_schema()
+
+    @classmethod
+    def load(cls, path: Any, config_file: Path, batch_size: int = DEFAULT_BATCH_SIZE) -> "ContextStore":
+        """Open (and create) a store following a context store configuration file"""
+        return cls(path, load_yaml(config_file) or {}, batch_size)
+
+    def __enter__(self) -> "ContextStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            for spec in self.tables.values():
+                columns = ", ".join(column.declaration for column in spec.columns)
+                self._conn.execute(f"CREATE TABLE IF NOT EXISTS {spec.name} ({columns})")
+                for statement in spec.indexes:
+                    self._conn.execute(statement)
+                if spec.fts_columns:
+                    self._create_fts(spec)
+
+    def _create_fts(self, spec: TableSpec):
+        # Inserts are indexed per batch by insert(), which is several times faster than
+        # a row trigger; deletes and updates, which sweeps and other clients make, are
+        # kept in sync by triggers
+        fts = f"{spec.name}_fts"
+        columns = ", ".join(spec.fts_columns)
+        new = ", ".join(f"new.{column}" for column in spec.fts_columns)
+        old = ", ".join(f"old.{column}" for column in spec.fts_columns)
+        remove = f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.rowid, {old});"
+        add = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.rowid, {new});"
+        self._conn.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                           f"{columns}, content='{spec.name}', content_rowid='rowid')")
+        self._conn.execute(f"INSERT INTO {fts}({fts}, rank) VALUES ('automerge', ?)", (FTS_AUTOMERGE,))
+        self._conn.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {spec.name} "
+                           f"BEGIN {remove} END")
+        self._conn.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE ON {spec.name} "
+                           f"BEGIN {remove} {add} END")
+
+    def rebuild_search_index(self):
+        """Re-index every full-text table, e.g. after rows were inserted without the store"""
+        with self._lock, self._conn:
+            for spec in self.tables.values():
+                if spec.fts_columns:
+                    self._conn.execute(f"INSERT INTO {spec.name}_fts({spec.name}_fts) VALUES ('rebuild')")
+
+    def optimize(self):
+        """Merge the full-text index segments and refresh the query planner statistics;
+        run after bulk loads and sweeps"""
+        with self._lock, self._conn:
+            for spec in self.tables.values():
+                if spec.fts_columns:
+                    self._conn.execute(f"INSERT INTO {spec.name}_fts({spec.name}_fts) VALUES ('optimize')")
+            self._conn.execute("PRAGMA optimize")
+
+    def _spec(self, table: str) -> TableSpec:
+        try:
+            return self.tables[table]
+        except KeyError:
+            raise KeyError(f"Unknown context store table: {table}") from None
+
+    def _values(self, spec: TableSpec, row: Dict[str, Any], now: float) -> tuple:
+        values = []
+        for column in spec.columns:
+            value = row.get(column.name)
+            if value is None:
+                if column.name == "id":
+                    value = time_ordered_uuid()
+                elif column.kind == "time" and column.name in _CREATED_COLUMNS:
+                    value = now
+                else:
+                    value = column.default
+            elif column.kind == "json" and not isinstance(value, str):
+                value = json.dumps(value, default=str)
+            elif column.kind == "time" and hasattr(value, "timestamp"):
+                value = value.timestamp()
+            values.append(value)
+        return tuple(values)
+
+    def _decode(self, spec: TableSpec, row: sqlite3.Row) -> Dict[str, Any]:
+        data = dict(row)
+        for column in spec.columns:
+            value = data.get(column.name)
+            if value is None:
+                continue
+            if column.kind == "json":
+                data[column.name] = json.loads(value)
+            elif column.kind == "bool":
+                data[column.name] = bool(value)
+        return data
+
+    def _insert_sql(self, spec: TableSpec) -> str:
+        names = ", ".join(column.name for column in spec.columns)
+        return f"INSERT INTO {spec.name} ({names}) VALUES ({', '.join('?' * len(spec.columns))})"
+
+    def insert(self, table: str, rows: Iterable[Dict[str, Any]]) -> List[str]:
+        """Insert rows in one transaction; returns their ids"""
+        spec = self._spec(table)
+        now = time.time()
+        values = [self._values(spec, row, now) for row in rows]
+        with self._lock, self._conn:
+            # New rows get rowids above the current maximum, so they can be indexed at once
+            last = self._conn.execute(f"SELECT MAX(rowid) FROM {table}").fetchone()[0] or 0
+            self._conn.executemany(self._insert_sql(spec), values)
+            if spec.fts_columns:
+                columns = ", ".join(spec.fts_columns)
+                self._conn.execute(f"INSERT INTO {table}_fts(rowid, {columns}) "
+                                   f"SELECT rowid, {columns} FROM {table} WHERE rowid > ?", (last,))
+        return [value[0] for value in values]
+
+    @contextmanager
+    def writer(self, table: str) -> Iterator["BatchWriter"]:
+        """Buffered writer that inserts every ``batch_size`` rows and on exit"""
+        writer = BatchWriter(self, table)
+        try:
+            yield writer
+        finally:
+            writer.flush()
+
+    def get(self, table: str, row_id: str) -> Optional[Dict[str, Any]]:
+        spec = self._spec(table)
+        with self._lock:
+            row = self._conn.execute(f"SELECT * FROM {table} WHERE id = ?", (row_id,)).fetchone()
+        return self._decode(spec, row) if row is not None else None
+
+    def select(self, table: str, where: Optional[Dict[str, Any]] = None,
+               order_by: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rows matching column filters; a (low, high) tuple filters a range inclusively"""
+        spec = self._spec(table)
+        columns = {column.name for column in spec.columns}
+        clauses, parameters = [], []
+        for name, value in (where or {}).items():
+            if name not in columns:
+                raise KeyError(f"Unknown column of {table}: {name}")
+            if isinstance(value, tuple):
+                clauses.append(f"{name} BETWEEN ? AND ?")
+                parameters.extend(value)
+            else:
+                clauses.append(f"{name} = ?")
+                parameters.append(value)
+        sql = f"SELECT * FROM {table}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if order_by:
+            descending = order_by.startswith("-")
+            if order_by.lstrip("-") not in columns:
+                raise KeyError(f"Unknown column of {table}: {order_by.lstrip('-')}")
+            sql += f" ORDER BY {order_by.lstrip('-')}{' DESC' if descending else ''}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._conn.execute(sql, parameters).fetchall()
+        return [self._decode(spec, row) for row in rows]
+
+    def search(self, query: str, tables: Optional[Iterable[str]] = None, limit: int = 20,
+               agent_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Full-text search (FTS5 query syntax) ranked by BM25 across tables; every hit
+        carries its ``table`` and ``rank``. agent_id restricts memory tables to an agent"""
+        names = list(tables) if tables is not None else [name for name, spec in self.tables.items()
+                                                        if spec.fts_columns]
+        hits = []
+        with self._lock:
+            for name in names:
+                spec = self._spec(name)
+                if not spec.fts_columns:
+                    raise KeyError(f"Table {name} has no full-text index")
+                sql = (f"SELECT {name}.*, bm25({name}_fts) AS rank FROM {name}_fts "
+                       f"JOIN {name} ON {name}.rowid = {name}_fts.rowid WHERE {name}_fts MATCH ?")
+                parameters: List[Any] = [query]
+                if agent_id is not None and any(column.name == "agent_id" for column in spec.columns):
+                    sql += f" AND {name}.agent_id = ?"
+                    parameters.append(agent_id)
+                sql += f" ORDER BY rank LIMIT {int(limit)}"
+                for row in self._conn.execute(sql, parameters):
+                    hit = self._decode(spec, row)
+                    hit["table"] = name
+                    hits.append(hit)
+        hits.sort(key=lambda hit: hit["rank"])
+        return hits[:limit]
+
+    def sweep(self, now: Optional[float] = None, batch_size: Optional[int] = None) -> Dict[str, int]:
+        """Delete rows past their table's retention; returns deleted rows per table"""
+        now = time.time() if now is None else now
+        batch_size = batch_size or self.batch_size * 10
+        deleted = {}
+        for spec in self.tables.values():
+            if spec.retention is None:
+                continue
+            cutoff = now - spec.retention
+            sql = (f"DELETE FROM {spec.name} WHERE rowid IN (SELECT rowid FROM {spec.name} "
+                   f"WHERE {spec.retention_column} < ? LIMIT ?)")
+            total = 0
+            while True:
+                with self._lock, self._conn:
+                    count = self._conn.execute(sql, (cutoff, batch_size)).rowcount
+                total += count
+                if count < batch_size:
+                    break
+            deleted[spec.name] = total
+        return deleted
+
+    def counts(self) -> Dict[str, int]:
+        """Rows per table"""
+        with self._lock:
+            return {name: self._conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+                    for name in self.tables}
+
+
+class BatchWriter:
+    """Row buffer of one table, flushed in batches of the store's ``batch_size``"""
+
+    def __init__(self, store: ContextStore, table: str):
+        self.store = store
+        self.table = table
+        self.written = 0
+        self._rows: List[Dict[str, Any]] = []
+
+    def add(self, row: Dict[str, Any]):
+        self._rows.append(row)
+        if len(self._rows) >= self.store.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._rows:
+            self.store.insert(self.table, self._rows)
+            self.written += len(self._rows)
+            self._rows = []
@@ -0,0 +1,119 @@
+"""
+HUGAI Configuration Documents
+
+The single YAML loader of the configuration tools and a per-process document cache.
+Documents are keyed by resolved path and revalidated by (mtime_ns, size), so a file
+read for change detection is not read again for validation, and a document parsed
+for validation is not parsed again for rendering. Parsing uses the libyaml-backed
+CSafeLoader when PyYAML was built with it.
+
+Parsed data is shared between callers and must be treated as read-only.
+
+Example:
+    document = DOCUMENTS.load(Path("config/agents/router-agent.yaml"))
+    print(document.digest, document.data["metadata"]["name"])
+"""
+
+import hashlib
+import io
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+# Fastest safe loader available in this PyYAML build
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_UNPARSED = object()
+
+
+def parse_yaml(source) -> Any:
+    """Parse YAML text or bytes with the fastest safe loader"""
+    return yaml.load(source, Loader=YAML_LOADER)
+
+
+class Document:
+    """Source bytes of a configuration file, parsed on first access"""
+
+    __slots__ = ("path", "source", "digest", "stat", "_data", "_lock")
+
+    def __init__(self, path: Path, source: bytes, stat: Tuple[int, int]):
+        self.path = path
+        self.source = source
+        self.digest = hashlib.sha256(source).hexdigest()
+        self.stat = stat
+        self._data = _UNPARSED
+        self._lock = threading.Lock()
+
+    @property
+    def parsed(self) -> bool:
+        return self._data is not _UNPARSED
+
+    @property
+    def data(self) -> Any:
+        """Parsed YAML content; parse errors are raised on every access"""
+        if self._data is _UNPARSED:
+            with self._lock:
+                if self._data is _UNPARSED:
+                    # Parse from a named stream so errors report the file path
+                    stream = io.BytesIO(self.source)
+                    stream.name = str(self.path)
+                    self._data = parse_yaml(stream)
+        return self._data
+
+
+class DocumentCache:
+    """Per-process cache of configuration documents"""
+
+    def __init__(self):
+        self._documents: Dict[str, Document] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: Path) -> Document:
+        """Return the document at path, re-reading it only when the file changed"""
+        path = Path(path)
+        key = os.path.realpath(path)
+        stat_result = os.stat(key)
+        stat = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        with self._lock:
+            cached = self._documents.get(key)
+        if cached is not None and cached.stat == stat:
+            return cached
+
+        with open(key, 'rb') as f:
+            source = f.read()
+        document = Document(path, source, stat)
+
+        # Keep the parsed tree when only the timestamp changed
+        if cached is not None and cached.digest == document.digest:
+            cached.stat = stat
+            return cached
+
+        with self._lock:
+            self._documents[key] = document
+        return document
+
+    def get(self, path: Path) -> Optional[Document]:
+        """Return the cached document at path without touching the filesystem"""
+        with self._lock:
+            return self._documents.get(os.path.realpath(path))
+
+    def invalidate(self, path: Path):
+        with self._lock:
+            self._documents.pop(os.path.realpath(path), None)
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+
+# Shared by every tool running in this process
+DOCUMENTS = DocumentCache()
+
+
+def load_yaml(path: Path) -> Any:
+    """Load a YAML file through the shared document cache"""
+    return DOCUMENTS.load(path).data
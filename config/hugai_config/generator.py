@@ -0,0 +1,191 @@
+"""
+HUGAI Configuration Generator Library
+
+Embeddable configuration generation: render a template, parse the result and validate
+it against the compiled schema of its type, all in memory. Nothing is printed and the
+process is never exited; failures raise GenerationError subclasses. Templates are read
+from a templates directory, from an in-memory mapping, or both (in-memory templates win),
+and a ConfigBuilder is safe to share between threads rendering concurrently.
+
+Needs Jinja2, so it is imported as hugai_config.generator rather than re-exported by
+the package.
+
+Example:
+    builder = ConfigBuilder("config/templates", schemas_dir="config/schemas")
+    try:
+        config = builder.build("tool", "billing-search", {"description": "...", ...})
+    except ConfigValidationError as e:
+        reject(e.path, e.message)
+    else:
+        store(config.content, config.data)
+"""
+
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+import yaml
+from jinja2 import ChoiceLoader, DictLoader, Environment, FileSystemLoader, TemplateNotFound, Undefined
+from jsonschema import ValidationError
+
+from .documents import parse_yaml
+from .schemas import SchemaRegistry, get_schema_registry
+from .templates import TEMPLATE_BYTECODE_CACHE
+
+
+class GenerationError(Exception):
+    """Base class of configuration generation errors"""
+
+
+class TemplateNotFoundError(GenerationError):
+    """The template, or the templates directory, does not exist"""
+
+
+class RenderError(GenerationError):
+    """The template failed to render with the given parameters"""
+
+
+class ConfigParseError(GenerationError):
+    """The rendered configuration is not valid YAML"""
+
+
+class ConfigValidationError(GenerationError):
+    """The rendered configuration does not match the schema of its type"""
+
+    def __init__(self, error: ValidationError):
+        self.path = error.json_path
+        self.message = error.message
+        super().__init__(f"Schema validation error at {self.path}: {self.message}")
+
+
+class ConfigExistsError(GenerationError):
+    """The output file exists and replacing it was not requested"""
+
+
+class GeneratedConfig(NamedTuple):
+    """A rendered, parsed and validated configuration"""
+
+    config_type: str
+    name: str
+    content: str
+    data: Any
+
+
+def to_yaml(value: Any) -> str:
+    """Jinja filter converting a value to YAML; collections use flow style, since
+    templates use the filter inline after a mapping key"""
+    if value is None or isinstance(value, Undefined):
+        return ""
+    if isinstance(value, (dict, list)):
+        return yaml.safe_dump(value, default_flow_style=True, sort_keys=False, width=2 ** 31).strip()
+    return yaml.dump(value, default_flow_style=False, sort_keys=False).strip()
+
+
+def current_date(value: Any = None) -> str:
+    """Jinja filter returning the current date in YYYY-MM-DD format"""
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+class ConfigBuilder:
+    """Renders and validates configurations from templates on a shared Jinja environment"""
+
+    def __init__(self, templates_dir: Optional[str] = None, templates: Optional[Dict[str, str]] = None,
+                 schemas_dir: Optional[str] = "config/schemas"):
+        loaders = []
+        self._templates: Dict[str, str] = dict(templates or {})
+        self._lock = threading.Lock()
+        loaders.append(DictLoader(self._templates))
+
+        self.templates_dir = Path(templates_dir) if templates_dir else None
+        if self.templates_dir is not None:
+            if not self.templates_dir.is_dir():
+                raise TemplateNotFoundError(f"Templates directory not found: {self.templates_dir}")
+            loaders.append(FileSystemLoader(str(self.templates_dir)))
+
+        self.env = Environment(
+            loader=ChoiceLoader(loaders),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            bytecode_cache=TEMPLATE_BYTECODE_CACHE
+        )
+        self.env.filters['to_yaml'] = to_yaml
+        self.env.filters['current_date'] = current_date
+
+        self.schema_registry: Optional[SchemaRegistry] = (
+            get_schema_registry(Path(schemas_dir)) if schemas_dir else None
+        )
+
+    def add_template(self, name: str, source: str):
+        """Register or replace an in-memory template; includes may refer to it by name"""
+        with self._lock:
+            self._templates[name] = source
+
+    def get_template(self, template_name: str):
+        """Return a compiled template, compiling it on first use"""
+        try:
+            return self.env.get_template(template_name)
+        except TemplateNotFound as e:
+            raise TemplateNotFoundError(f"Template not found: {e.name}") from e
+        except Exception as e:
+            raise RenderError(f"Error loading template {template_name}: {e}") from e
+
+    def render(self, config_type: str, name: str, parameters: Optional[Dict[str, Any]] = None,
+               template_name: Optional[str] = None) -> str:
+        """Render a configuration and return its YAML text"""
+        template = self.get_template(template_name or f"{config_type}-template.yaml")
+
+        # User parameters override the defaults
+        render_params = {
+            'name': name,
+            'current_date': current_date(),
+            'component_type': config_type,
+            **(parameters or {})
+        }
+
+        try:
+            return template.render(**render_params)
+        except TemplateNotFound as e:
+            raise TemplateNotFoundError(f"Template not found: {e.name}") from e
+        except Exception as e:
+            raise RenderError(f"Error rendering template: {e}") from e
+
+    def validate(self, config_type: str, content: str) -> Any:
+        """Parse rendered YAML and validate it against the schema of its type"""
+        try:
+            data = parse_yaml(content)
+        except yaml.YAMLError as e:
+            raise ConfigParseError(f"Rendered configuration is not valid YAML: {e}") from e
+
+        if self.schema_registry is not None:
+            try:
+                self.schema_registry.check(data, config_type)
+            except ValidationError as e:
+                raise ConfigValidationError(e) from e
+        return data
+
+    def build(self, config_type: str, name: str, parameters: Optional[Dict[str, Any]] = None,
+              template_name: Optional[str] = None) -> GeneratedConfig:
+        """Render, parse and validate a configuration in memory"""
+        content = self.render(config_type, name, parameters, template_name)
+        data = self.validate(config_type, content)
+        return GeneratedConfig(config_type, name, content, data)
+
+    def write(self, config: GeneratedConfig, output_file: Path, force: bool = False) -> Path:
+        """Atomically write a built configuration; refuses to replace a file unless forced"""
+        output_file = Path(output_file)
+        if output_file.exists() and not force:
+            raise ConfigExistsError(f"Configuration already exists: {output_file}")
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = output_file.with_name(f".{output_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(config.content)
+            os.replace(temp_path, output_file)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        return output_file
+
@@ -0,0 +1,407 @@
+"""
+HUGAI Configuration Object Model
+
+Compact typed objects for long-lived consumers of the configuration set. Classes are
+generated from the JSON schemas at runtime: every schema object with declared
+properties becomes a ``__slots__`` class with one slot per property (dashes become
+underscores), so instances carry no per-object ``__dict__``. Keys a schema does not
+declare are kept in a small side mapping and are reachable the same way.
+
+Large sections are not parsed when a file is loaded. The source is split at the keys
+of its block mappings; sections larger than ``LAZY_THRESHOLD`` bytes (such as
+``configuration.model_customization`` in llms/model-llm.yaml, or a long ``examples``
+section) are kept as source text and parsed on first access, then cached, so a syntax
+error in such a section is raised when it is accessed. Files that are not plain block
+mappings, and files using anchors, aliases or merge keys (an alias may refer to an
+anchor in another section), are parsed whole. Mapping keys and short enum-like values are interned,
+so names repeated across the configuration set are stored once. Models pickle as their
+schema and plain data, and the class is regenerated when they are unpickled.
+
+Example:
+    models = ConfigModels(Path("config/schemas"))
+    llm = models.load(Path("config/llms/model-llm.yaml"))
+    print(llm.metadata.name)                      # parsed when the file was loaded
+    rules = llm.configuration.model_customization  # parsed now
+    plain = llm.to_dict()                         # same data as load_yaml()
+"""
+
+import json
+import keyword
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .config_types import TYPE_DIRECTORIES, detect_config_type
+from .documents import parse_yaml
+from .schemas import SchemaRegistry, get_schema_registry
+
+# Sections with more source text than this are parsed on first access
+LAZY_THRESHOLD = 1024
+
+# Mapping keys are always interned; values only when they are short identifier-like
+# words (enum values such as "high" or "enabled"), since interning every unique
+# description or prompt costs more intern-table space than it saves
+INTERN_MAX_LENGTH = 16
+
+# Plain keys that YAML 1.1 resolves to booleans or null; their sections are never deferred
+_NON_STRING_KEYS = {"y", "n", "yes", "no", "on", "off", "true", "false", "null"}
+
+_KEY_LINE = re.compile(r"([A-Za-z_][\w-]*)[ \t]*:(?:[ \t]|$)")
+_QUOTED_KEY_LINE = re.compile(r"""(?:"[^"]*"|'[^']*')[ \t]*:(?:[ \t]|$)""")
+
+# Anchors and aliases in node position, and merge keys; matches inside text only cost laziness
+_ANCHOR_OR_ALIAS = re.compile(
+    r"(?:(?:^|[:,\[{-])[ \t]+|[\[{,])[&*][\w.\-]+(?=[\s,\]}]|$)|^[ \t]*<<[ \t]*:", re.MULTILINE
+)
+
+# Guards the parse-once of deferred sections; shared, since it is rarely contended
+_MATERIALIZE_LOCK = threading.Lock()
+
+# Classes regenerated when unpickling, keyed by class name and schema
+_REBUILT_CLASSES: Dict[Tuple[str, str], type] = {}
+
+
+def _intern_key(key: Any) -> Any:
+    return sys.intern(key) if isinstance(key, str) else key
+
+
+def intern_value(value: Any) -> Any:
+    """Copy parsed YAML with mapping keys and short enum-like strings interned"""
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) <= INTERN_MAX_LENGTH and value.isidentifier() else value
+    if isinstance(value, dict):
+        return {_intern_key(key): intern_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [intern_value(item) for item in value]
+    return value
+
+
+def split_mapping(lines: List[str], indent: int) -> Optional[List[Tuple[Optional[str], str]]]:
+    """Split the lines of a block mapping at its keys.
+
+    Returns (key, text) pairs, where key is None for keys that are only known after
+    parsing (quoted keys, and keys YAML does not read as strings). Returns None when
+    the lines are not a block mapping at ``indent``.
+    """
+    chunks: List[Tuple[Optional[str], List[str]]] = []
+    for line in lines:
+        stripped = line.lstrip(" ")
+        if not stripped.strip() or stripped.startswith("#"):
+            if chunks:
+                chunks[-1][1].append(line)
+            continue
+
+        current = len(line) - len(stripped)
+        if current > indent:
+            if not chunks:
+                return None
+            chunks[-1][1].append(line)
+            continue
+        if current < indent or stripped.startswith(("---", "...", "%")):
+            return None
+
+        match = _KEY_LINE.match(stripped)
+        if match:
+            key = match.group(1)
+            chunks.append((None if key.lower() in _NON_STRING_KEYS else key, [line]))
+        elif _QUOTED_KEY_LINE.match(stripped):
+            chunks.append((None, [line]))
+        else:
+            return None
+
+    return [(key, "".join(chunk)) for key, chunk in chunks]
+
+
+def _section_lines(text: str) -> Optional[Tuple[List[str], int]]:
+    """Body lines and indentation of a "key:" section whose value is a block mapping"""
+    header, _, body = text.partition("\n")
+    if not re.search(r":[ \t]*(#.*)?$", header):
+        return None
+    lines = body.splitlines(keepends=True)
+    for line in lines:
+        stripped = line.lstrip(" ")
+        if stripped.strip() and not stripped.startswith("#"):
+            if stripped.startswith("- "):
+                return None
+            return lines, len(line) - len(stripped)
+    return None
+
+
+def _parse_section(text: str) -> Dict[Any, Any]:
+    data = parse_yaml(text)
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a mapping section, got: {text[:40]!r}")
+    return data
+
+
+class ConfigModel:
+    """Base of the generated configuration classes"""
+
+    __slots__ = ("_extra", "_pending")
+
+    # Set on generated classes: the schema they were generated from, declared
+    # (attribute, key) pairs, the mappings between keys and attributes, and
+    # key -> class or converter for values with their own class
+    _schema: Dict[str, Any] = {}
+    _fields: Tuple[Tuple[str, str], ...] = ()
+    _attributes: Dict[str, str] = {}
+    _keys: Dict[str, str] = {}
+    _converters: Dict[str, Callable[[Any], Any]] = {}
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict[Any, Any]) -> "ConfigModel":
+        """Build an instance from parsed YAML"""
+        instance = cls.__new__(cls)
+        instance._extra = None
+        instance._pending = None
+        for key, value in mapping.items():
+            instance._store(key, value)
+        return instance
+
+    @classmethod
+    def from_source(cls, lines: List[str], indent: int = 0) -> "ConfigModel":
+        """Build an instance from the source lines of a block mapping, deferring large sections"""
+        source = "".join(lines)
+        chunks = None if _ANCHOR_OR_ALIAS.search(source) else split_mapping(lines, indent)
+        if chunks is None:
+            return cls.from_mapping(_parse_section(source) if lines else {})
+
+        instance = cls.__new__(cls)
+        instance._extra = None
+        instance._pending = None
+        for key, text in chunks:
+            if key is None or len(text) <= LAZY_THRESHOLD:
+                for parsed_key, value in _parse_section(text).items():
+                    instance._store(parsed_key, value)
+                continue
+
+            converter = cls._converters.get(key)
+            section = _section_lines(text)
+            if isinstance(converter, type) and section is not None:
+                # A section with its own class: split it again, one level down
+                instance._store(key, converter.from_source(*section), converted=True)
+            else:
+                if instance._pending is None:
+                    instance._pending = {}
+                instance._pending[sys.intern(key)] = text
+        return instance
+
+    def _store(self, key: Any, value: Any, converted: bool = False):
+        if not converted:
+            converter = self._converters.get(key)
+            if isinstance(converter, type):
+                # Values that break the schema are kept as plain data
+                value = converter.from_mapping(value) if isinstance(value, dict) else intern_value(value)
+            elif converter is not None:
+                value = converter(value)
+            else:
+                value = intern_value(value)
+
+        attribute = self._attributes.get(key)
+        if attribute is not None:
+            setattr(self, attribute, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[_intern_key(key)] = value
+
+    def _materialize(self, key: str) -> Any:
+        with _MATERIALIZE_LOCK:
+            pending = self._pending
+            if pending and key in pending:
+                for parsed_key, value in _parse_section(pending[key]).items():
+                    self._store(parsed_key, value)
+                del pending[key]
+                if not pending:
+                    self._pending = None
+        return self._lookup(key)
+
+    def _lookup(self, key: Any) -> Any:
+        attribute = self._attributes.get(key)
+        if attribute is not None:
+            try:
+                return object.__getattribute__(self, attribute)
+            except AttributeError:
+                pass
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __getattr__(self, attribute: str) -> Any:
+        # Only reached for unset slots and undeclared names
+        if attribute.startswith("__"):
+            raise AttributeError(attribute)
+        key = self._keys.get(attribute, attribute)
+        if self._pending and key in self._pending:
+            return self._materialize(key)
+        if key in self._attributes:
+            return None
+        try:
+            return self._lookup(key)
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} has no attribute {attribute!r}") from None
+
+    def __getitem__(self, key: Any) -> Any:
+        if self._pending and key in self._pending:
+            return self._materialize(key)
+        return self._lookup(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.keys()
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.keys())
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[Any]:
+        """Keys present in the source, parsed or not"""
+        present = []
+        for attribute, key in self._fields:
+            try:
+                object.__getattribute__(self, attribute)
+                present.append(key)
+            except AttributeError:
+                pass
+        present.extend(self._extra or ())
+        present.extend(self._pending or ())
+        return present
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        for key in self.keys():
+            yield key, self[key]
+
+    def unloaded_keys(self) -> List[str]:
+        """Keys of sections that have not been parsed yet"""
+        return list(self._pending or ())
+
+    def to_dict(self) -> Dict[Any, Any]:
+        """Plain data, as load_yaml would return it; parses every deferred section"""
+        return {key: _to_plain(value) for key, value in self.items()}
+
+    def __reduce__(self):
+        # Generated classes are not module attributes, so pickle the schema and the data
+        return _rebuild_model, (type(self).__name__, self._schema, self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {', '.join(map(str, self.keys()))}>"
+
+
+def _rebuild_model(name: str, schema: Dict[str, Any], data: Dict[Any, Any]) -> ConfigModel:
+    """Unpickle a model: regenerate its class from the schema once, then wrap the data"""
+    key = (name, json.dumps(schema, sort_keys=True, default=str))
+    cls = _REBUILT_CLASSES.get(key)
+    if cls is None:
+        cls = _REBUILT_CLASSES.setdefault(key, build_model_class(name, schema))
+    return cls.from_mapping(data)
+
+
+def _to_plain(value: Any) -> Any:
+    if isinstance(value, ConfigModel):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+def _class_name(part: str) -> str:
+    return "".join(word.capitalize() for word in re.split(r"[^A-Za-z0-9]+", part) if word)
+
+
+def _attribute_name(key: str) -> str:
+    name = re.sub(r"\W", "_", key)
+    if not name or name[0].isdigit():
+        name = f"_{name}"
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def build_model_class(name: str, schema: Dict[str, Any]) -> type:
+    """Generate a ConfigModel subclass for an object schema, and classes for its
+    object-valued properties"""
+    properties = schema.get("properties") or {}
+    fields = tuple((_attribute_name(key), key) for key in properties)
+
+    converters: Dict[str, Callable[[Any], Any]] = {}
+    for key, node in properties.items():
+        converter = _converter(f"{name}{_class_name(key)}", node)
+        if converter is not None:
+            converters[key] = converter
+
+    namespace = {
+        "__slots__": tuple(attribute for attribute, _ in fields),
+        "__doc__": schema.get("description") or f"Generated from the {name} schema",
+        "__module__": __name__,
+        "_schema": schema,
+        "_fields": fields,
+        "_attributes": {key: attribute for attribute, key in fields},
+        "_keys": {attribute: key for attribute, key in fields},
+        "_converters": converters
+    }
+    return type(name, (ConfigModel,), namespace)
+
+
+def _converter(name: str, node: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """The class, or list converter, for values of a schema node; None for plain values"""
+    if node.get("type") == "object" and node.get("properties"):
+        return build_model_class(name, node)
+    items = node.get("items") or {}
+    if node.get("type") == "array" and items.get("type") == "object" and items.get("properties"):
+        item_class = build_model_class(f"{name}Item", items)
+
+        def convert_items(value: Any) -> Any:
+            if not isinstance(value, list):
+                return intern_value(value)
+            return [item_class.from_mapping(item) if isinstance(item, dict) else intern_value(item)
+                    for item in value]
+        return convert_items
+    return None
+
+
+class ConfigModels:
+    """Generated model classes of a schemas directory, and loaders using them"""
+
+    def __init__(self, schemas_dir: Path = Path("config/schemas"),
+                 schema_registry: Optional[SchemaRegistry] = None):
+        self.schema_registry = schema_registry or get_schema_registry(Path(schemas_dir))
+        self._classes: Dict[str, type] = {}
+        self._lock = threading.Lock()
+
+    def model_class(self, config_type: Optional[str]) -> type:
+        """The generated class of a configuration type; types without a schema get an
+        empty class, so all their keys are reachable but none is declared"""
+        key = config_type or ""
+        with self._lock:
+            cls = self._classes.get(key)
+        if cls is not None:
+            return cls
+
+        schema = (self.schema_registry.get(config_type) if config_type else None) or {}
+        cls = build_model_class(f"{_class_name(config_type or 'generic')}Config", schema)
+        with self._lock:
+            return self._classes.setdefault(key, cls)
+
+    def load(self, path: Path, config_type: Optional[str] = None) -> ConfigModel:
+        """Load a configuration file, deferring its large sections"""
+        path = Path(path)
+        source = path.read_text(encoding="utf-8")
+        cls = self.model_class(config_type or detect_config_type(path))
+        return cls.from_source(source.splitlines(keepends=True))
+
+    def from_mapping(self, config_type: Optional[str], data: Dict[Any, Any]) -> ConfigModel:
+        """Wrap already parsed configuration data"""
+        return self.model_class(config_type).from_mapping(data)
+
+    def load_directory(self, config_dir: Path) -> Dict[str, ConfigModel]:
+        """Load every configuration of a configuration directory, keyed by file stem"""
+        config_dir = Path(config_dir)
+        models: Dict[str, ConfigModel] = {}
+        for config_type, directory in TYPE_DIRECTORIES.items():
+            for path in sorted((config_dir / directory).glob("*.yaml")):
+                models[path.stem] = self.load(path, config_type)
+        return models
@@ -0,0 +1,316 @@
+"""
+HUGAI Execution Planner
+
+Turns dependency graphs from the configurations into execution schedules. Tasks are
+grouped into maximal parallel waves (every task runs in the wave after its last
+dependency), the critical path is the longest chain of timeouts, and the makespan is
+estimated twice: with waves run as barriers, and with a critical-path-first list
+scheduler on a bounded number of workers. Tasks in a dependency cycle, and every task
+depending on one, cannot be scheduled; they are reported as blocked.
+
+Durations are the configured ``timeout`` values, so the makespan is an upper bound
+rather than an expected run time.
+
+Example:
+    durations, dependencies = workflow_tasks(definition, default_timeout=7200)
+    plan = plan_execution(durations, dependencies, parallelism=32)
+    print(plan.waves, plan.critical_path, format_duration(plan.makespan))
+"""
+
+import heapq
+import re
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+from .catalog import strongly_connected_components
+from .documents import load_yaml
+
+# Seconds per duration unit, for values like "30m", "48h", "1.5d", "5min", "30 minutes"
+# or "2_years"; months are 30 days and years 365
+DURATION_UNITS = {
+    "ms": 0.001,
+    "s": 1, "sec": 1, "second": 1,
+    "m": 60, "min": 60, "minute": 60,
+    "h": 3600, "hr": 3600, "hour": 3600,
+    "d": 86400, "day": 86400,
+    "w": 604800, "week": 604800,
+    "month": 2592000,
+    "y": 31536000, "yr": 31536000, "year": 31536000
+}
+
+_DURATION_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*[_ ]?\s*([a-z]*)\s*$")
+
+
+def parse_duration(value: Any) -> float:
+    """Parse a duration into seconds; bare numbers are seconds"""
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid duration: {value!r}")
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _DURATION_PATTERN.match(str(value).lower())
+    unit = (match.group(2) or "s") if match else ""
+    if unit not in DURATION_UNITS and unit.endswith("s"):
+        unit = unit[:-1]
+    if unit not in DURATION_UNITS:
+        raise ValueError(f"Invalid duration: {value!r}")
+    return float(match.group(1)) * DURATION_UNITS[unit]
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds compactly, like "2d 3h" or "45m" """
+    if seconds < 60:
+        return f"{seconds:g}s"
+    parts = []
+    remaining = int(round(seconds))
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60), ("s", 1)):
+        if remaining >= size:
+            parts.append(f"{remaining // size}{unit}")
+            remaining %= size
+    return " ".join(parts[:2])
+
+
+def find_timeout(config: Any) -> Optional[float]:
+    """The shallowest parseable ``timeout`` value in a configuration, in seconds"""
+    queue = deque([config])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            if "timeout" in node and not isinstance(node["timeout"], (dict, list)):
+                try:
+                    return parse_duration(node["timeout"])
+                except ValueError:
+                    pass
+            queue.extend(node.values())
+        elif isinstance(node, list):
+            queue.extend(node)
+    return None
+
+
+class ExecutionPlan(NamedTuple):
+    """Schedule of a dependency graph; durations are in seconds"""
+
+    waves: List[List[str]]
+    critical_path: List[str]
+    critical_path_length: float
+    wave_makespan: float
+    makespan: float
+    parallelism: Optional[int]
+    peak_parallelism: int
+    earliest_start: Dict[str, float]
+    slack: Dict[str, float]
+    cycles: List[List[str]]
+    blocked: List[str]
+
+
+def plan_execution(durations: Dict[str, float], dependencies: Dict[str, List[str]],
+                   parallelism: Optional[int] = None) -> ExecutionPlan:
+    """Plan tasks with the given durations; dependencies on unknown tasks are ignored.
+
+    ``parallelism`` bounds the number of tasks running at once; None means unbounded,
+    in which case the makespan equals the critical path length.
+    """
+    if parallelism is not None and parallelism < 1:
+        raise ValueError(f"Parallelism must be at least 1, got {parallelism}")
+    tasks = sorted(durations)
+    adjacency = {
+        task: sorted({dependency for dependency in dependencies.get(task) or [] if dependency in durations})
+        for task in tasks
+    }
+    components = strongly_connected_components(adjacency)
+    cycles = [
+        component for component in components
+        if len(component) > 1 or component[0] in adjacency[component[0]]
+    ]
+
+    # Components come dependencies first, so one pass settles blocking, waves and start times
+    blocked = {task for cycle in cycles for task in cycle}
+    order: List[str] = []
+    level: Dict[str, int] = {}
+    earliest_start: Dict[str, float] = {}
+    earliest_finish: Dict[str, float] = {}
+    for component in components:
+        for task in component:
+            if task in blocked or any(dependency in blocked for dependency in adjacency[task]):
+                blocked.add(task)
+                continue
+            level[task] = 1 + max((level[dependency] for dependency in adjacency[task]), default=-1)
+            earliest_start[task] = max((earliest_finish[dependency] for dependency in adjacency[task]), default=0.0)
+            earliest_finish[task] = earliest_start[task] + durations[task]
+            order.append(task)
+
+    waves: List[List[str]] = [[] for _ in range(max(level.values(), default=-1) + 1)]
+    for task in order:
+        waves[level[task]].append(task)
+    for wave in waves:
+        wave.sort()
+
+    critical_path: List[str] = []
+    critical_path_length = max(earliest_finish.values(), default=0.0)
+    if order:
+        task = max(order, key=lambda name: (earliest_finish[name], name))
+        while task is not None:
+            critical_path.append(task)
+            task = max(adjacency[task], key=lambda name: (earliest_finish[name], name), default=None)
+        critical_path.reverse()
+
+    dependents: Dict[str, List[str]] = {task: [] for task in order}
+    for task in order:
+        for dependency in adjacency[task]:
+            dependents[dependency].append(task)
+
+    # Latest finish without delaying the critical path, and the longest chain from each task
+    latest_finish: Dict[str, float] = {}
+    remaining: Dict[str, float] = {}
+    for task in reversed(order):
+        latest_finish[task] = min(
+            (latest_finish[dependent] - durations[dependent] for dependent in dependents[task]),
+            default=critical_path_length
+        )
+        remaining[task] = durations[task] + max((remaining[dependent] for dependent in dependents[task]), default=0.0)
+    slack = {task: latest_finish[task] - earliest_finish[task] for task in order}
+
+    return ExecutionPlan(
+        waves=waves,
+        critical_path=critical_path,
+        critical_path_length=critical_path_length,
+        wave_makespan=_wave_makespan(waves, durations, parallelism),
+        makespan=_list_schedule(order, adjacency, dependents, durations, remaining, parallelism),
+        parallelism=parallelism,
+        peak_parallelism=max((len(wave) for wave in waves), default=0),
+        earliest_start=earliest_start,
+        slack=slack,
+        cycles=cycles,
+        blocked=sorted(blocked)
+    )
+
+
+def _wave_makespan(waves: List[List[str]], durations: Dict[str, float], parallelism: Optional[int]) -> float:
+    """Makespan when each wave waits for the previous one; waves wider than the
+    parallelism run in batches, longest tasks first"""
+    total = 0.0
+    for wave in waves:
+        times = sorted((durations[task] for task in wave), reverse=True)
+        step = parallelism or len(times) or 1
+        total += sum(times[start] for start in range(0, len(times), step))
+    return total
+
+
+def _list_schedule(order: List[str], adjacency: Dict[str, List[str]], dependents: Dict[str, List[str]],
+                   durations: Dict[str, float], remaining: Dict[str, float],
+                   parallelism: Optional[int]) -> float:
+    """Makespan of a list schedule on ``parallelism`` workers that starts ready tasks
+    with the longest remaining chain first"""
+    waiting = {task: len(adjacency[task]) for task in order}
+    ready = [(-remaining[task], task) for task in order if not waiting[task]]
+    heapq.heapify(ready)
+    running: List[Tuple[float, str]] = []
+    now = 0.0
+
+    while ready or running:
+        while ready and (parallelism is None or len(running) < parallelism):
+            _, task = heapq.heappop(ready)
+            heapq.heappush(running, (now + durations[task], task))
+        now, task = heapq.heappop(running)
+        for dependent in dependents[task]:
+            waiting[dependent] -= 1
+            if not waiting[dependent]:
+                heapq.heappush(ready, (-remaining[dependent], dependent))
+    return now
+
+
+def workflow_tasks(definition: Dict[str, Any],
+                   default_timeout: Optional[float] = None) -> Tuple[Dict[str, float], Dict[str, List[str]]]:
+    """Durations and dependencies of the tasks of a staged workflow definition.
+
+    A stage's ``depends_on`` lists stage ids; its tasks then depend on every task of
+    those stages. Tasks without a ``timeout`` use the longest of their test suite
+    timeouts, or the workflow's ``task_timeout``, or ``default_timeout``.
+    """
+    if default_timeout is None:
+        default_timeout = parse_duration(definition.get("task_timeout", 0))
+
+    stages = definition.get("stages") or {}
+    stage_tasks: Dict[str, List[str]] = {}
+    durations: Dict[str, float] = {}
+    dependencies: Dict[str, List[str]] = {}
+
+    for stage_key, stage in stages.items():
+        stage_id = stage.get("stage_id", stage_key)
+        for task_key, task in (stage.get("tasks") or {}).items():
+            task_id = task.get("task_id", task_key)
+            stage_tasks.setdefault(stage_id, []).append(task_id)
+            durations[task_id] = _task_duration(task, default_timeout)
+            dependencies[task_id] = list(task.get("depends_on") or [])
+
+    for stage_key, stage in stages.items():
+        upstream = [
+            task_id
+            for stage_id in stage.get("depends_on") or []
+            for task_id in stage_tasks.get(stage_id, [])
+        ]
+        for task_id in stage_tasks.get(stage.get("stage_id", stage_key), []):
+            dependencies[task_id].extend(upstream)
+
+    return durations, dependencies
+
+
+def _task_duration(task: Dict[str, Any], default_timeout: float) -> float:
+    if "timeout" in task:
+        return parse_duration(task["timeout"])
+    suites = [suite.get("timeout") for suite in (task.get("test_suites") or {}).values()
+              if isinstance(suite, dict) and suite.get("timeout")]
+    if suites:
+        timeouts = [parse_duration(timeout) for timeout in suites]
+        # Suites of a parallel strategy overlap; otherwise they run back to back
+        return max(timeouts) if str(task.get("execution_strategy", "")).startswith("parallel") else sum(timeouts)
+    return default_timeout
+
+
+def find_workflows(config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Staged workflow definitions of an orchestrator configuration, keyed by name"""
+    definitions = (config.get("configuration") or {}).get("workflow_definitions") or {}
+    return {
+        definition.get("name", key): definition
+        for key, definition in definitions.items()
+        if isinstance(definition, dict) and "stages" in definition
+    }
+
+
+def find_parallelism(config: Any) -> Optional[int]:
+    """The shallowest ``parallelism`` setting of an orchestrator configuration"""
+    queue = deque([config])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            if isinstance(node.get("parallelism"), int):
+                return node["parallelism"]
+            queue.extend(node.values())
+        elif isinstance(node, list):
+            queue.extend(node)
+    return None
+
+
+def catalog_tasks(graph, root_dir: Path, config_type: Optional[str],
+                  default_timeout: float) -> Tuple[Dict[str, float], Dict[str, List[str]]]:
+    """Durations and dependencies of catalog configurations of a type.
+
+    ``graph`` is a CatalogGraph; only dependencies within the selected configurations
+    are kept. Durations are each configuration's own ``timeout``, or ``default_timeout``.
+    """
+    selected = set(graph.select(config_type))
+    durations: Dict[str, float] = {}
+    for name in sorted(selected):
+        path = Path(root_dir) / graph.entries[name]["file"]
+        try:
+            timeout = find_timeout(load_yaml(path))
+        except (OSError, yaml.YAMLError):
+            timeout = None
+        durations[name] = timeout if timeout is not None else default_timeout
+    dependencies = {
+        name: [dependency for dependency in graph.adjacency[name] if dependency in selected]
+        for name in selected
+    }
+    return durations, dependencies
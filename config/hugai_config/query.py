@@ -0,0 +1,162 @@
+"""
+HUGAI Catalog Queries
+
+In-memory dependency graph over the config/index.yaml catalog. Every node is assigned
+a bit; direct and transitive dependencies, direct and transitive dependents, and the
+members of each configuration type are held as integer bitsets, so reverse-dependency
+and impact queries are a lookup plus an AND, and type filters compose with them.
+Shortest paths are found by breadth-first search over the direct dependencies.
+
+Edges point from a configuration to what it depends on. The "impact" of a change to a
+configuration is the set of configurations that transitively depend on it.
+
+Example:
+    graph = CatalogGraph.load(Path("config/index.yaml"))
+    graph.dependents("security-agent", transitive=True, config_type="agent")
+    graph.impact("workflow-orchestrator")
+    graph.shortest_path("maintenance", "context-store")
+"""
+
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .catalog import closure_bitsets, resolve_adjacency, strongly_connected_components
+from .config_types import DIRECTORY_TYPES, TYPE_DIRECTORIES
+from .documents import load_yaml
+
+
+class UnknownConfigurationError(KeyError):
+    """A query named a configuration or type that is not in the catalog"""
+
+    def __str__(self) -> str:
+        return self.args[0]
+
+
+class CatalogGraph:
+    """Dependency graph of a catalog with bitset-encoded closures"""
+
+    def __init__(self, catalog: Dict[str, Any]):
+        groups = catalog.get("catalog") or {}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        entry_types: Dict[str, str] = {}
+        for key, group in groups.items():
+            for entry in (group or {}).get("configurations") or []:
+                self.entries[entry["name"]] = entry
+                entry_types[entry["name"]] = DIRECTORY_TYPES.get(key, key)
+
+        # Prefer the precomputed adjacency; older catalogs without a graph section are resolved here
+        graph = catalog.get("graph") or {}
+        adjacency = graph.get("adjacency") or resolve_adjacency(self.entries)
+
+        self.nodes: List[str] = sorted(self.entries)
+        self.index: Dict[str, int] = {node: position for position, node in enumerate(self.nodes)}
+        bit = {node: 1 << position for position, node in enumerate(self.nodes)}
+        self.adjacency: Dict[str, List[str]] = {node: sorted(adjacency.get(node) or []) for node in self.nodes}
+
+        reverse: Dict[str, List[str]] = {node: [] for node in self.nodes}
+        for node, dependencies in self.adjacency.items():
+            for dependency in dependencies:
+                reverse[dependency].append(node)
+        self.reverse_adjacency = reverse
+
+        self._direct = {node: self._mask(self.adjacency[node], bit) for node in self.nodes}
+        self._direct_reverse = {node: self._mask(reverse[node], bit) for node in self.nodes}
+        self._closure = closure_bitsets(self.adjacency, strongly_connected_components(self.adjacency), bit)
+        self._reverse_closure = closure_bitsets(reverse, strongly_connected_components(reverse), bit)
+
+        self._types: Dict[str, int] = {config_type: 0 for config_type in TYPE_DIRECTORIES}
+        for node, config_type in entry_types.items():
+            self._types[config_type] = self._types.get(config_type, 0) | bit[node]
+        # Group directory names ("agents", "llms") work as filters too
+        for config_type, directory in TYPE_DIRECTORIES.items():
+            self._types[directory] = self._types[config_type]
+
+    @classmethod
+    def load(cls, index_file: Path) -> "CatalogGraph":
+        """Build the graph of a catalog file"""
+        return cls(load_yaml(Path(index_file)) or {})
+
+    @staticmethod
+    def _mask(names: List[str], bit: Dict[str, int]) -> int:
+        mask = 0
+        for name in names:
+            mask |= bit[name]
+        return mask
+
+    def _bit(self, name: str) -> int:
+        try:
+            return 1 << self.index[name]
+        except KeyError:
+            raise UnknownConfigurationError(f"Unknown configuration: {name}") from None
+
+    def type_mask(self, config_type: Optional[str]) -> int:
+        """Bitset of the configurations of a type; every configuration when None"""
+        if config_type is None:
+            return (1 << len(self.nodes)) - 1
+        try:
+            return self._types[config_type]
+        except KeyError:
+            raise UnknownConfigurationError(f"Unknown configuration type: {config_type}") from None
+
+    def names(self, mask: int) -> List[str]:
+        """Decode a bitset into configuration names, in sorted order"""
+        return list(self._iter_bits(mask))
+
+    def _iter_bits(self, mask: int) -> Iterator[str]:
+        while mask:
+            low = mask & -mask
+            yield self.nodes[low.bit_length() - 1]
+            mask ^= low
+
+    def dependencies_mask(self, name: str, transitive: bool = False) -> int:
+        self._bit(name)
+        return (self._closure if transitive else self._direct)[name]
+
+    def dependents_mask(self, name: str, transitive: bool = False) -> int:
+        self._bit(name)
+        return (self._reverse_closure if transitive else self._direct_reverse)[name]
+
+    def dependencies(self, name: str, transitive: bool = False,
+                     config_type: Optional[str] = None) -> List[str]:
+        """Configurations the named one depends on"""
+        return self.names(self.dependencies_mask(name, transitive) & self.type_mask(config_type) & ~self._bit(name))
+
+    def dependents(self, name: str, transitive: bool = False,
+                   config_type: Optional[str] = None) -> List[str]:
+        """Configurations that depend on the named one (reverse dependencies)"""
+        return self.names(self.dependents_mask(name, transitive) & self.type_mask(config_type) & ~self._bit(name))
+
+    def impact(self, name: str, config_type: Optional[str] = None) -> List[str]:
+        """Blast radius of a change: every configuration that transitively depends on it"""
+        return self.dependents(name, transitive=True, config_type=config_type)
+
+    def depends_on(self, name: str, dependency: str) -> bool:
+        """Whether the named configuration transitively depends on another"""
+        return bool(self.dependencies_mask(name, transitive=True) & self._bit(dependency))
+
+    def shortest_path(self, source: str, target: str) -> Optional[List[str]]:
+        """Shortest dependency chain from source to target, or None if target is not reachable"""
+        self._bit(source)
+        if source != target and not self.depends_on(source, target):
+            return None
+
+        previous: Dict[str, Optional[str]] = {source: None}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            if node == target:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = previous[node]
+                return path[::-1]
+            for dependency in self.adjacency[node]:
+                if dependency not in previous:
+                    previous[dependency] = node
+                    queue.append(dependency)
+        return None
+
+    def select(self, config_type: Optional[str] = None) -> List[str]:
+        """Configurations of a type, or all of them"""
+        return self.names(self.type_mask(config_type))
@@ -0,0 +1,330 @@
+"""
+HUGAI Model Routing
+
+Compiles the model selection rules of llms/model-llm.yaml into a routing table once,
+so choosing a model per request is a dictionary lookup and a short scan. Compilation:
+
+  • collects the models of enabled providers that have a context window, with their
+    token prices and qualitative performance characteristics mapped to scores
+  • scores every model with the weighted ``routing_criteria`` of
+    ``model_selection.intelligent_routing`` (cost, latency, quality, availability)
+  • ranks the ``preferred_models`` of each ``task_based_routing`` entry by its
+    primary and secondary selection criteria, then by weighted score, and appends
+    the task's fallback: "none" adds nothing, "any_available" adds every other model
+    by weighted score, another criterion adds every other model ranked by it, and a
+    model name adds that model
+  • resolves ``fallback_chains`` into a fallback tuple per (task, primary model); a
+    primary's chain comes first, then the rest of the task's candidates, and with a
+    "none" fallback chains cannot leave the preferred models
+  • indexes schema-style ``configuration.routing.rules`` (task_type, input_length,
+    cost_threshold, target_model, fallback_models) by task type; they are checked
+    before task routing, in file order
+
+Task types without rules route to every model by weighted score. A route skips models
+whose context window is smaller than the request and models marked unavailable, and
+returns at most ``max_fallback_attempts`` fallbacks.
+
+Example:
+    engine = RoutingEngine.load(Path("config/llms/model-llm.yaml"))
+    route = engine.route("code_generation", input_tokens=12000)
+    print(route.model, route.fallbacks)
+"""
+
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from .documents import load_yaml
+
+# Scores of the qualitative capability levels used in performance_characteristics
+LEVEL_SCORES = {
+    "limited": 0.2,
+    "fair": 0.4,
+    "good": 0.6,
+    "high": 0.7,
+    "very_good": 0.8,
+    "very_high": 1.0,
+    "excellent": 1.0
+}
+
+# Latency levels score inversely: the fastest model scores highest
+LATENCY_SCORES = {
+    "very_low": 1.0,
+    "low": 0.8,
+    "medium": 0.5,
+    "high": 0.25,
+    "very_high": 0.0
+}
+
+# Score of a characteristic a model does not declare
+UNKNOWN_SCORE = 0.5
+
+# Weights used when routing_criteria is missing
+DEFAULT_WEIGHTS = {"cost": 0.3, "latency": 0.25, "quality": 0.35, "availability": 0.1}
+
+DEFAULT_MAX_FALLBACKS = 3
+
+# Selection criterion names of task_based_routing -> model score
+CRITERIA = {
+    "coding_capability": "coding",
+    "reasoning_capability": "reasoning",
+    "safety_and_accuracy": "safety_and_accuracy",
+    "response_quality": "quality",
+    "quality": "quality",
+    "context_window": "context",
+    "cost_efficiency": "cost",
+    "cost": "cost",
+    "latency": "latency",
+    "availability": "availability"
+}
+
+
+class ModelProfile(NamedTuple):
+    """Routing-relevant data of one model"""
+    name: str
+    provider: str
+    context_window: int
+    input_price: float
+    output_price: float
+    latency_class: Optional[str]
+    scores: Dict[str, float]
+
+
+class Route(NamedTuple):
+    """Model chosen for a request, its ordered fallbacks and what selected it"""
+    model: str
+    fallbacks: Tuple[str, ...]
+    rule: str
+
+
+# (model, context window, fallbacks as (model, context window) pairs)
+_Candidate = Tuple[str, int, Tuple[Tuple[str, int], ...]]
+
+
+class _CompiledRule(NamedTuple):
+    name: str
+    min_length: int
+    max_length: Optional[int]
+    cost_threshold: Optional[float]
+    candidates: Tuple[_Candidate, ...]
+
+
+def _price(pricing: Dict[str, Any], key: str) -> float:
+    if key in pricing:
+        return float(pricing[key])
+    return float(pricing.get("cost_per_token", 0.0)) * 1000
+
+
+def load_models(configuration: Dict[str, Any]) -> Dict[str, ModelProfile]:
+    """Profiles of the text models of enabled providers, with normalized scores"""
+    raw = []
+    for provider, settings in (configuration.get("model_providers") or {}).items():
+        if not isinstance(settings, dict) or not settings.get("enabled", True):
+            continue
+        for name, model in (settings.get("models") or {}).items():
+            capabilities = model.get("capabilities") or {}
+            if not capabilities.get("context_window"):
+                continue
+            pricing = model.get("pricing") or {}
+            raw.append((name, provider, int(capabilities["context_window"]),
+                        _price(pricing, "input_tokens_per_1k"), _price(pricing, "output_tokens_per_1k"),
+                        model.get("performance_characteristics") or {}))
+
+    max_cost = max((inp + out for _, _, _, inp, out, _ in raw), default=0.0)
+    max_window = max((window for _, _, window, _, _, _ in raw), default=0)
+
+    models = {}
+    for name, provider, window, input_price, output_price, characteristics in raw:
+        def level(key: str) -> float:
+            return LEVEL_SCORES.get(characteristics.get(key), UNKNOWN_SCORE)
+
+        quality = level("quality")
+        scores = {
+            "cost": 1.0 - (input_price + output_price) / max_cost if max_cost else 1.0,
+            "latency": LATENCY_SCORES.get(characteristics.get("latency"), UNKNOWN_SCORE),
+            "quality": quality,
+            "coding": level("coding"),
+            "reasoning": level("reasoning"),
+            "safety_and_accuracy": (level("safety") + quality) / 2,
+            "context": window / max_window,
+            # Every listed model belongs to an enabled provider; runtime outages are
+            # passed to route() as unavailable models
+            "availability": 1.0
+        }
+        models[name] = ModelProfile(name, provider, window, input_price, output_price,
+                                    characteristics.get("latency"), scores)
+    return models
+
+
+def weighted_scores(models: Dict[str, ModelProfile], criteria: Dict[str, Any]) -> Dict[str, float]:
+    """Weighted routing score of every model from routing_criteria"""
+    weights = {
+        key: float(criteria.get(f"{key}_weight", default))
+        for key, default in DEFAULT_WEIGHTS.items()
+    } if criteria else dict(DEFAULT_WEIGHTS)
+    return {
+        name: sum(weight * profile.scores[key] for key, weight in weights.items())
+        for name, profile in models.items()
+    }
+
+
+def _criterion_score(profile: ModelProfile, criterion: Optional[str]) -> float:
+    key = CRITERIA.get(criterion or "")
+    return profile.scores[key] if key else 0.0
+
+
+class RoutingEngine:
+    """Model selection rules compiled into per-task candidate tables"""
+
+    def __init__(self, configuration: Dict[str, Any]):
+        if "configuration" in configuration:
+            configuration = configuration["configuration"] or {}
+        selection = configuration.get("model_selection") or {}
+        routing = selection.get("intelligent_routing") or {}
+        fallback = selection.get("fallback_configuration") or {}
+        policies = fallback.get("fallback_policies") or {}
+
+        self.models = load_models(configuration)
+        self.scores = weighted_scores(self.models, routing.get("routing_criteria") or {})
+        self.max_fallbacks = int(policies.get("max_fallback_attempts", DEFAULT_MAX_FALLBACKS))
+        self.by_score: Tuple[str, ...] = tuple(sorted(self.models, key=lambda name: -self.scores[name]))
+
+        self.chains: Dict[str, Tuple[str, ...]] = {}
+        for chain in (fallback.get("fallback_chains") or {}).get("primary_to_secondary") or []:
+            self.chains.setdefault(chain.get("primary"), tuple(
+                chain[key] for key in ("secondary", "fallback") if chain.get(key) in self.models
+            ))
+
+        self._tasks: Dict[str, Tuple[_Candidate, ...]] = {}
+        if routing.get("enabled", True):
+            for task, settings in (routing.get("task_based_routing") or {}).items():
+                self._tasks[task] = self._compile_task(settings or {})
+        self._default = self._compile(self.by_score, restricted=False)
+
+        self._rules: Dict[Optional[str], Tuple[_CompiledRule, ...]] = {}
+        self._compile_rules((configuration.get("routing") or {}).get("rules") or [])
+
+    @classmethod
+    def load(cls, path: Path) -> "RoutingEngine":
+        """Compile the routing rules of an LLM configuration file"""
+        return cls(load_yaml(path) or {})
+
+    def _rank(self, names: Iterable[str], *criteria: Optional[str]) -> List[str]:
+        return sorted(names, key=lambda name: tuple(
+            -_criterion_score(self.models[name], criterion) for criterion in criteria
+        ) + (-self.scores[name],))
+
+    def _compile_task(self, settings: Dict[str, Any]) -> Tuple[_Candidate, ...]:
+        criteria = settings.get("selection_criteria") or {}
+        preferred = [name for name in settings.get("preferred_models") or [] if name in self.models]
+        candidates = self._rank(preferred, criteria.get("primary"), criteria.get("secondary"))
+
+        fallback = criteria.get("fallback") or "none"
+        others = [name for name in self.by_score if name not in candidates]
+        if fallback == "any_available":
+            candidates += others
+        elif fallback in CRITERIA:
+            candidates += self._rank(others, fallback)
+        elif fallback in self.models and fallback not in candidates:
+            candidates.append(fallback)
+        return self._compile(candidates, restricted=fallback == "none")
+
+    def _compile(self, candidates: Iterable[str], restricted: bool) -> Tuple[_Candidate, ...]:
+        """(model, window, fallbacks) per candidate; fallbacks are the model's chain and
+        then the other candidates, limited to the candidates when restricted"""
+        candidates = list(dict.fromkeys(candidates))
+        compiled = []
+        for name in candidates:
+            chain = [model for model in self.chains.get(name, ())
+                     if not restricted or model in candidates]
+            order = dict.fromkeys(chain + candidates)
+            order.pop(name)
+            compiled.append((name, self.models[name].context_window,
+                             tuple((model, self.models[model].context_window) for model in order)))
+        return tuple(compiled)
+
+    def _compile_rules(self, rules: List[Dict[str, Any]]):
+        compiled: List[Tuple[Optional[str], _CompiledRule]] = []
+        for number, rule in enumerate(rules, 1):
+            condition = rule.get("condition") or {}
+            length = condition.get("input_length") or {}
+            threshold = condition.get("cost_threshold")
+            names = [rule.get("target_model")] + list(rule.get("fallback_models") or [])
+            compiled.append((condition.get("task_type"), _CompiledRule(
+                rule.get("name") or f"rule {number}",
+                int(length.get("min", 0)),
+                int(length["max"]) if length.get("max") is not None else None,
+                float(threshold) if threshold is not None else None,
+                self._compile([name for name in names if name in self.models], restricted=True)
+            )))
+
+        # Each task type gets its own rules and the rules without a task type, in file order
+        task_types = {task_type for task_type, _ in compiled}
+        for task_type in task_types:
+            self._rules[task_type] = tuple(rule for rule_type, rule in compiled
+                                           if rule_type in (task_type, None))
+
+    @property
+    def input_breakpoints(self) -> List[int]:
+        """Input token counts at which a routing rule starts or stops matching"""
+        bounds = set()
+        for rules in self._rules.values():
+            for rule in rules:
+                bounds.add(rule.min_length)
+                if rule.max_length is not None:
+                    bounds.add(rule.max_length + 1)
+        return sorted(bounds)
+
+    @property
+    def cost_dependent(self) -> bool:
+        """Whether a routing rule has a cost threshold, which makes routes depend on the
+        exact token counts rather than on context windows and input_length bounds"""
+        return any(rule.cost_threshold is not None
+                   for rules in self._rules.values() for rule in rules)
+
+    @property
+    def task_types(self) -> List[str]:
+        """Task types with compiled task routing or routing rules"""
+        return sorted(set(self._tasks) | {task for task in self._rules if task is not None})
+
+    def candidates(self, task_type: str) -> List[str]:
+        """Compiled candidate order of a task type, before request filters"""
+        return [name for name, _, _ in self._tasks.get(task_type, self._default)]
+
+    def estimate_cost(self, model: str, input_tokens: int, output_tokens: int = 0) -> float:
+        """Cost of a request on a model from its per-1k token prices"""
+        profile = self.models[model]
+        return (input_tokens * profile.input_price + output_tokens * profile.output_price) / 1000
+
+    def _select(self, candidates: Tuple[_Candidate, ...], tokens: int,
+                unavailable: FrozenSet[str]) -> Optional[Tuple[str, Tuple[str, ...]]]:
+        for name, window, fallbacks in candidates:
+            if window >= tokens and name not in unavailable:
+                selected = [model for model, model_window in fallbacks
+                            if model_window >= tokens and model not in unavailable]
+                return name, tuple(selected[:self.max_fallbacks])
+        return None
+
+    def route(self, task_type: str, input_tokens: int = 0, output_tokens: int = 0,
+              unavailable: FrozenSet[str] = frozenset()) -> Optional[Route]:
+        """Primary and fallback models for a request, or None if no model fits it"""
+        tokens = input_tokens + output_tokens
+        rules = self._rules.get(task_type) or self._rules.get(None)
+        if rules:
+            for rule in rules:
+                if input_tokens < rule.min_length or (rule.max_length is not None
+                                                      and input_tokens > rule.max_length):
+                    continue
+                selected = self._select(rule.candidates, tokens, unavailable)
+                if selected is None:
+                    continue
+                if rule.cost_threshold is not None and \
+                        self.estimate_cost(selected[0], input_tokens, output_tokens) > rule.cost_threshold:
+                    continue
+                return Route(selected[0], selected[1], rule.name)
+
+        candidates = self._tasks.get(task_type)
+        selected = self._select(candidates if candidates is not None else self._default,
+                                tokens, unavailable)
+        if selected is None:
+            return None
+        return Route(selected[0], selected[1], task_type if candidates is not None else "default")
@@ -0,0 +1,143 @@
+"""
+HUGAI Configuration Schemas
+
+Compiled JSON schema registry. Each schema is read, checked and compiled into a
+validator once per process and schemas directory, then reused for every file.
+Compiled validators are also shared by content, so repositories carrying identical
+schema files compile them only once per process.
+
+Example:
+    registry = get_schema_registry(Path("config/schemas"))
+    errors = registry.validate(config_data, "agent")
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+# Schema file for each configuration type
+SCHEMA_FILES: Dict[str, str] = {
+    "agent": "agent-schema.json",
+    "lifecycle": "lifecycle-schema.json",
+    "tool": "tool-schema.json",
+    "llm": "llm-schema.json"
+}
+
+
+class SchemaRegistry:
+    """Lazily loaded, compiled schemas of a schemas directory"""
+
+    def __init__(self, schemas_dir: Path):
+        self.schemas_dir = Path(schemas_dir)
+        self._schemas: Dict[str, Dict] = {}
+        self._validators: Dict[str, Any] = {}
+        self._digests: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def schema_path(self, config_type: str) -> Path:
+        return self.schemas_dir / SCHEMA_FILES.get(config_type, f"{config_type}-schema.json")
+
+    def get(self, config_type: str) -> Optional[Dict]:
+        """Return the schema of a configuration type, or None if it has none"""
+        with self._lock:
+            if config_type in self._schemas:
+                return self._schemas[config_type]
+
+        schema_path = self.schema_path(config_type)
+        if not schema_path.exists():
+            return None
+        with open(schema_path, 'rb') as f:
+            source = f.read()
+        digest = hashlib.sha256(source).hexdigest()
+
+        with _COMPILED_LOCK:
+            compiled = _COMPILED.get(digest)
+        schema = compiled[0] if compiled else json.loads(source)
+        return self.register(config_type, schema, digest)
+
+    def digest(self, config_type: str) -> Optional[str]:
+        """SHA-256 of the schema file of a configuration type, or None if it has none"""
+        self.get(config_type)
+        with self._lock:
+            return self._digests.get(config_type)
+
+    def register(self, config_type: str, schema: Dict, digest: Optional[str] = None) -> Dict:
+        """Register a schema under a configuration type, replacing any existing one"""
+        with self._lock:
+            self._schemas[config_type] = schema
+            self._validators.pop(config_type, None)
+            if digest is None:
+                self._digests.pop(config_type, None)
+            else:
+                self._digests[config_type] = digest
+        return schema
+
+    def validator(self, config_type: str):
+        """Return the compiled validator of a configuration type; raises SchemaError"""
+        with self._lock:
+            validator = self._validators.get(config_type)
+        if validator is not None:
+            return validator
+
+        schema = self.get(config_type)
+        if schema is None:
+            return None
+        digest = self._digests.get(config_type)
+        with _COMPILED_LOCK:
+            compiled = _COMPILED.get(digest) if digest else None
+
+        if compiled is not None:
+            validator = compiled[1]
+        else:
+            cls = validator_for(schema)
+            cls.check_schema(schema)
+            validator = cls(schema)
+            if digest:
+                with _COMPILED_LOCK:
+                    _COMPILED[digest] = (schema, validator)
+
+        with self._lock:
+            self._validators[config_type] = validator
+        return validator
+
+    def check(self, instance: Any, config_type: str):
+        """Raise the most relevant ValidationError, like jsonschema.validate"""
+        validator = self.validator(config_type)
+        if validator is None:
+            return
+        error = best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def validate(self, instance: Any, config_type: str) -> List[str]:
+        """Validate an instance and return error messages"""
+        try:
+            self.check(instance, config_type)
+        except ValidationError as e:
+            return [f"Validation error at {e.json_path}: {e.message}"]
+        return []
+
+
+# Compiled schemas keyed by the SHA-256 of their file content
+_COMPILED: Dict[str, Tuple[Dict, Any]] = {}
+_COMPILED_LOCK = threading.Lock()
+
+_REGISTRIES: Dict[str, SchemaRegistry] = {}
+_REGISTRIES_LOCK = threading.Lock()
+
+
+def get_schema_registry(schemas_dir: Path) -> SchemaRegistry:
+    """Return the per-process schema registry of a schemas directory"""
+    key = os.path.realpath(schemas_dir)
+    with _REGISTRIES_LOCK:
+        registry = _REGISTRIES.get(key)
+        if registry is None:
+            registry = _REGISTRIES[key] = SchemaRegistry(Path(schemas_dir))
+        return registry
@@ -0,0 +1,172 @@
+"""
+HUGAI Configuration Semantic Diff
+
+Structural comparison of parsed configuration trees. Formatting, comments, quoting and
+mapping key order never count as changes. Lists of mappings that all carry a unique
+``name``, ``id`` or ``key`` are matched by that key, so inserting an item reports one
+addition instead of a change at every later position, and reordering such a list is
+reported as a single move.
+
+Example:
+    changes = diff_trees(load_yaml(old_path), load_yaml(new_path))
+    print(format_summary(changes))
+    # ~ configuration.providers[name=openai].models[id=gpt-4o].max_tokens: 4096 → 8192
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+# Fields used to match list items, in order of preference
+LIST_KEYS = ("name", "id", "key")
+
+# Change kinds
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+MOVED = "moved"
+
+_SYMBOLS = {ADDED: "+", REMOVED: "-", CHANGED: "~", MOVED: "↕"}
+
+
+class Change(NamedTuple):
+    """A single difference between two configuration trees"""
+
+    kind: str
+    path: str
+    old: Any = None
+    new: Any = None
+
+
+def semantic_hash(tree: Any) -> str:
+    """Hash of a parsed tree that ignores formatting, comments and mapping key order"""
+    canonical = json.dumps(tree, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def list_key(items: Sequence[Any]) -> Optional[str]:
+    """Return the field identifying every item of a list of mappings, if there is one"""
+    if not items or not all(isinstance(item, dict) for item in items):
+        return None
+
+    for field in LIST_KEYS:
+        values = [item.get(field) for item in items]
+        if all(isinstance(value, (str, int)) for value in values) and len(set(values)) == len(values):
+            return field
+    return None
+
+
+def _join(path: str, key: Any) -> str:
+    return f"{path}.{key}" if path else str(key)
+
+
+def diff_trees(old: Any, new: Any, path: str = "") -> List[Change]:
+    """Compare two parsed configuration trees and return their differences"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        return _diff_mappings(old, new, path)
+    if isinstance(old, list) and isinstance(new, list):
+        return _diff_lists(old, new, path)
+    if old == new and type(old) is type(new):
+        return []
+    return [Change(CHANGED, path or "$", old, new)]
+
+
+def _diff_mappings(old: Dict, new: Dict, path: str) -> List[Change]:
+    changes = []
+    for key in old:
+        if key not in new:
+            changes.append(Change(REMOVED, _join(path, key), old[key], None))
+        else:
+            changes.extend(diff_trees(old[key], new[key], _join(path, key)))
+
+    for key in new:
+        if key not in old:
+            changes.append(Change(ADDED, _join(path, key), None, new[key]))
+    return changes
+
+
+def _diff_lists(old: List, new: List, path: str) -> List[Change]:
+    field = list_key(old)
+    if field is None or field != list_key(new):
+        return _diff_positional(old, new, path)
+
+    old_items = {item[field]: item for item in old}
+    new_items = {item[field]: item for item in new}
+    changes = []
+
+    for key, item in old_items.items():
+        item_path = f"{path}[{field}={key}]"
+        if key not in new_items:
+            changes.append(Change(REMOVED, item_path, item, None))
+        else:
+            changes.extend(diff_trees(item, new_items[key], item_path))
+
+    for key, item in new_items.items():
+        if key not in old_items:
+            changes.append(Change(ADDED, f"{path}[{field}={key}]", None, item))
+
+    # Report a reordering of the items present on both sides once per list
+    old_order = [key for key in old_items if key in new_items]
+    new_order = [key for key in new_items if key in old_items]
+    if old_order != new_order:
+        changes.append(Change(MOVED, path or "$", old_order, new_order))
+    return changes
+
+
+def _diff_positional(old: List, new: List, path: str) -> List[Change]:
+    changes = []
+    for index in range(max(len(old), len(new))):
+        item_path = f"{path}[{index}]"
+        if index >= len(new):
+            changes.append(Change(REMOVED, item_path, old[index], None))
+        elif index >= len(old):
+            changes.append(Change(ADDED, item_path, None, new[index]))
+        else:
+            changes.extend(diff_trees(old[index], new[index], item_path))
+    return changes
+
+
+def _format_value(value: Any, width: int = 60) -> str:
+    text = json.dumps(value, default=str, ensure_ascii=False)
+    return text if len(text) <= width else text[:width - 1] + "…"
+
+
+def _format_text_change(old: str, new: str, width: int = 60) -> str:
+    """Format a change of long text around its first difference"""
+    start = next((i for i, (a, b) in enumerate(zip(old, new)) if a != b), min(len(old), len(new)))
+    start = max(start - 10, 0)
+    prefix = "…" if start else ""
+    return (f"{_format_value(prefix + old[start:], width)} → {_format_value(prefix + new[start:], width)}"
+            f" ({old.count(chr(10)) + 1} → {new.count(chr(10)) + 1} lines)")
+
+
+def format_change(change: Change) -> str:
+    """Format a change as a single line"""
+    symbol = _SYMBOLS[change.kind]
+    # Additions and removals at the root are whole files
+    if change.path == "$" and change.kind in (ADDED, REMOVED):
+        return f"{symbol} $ ({'new' if change.kind == ADDED else 'deleted'} file)"
+    if change.kind == CHANGED and isinstance(change.old, str) and isinstance(change.new, str) \
+            and max(len(change.old), len(change.new)) > 60:
+        return f"{symbol} {change.path}: {_format_text_change(change.old, change.new)}"
+    if change.kind == CHANGED:
+        return f"{symbol} {change.path}: {_format_value(change.old)} → {_format_value(change.new)}"
+    if change.kind == ADDED:
+        return f"{symbol} {change.path}: {_format_value(change.new)}"
+    if change.kind == MOVED:
+        return f"{symbol} {change.path}: reordered"
+    return f"{symbol} {change.path}"
+
+
+def format_summary(changes: List[Change], limit: int = 50) -> str:
+    """Compact, line-per-change summary, truncated after limit changes"""
+    if not changes:
+        return "No semantic changes"
+
+    counts = {kind: sum(1 for change in changes if change.kind == kind) for kind in _SYMBOLS}
+    header = ", ".join(f"{count} {kind}" for kind, count in counts.items() if count)
+    lines = [header]
+    lines.extend(format_change(change) for change in changes[:limit])
+    if len(changes) > limit:
+        lines.append(f"… {len(changes) - limit} more changes")
+    return "\n".join(lines)
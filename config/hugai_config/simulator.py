@@ -0,0 +1,375 @@
+"""
+HUGAI LLM Cost and Latency Simulator
+
+Replays a request trace (task type, input tokens, output tokens and optionally a
+timestamp) against the model configuration of llms/model-llm.yaml, with NumPy arrays
+instead of per-request Python:
+
+  • routing: requests are grouped by task type, by the smallest context window they
+    fit and by the input_length bounds of routing rules; every group is routed once
+    with the compiled RoutingEngine, and the group's primary and fallback models are
+    broadcast to its requests (rules with a cost threshold make routes depend on exact
+    token counts, so then every distinct request is routed once)
+  • throttling: provider ``rate_limits`` are enforced as fixed one-minute and one-day
+    windows, first come first served; a throttled request moves to its next fallback
+    (``rate_limit_exceeded`` is a fallback trigger) and competes for the capacity left
+    in that window, up to ``max_fallback_attempts`` times
+  • cost: per-1k token prices of the model that served the request
+  • latency: a time to first token and a time per output token per latency class
+    (LATENCY_PROFILES, the configuration only names the classes), plus the
+    ``fallback_delay`` for every fallback attempt
+  • budget: daily spend against ``daily_budget_usd``, and the trace's spend rate
+    projected to a 30-day month against ``monthly_budget_usd`` and the alert thresholds
+
+Policy what-ifs are overlays deep-merged onto the configuration before simulating, so
+they can change weights, task routing, fallback chains, providers or limits.
+
+NumPy is required, so this module is not imported by the package namespace.
+
+Example:
+    trace = read_trace(Path("requests.csv"))
+    baseline = simulate(configuration, trace)
+    variant = simulate(apply_overlay(configuration, {"configuration": {...}}), trace)
+    print(baseline.total_cost, variant.total_cost, variant.latency["p95"])
+"""
+
+import copy
+import csv
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from .planner import parse_duration
+from .routing import RoutingEngine
+
+# Latency class -> (seconds to first token, seconds per output token)
+LATENCY_PROFILES = {
+    "very_low": (0.2, 0.004),
+    "low": (0.4, 0.008),
+    "medium": (0.8, 0.015),
+    "high": (1.5, 0.03),
+    "very_high": (3.0, 0.06)
+}
+DEFAULT_LATENCY_CLASS = "medium"
+
+# Arrival rate of traces without timestamps when the configuration sets no target_rps
+DEFAULT_RATE = 100.0
+
+TRACE_COLUMNS = ("task_type", "input_tokens", "output_tokens")
+TIMESTAMP_COLUMN = "timestamp"
+
+MINUTE = 60
+DAY = 86400
+MONTH_DAYS = 30
+
+
+class Trace(NamedTuple):
+    """Request trace as parallel arrays, ordered by timestamp (seconds)"""
+    task_types: np.ndarray
+    input_tokens: np.ndarray
+    output_tokens: np.ndarray
+    timestamps: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.task_types)
+
+
+class SimulationResult(NamedTuple):
+    """Totals of a simulated trace; costs are in the configured currency"""
+    requests: int
+    served: int
+    throttled: int
+    unroutable: int
+    fallbacks: int
+    total_cost: float
+    cost_by_model: Dict[str, float]
+    requests_by_model: Dict[str, int]
+    cost_by_task: Dict[str, float]
+    latency: Dict[str, float]
+    latency_targets: Dict[str, float]
+    peak_daily_cost: float
+    days_over_budget: int
+    projected_monthly_cost: Optional[float]
+    budget_utilization: Optional[float]
+    budget_status: str
+
+
+def _ordered(task_types: np.ndarray, input_tokens: np.ndarray, output_tokens: np.ndarray,
+             timestamps: np.ndarray) -> Trace:
+    order = np.argsort(timestamps, kind="stable")
+    return Trace(task_types[order], input_tokens[order].astype(np.int64),
+                 output_tokens[order].astype(np.int64), timestamps[order].astype(np.float64))
+
+
+def _arrivals(count: int, rate: float) -> np.ndarray:
+    return np.arange(count, dtype=np.float64) / rate
+
+
+def read_trace(path: Path, rate: float = DEFAULT_RATE) -> Trace:
+    """Load a CSV or Parquet trace; without a timestamp column (seconds) requests are
+    spaced evenly at ``rate`` requests per second"""
+    path = Path(path)
+    if path.suffix.lower() in (".parquet", ".pq"):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        columns = {name: table.column(name).to_numpy() for name in table.column_names
+                   if name in TRACE_COLUMNS + (TIMESTAMP_COLUMN,)}
+    else:
+        # The csv module handles quoted fields ("code_generation", "a, b"), unlike np.loadtxt
+        with open(path, newline="") as f:
+            reader = csv.reader(f, skipinitialspace=True)
+            names = [name.strip() for name in next(reader, [])]
+            wanted = [name for name in TRACE_COLUMNS + (TIMESTAMP_COLUMN,) if name in names]
+            positions = [names.index(name) for name in wanted]
+            rows = []
+            for row in reader:
+                if not row:
+                    continue
+                try:
+                    rows.append([row[position] for position in positions])
+                except IndexError:
+                    raise ValueError(f"Trace {path} line {reader.line_num} has "
+                                     f"{len(row)} of {len(names)} columns") from None
+        types = {"task_type": str, "input_tokens": np.int64, "output_tokens": np.int64,
+                 TIMESTAMP_COLUMN: np.float64}
+        values = list(zip(*rows)) or [()] * len(wanted)
+        columns = {name: np.array(column, dtype=types[name]) for name, column in zip(wanted, values)}
+
+    missing = [name for name in TRACE_COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(f"Trace {path} is missing columns: {', '.join(missing)}")
+    task_types = np.asarray(columns["task_type"]).astype(str)
+    timestamps = columns.get(TIMESTAMP_COLUMN)
+    if timestamps is None:
+        timestamps = _arrivals(len(task_types), rate)
+    return _ordered(task_types, np.asarray(columns["input_tokens"]),
+                    np.asarray(columns["output_tokens"]), np.asarray(timestamps))
+
+
+def write_trace(trace: Trace, path: Path):
+    """Write a trace as CSV with a timestamp column"""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(TRACE_COLUMNS + (TIMESTAMP_COLUMN,))
+        writer.writerows(zip(trace.task_types.tolist(), trace.input_tokens.tolist(),
+                             trace.output_tokens.tolist(), np.round(trace.timestamps, 3).tolist()))
+
+
+def synthetic_trace(task_types: List[str], count: int, rate: float = DEFAULT_RATE,
+                    seed: int = 0) -> Trace:
+    """Seeded trace with Poisson arrivals at ``rate`` requests per second and
+    log-normal token counts (median about 1500 input and 400 output tokens)"""
+    rng = np.random.default_rng(seed)
+    names = np.asarray(task_types)
+    return Trace(
+        names[rng.integers(0, len(names), count)],
+        np.minimum(rng.lognormal(np.log(1500), 1.2, count), 250000).astype(np.int64),
+        np.minimum(rng.lognormal(np.log(400), 0.8, count), 8000).astype(np.int64),
+        np.cumsum(rng.exponential(1.0 / rate, count))
+    )
+
+
+def apply_overlay(configuration: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep-merge a what-if overlay onto a configuration; lists and scalars replace"""
+    merged = copy.deepcopy(configuration)
+    stack = [(merged, overlay)]
+    while stack:
+        target, changes = stack.pop()
+        for key, value in changes.items():
+            if isinstance(value, dict) and isinstance(target.get(key), dict):
+                stack.append((target[key], value))
+            else:
+                target[key] = copy.deepcopy(value)
+    return merged
+
+
+def _cumulative(groups: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Running sum of values within runs of equal, sorted group ids (inclusive)"""
+    totals = np.cumsum(values)
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    offsets = np.repeat(totals[starts] - values[starts], np.diff(np.r_[starts, len(groups)]))
+    return totals - offsets
+
+
+def _admit(requests: np.ndarray, windows) -> np.ndarray:
+    """Mask of the requests (indexes in time order) admitted first come first served, and
+    charge them to the ``used`` counters of the rate limit windows.
+
+    A request is admitted when it fits in what every window has left after the earlier
+    admitted requests. This is decided in rounds over the undecided requests: one that
+    fits even when all earlier undecided requests are counted is admitted, and one that
+    does not fit next to the admitted requests alone is rejected. Every round decides at
+    least the earliest request that exceeds a limit, and usually a full bucket at once.
+    """
+    windows = [window for window in windows if window[0] is not None]
+    admitted = np.zeros(len(requests), dtype=bool)
+    undecided = np.arange(len(requests))
+    while len(undecided):
+        rows = requests[undecided]
+        fits = np.ones(len(rows), dtype=bool)
+        for limit, used, buckets, values in windows:
+            bucket = buckets[rows]
+            fits &= used[bucket] + _cumulative(bucket, values[rows]) <= limit
+
+        admitted[undecided[fits]] = True
+        for limit, used, buckets, values in windows:
+            used += np.bincount(buckets[rows[fits]], weights=values[rows[fits]], minlength=len(used))
+
+        undecided, rows = undecided[~fits], rows[~fits]
+        fits = np.ones(len(rows), dtype=bool)
+        for limit, used, buckets, values in windows:
+            fits &= used[buckets[rows]] + values[rows] <= limit
+        undecided = undecided[fits]
+    return admitted
+
+
+def _route_chains(engine: RoutingEngine, trace: Trace, model_index: Dict[str, int],
+                  width: int) -> np.ndarray:
+    """(requests, width) array of model indexes, primary first, -1 padded"""
+    tasks, task_codes = np.unique(trace.task_types, return_inverse=True)
+    tokens = trace.input_tokens + trace.output_tokens
+
+    if engine.cost_dependent:
+        keys = np.stack([task_codes, trace.input_tokens, trace.output_tokens], axis=1)
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    else:
+        windows = np.unique([profile.context_window for profile in engine.models.values()])
+        bounds = np.asarray(engine.input_breakpoints, dtype=np.int64)
+        window_class = np.searchsorted(windows, tokens, side="left")
+        rule_class = np.searchsorted(bounds, trace.input_tokens, side="right")
+        keys = (task_codes.astype(np.int64) * (len(windows) + 1) + window_class) \
+            * (len(bounds) + 1) + rule_class
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+
+    table = np.full((len(first), width), -1, dtype=np.int32)
+    for group, request in enumerate(first):
+        route = engine.route(tasks[task_codes[request]], int(trace.input_tokens[request]),
+                             int(trace.output_tokens[request]))
+        if route is not None:
+            chain = [model_index[name] for name in (route.model,) + route.fallbacks]
+            table[group, :len(chain)] = chain
+    return table[inverse.reshape(-1)]
+
+
+def simulate(configuration: Dict[str, Any], trace: Trace) -> SimulationResult:
+    """Route, throttle, price and time every request of a trace"""
+    if "configuration" in configuration:
+        configuration = configuration["configuration"] or {}
+    engine = RoutingEngine(configuration)
+    names = list(engine.models)
+    model_index = {name: index for index, name in enumerate(names)}
+    providers = configuration.get("model_providers") or {}
+    selection = configuration.get("model_selection") or {}
+    policies = (selection.get("fallback_configuration") or {}).get("fallback_policies") or {}
+    fallback_delay = parse_duration(policies.get("fallback_delay", 0))
+    if not policies.get("automatic_fallback", True):
+        engine.max_fallbacks = 0
+
+    in_price = np.array([engine.models[name].input_price for name in names]) / 1000
+    out_price = np.array([engine.models[name].output_price for name in names]) / 1000
+    profiles = [LATENCY_PROFILES.get(engine.models[name].latency_class,
+                                     LATENCY_PROFILES[DEFAULT_LATENCY_CLASS]) for name in names]
+    first_token = np.array([profile[0] for profile in profiles])
+    per_token = np.array([profile[1] for profile in profiles])
+    model_provider = np.array([engine.models[name].provider for name in names])
+
+    count = len(trace)
+    tokens = trace.input_tokens + trace.output_tokens
+    chains = _route_chains(engine, trace, model_index, engine.max_fallbacks + 1)
+    start = trace.timestamps[0] if count else 0.0
+    minute = ((trace.timestamps - start) // MINUTE).astype(np.int64)
+    day = ((trace.timestamps - start) // DAY).astype(np.int64)
+    minutes, days = int(minute.max(initial=0)) + 1, int(day.max(initial=0)) + 1
+
+    usage = {}
+    for provider in set(model_provider.tolist()):
+        limits = providers[provider].get("rate_limits") or {}
+        usage[provider] = (
+            (limits.get("requests_per_minute"), np.zeros(minutes), minute, np.ones(count)),
+            (limits.get("tokens_per_minute"), np.zeros(minutes), minute, tokens),
+            (limits.get("requests_per_day"), np.zeros(days), day, np.ones(count)),
+        )
+
+    served_by = np.full(count, -1, dtype=np.int32)
+    attempts = np.zeros(count, dtype=np.int32)
+    pending = chains[:, 0] >= 0
+    for attempt in range(chains.shape[1]):
+        requests = np.flatnonzero(pending & (chains[:, attempt] >= 0))
+        if not len(requests):
+            break
+        models = chains[requests, attempt]
+        request_providers = model_provider[models]
+        for provider, windows in usage.items():
+            selected = requests[request_providers == provider]
+            if not len(selected):
+                continue
+            # Quota is only spent on admitted requests. The daily request count only binds
+            # once a day is full, after which its minutes admit nothing, so it can keep a
+            # prefix of what the minute windows admit instead of joining their rounds
+            accepted = selected[_admit(selected, windows[:2])]
+            accepted = accepted[_admit(accepted, windows[2:])]
+            served_by[accepted] = chains[accepted, attempt]
+            attempts[accepted] = attempt
+            pending[accepted] = False
+
+    served = served_by >= 0
+    model = served_by[served]
+    cost = trace.input_tokens[served] * in_price[model] + trace.output_tokens[served] * out_price[model]
+    latency = first_token[model] + trace.output_tokens[served] * per_token[model] \
+        + attempts[served] * fallback_delay
+    total_cost = float(cost.sum())
+
+    tasks, task_codes = np.unique(trace.task_types[served], return_inverse=True)
+    model_costs = np.bincount(model, weights=cost, minlength=len(names))
+    model_requests = np.bincount(model, minlength=len(names))
+    task_costs = np.bincount(task_codes.reshape(-1), weights=cost, minlength=len(tasks))
+    daily_costs = np.bincount(day[served], weights=cost, minlength=days)
+
+    budget = (configuration.get("cost_management") or {}).get("budget_controls") or {}
+    daily_budget = budget.get("daily_budget_usd")
+    monthly_budget = budget.get("monthly_budget_usd")
+    span = float(trace.timestamps[-1] - start) if count else 0.0
+    projected = total_cost * MONTH_DAYS * DAY / span if span > 0 else None
+    utilization = projected / monthly_budget * 100 if projected is not None and monthly_budget else None
+    alerts = budget.get("cost_alerts") or {}
+    if utilization is None:
+        status = "unknown"
+    elif utilization >= 100:
+        status = "over_budget"
+    elif utilization >= alerts.get("critical_threshold", 90):
+        status = "critical"
+    elif utilization >= alerts.get("warning_threshold", 75):
+        status = "warning"
+    else:
+        status = "ok"
+
+    targets = (((configuration.get("performance_monitoring") or {}).get("performance_metrics") or {})
+               .get("latency_monitoring") or {})
+    percentiles = np.percentile(latency, [50, 95, 99]) if len(latency) else [0.0, 0.0, 0.0]
+
+    return SimulationResult(
+        requests=count,
+        served=int(served.sum()),
+        throttled=int((pending & (chains[:, 0] >= 0)).sum()),
+        unroutable=int((chains[:, 0] < 0).sum()),
+        fallbacks=int((attempts[served] > 0).sum()),
+        total_cost=total_cost,
+        cost_by_model={name: float(model_costs[index]) for index, name in enumerate(names)
+                       if model_requests[index]},
+        requests_by_model={name: int(model_requests[index]) for index, name in enumerate(names)
+                           if model_requests[index]},
+        cost_by_task={str(task): float(task_costs[index]) for index, task in enumerate(tasks)},
+        latency={
+            "mean": float(latency.mean()) if len(latency) else 0.0,
+            "p50": float(percentiles[0]), "p95": float(percentiles[1]), "p99": float(percentiles[2])
+        },
+        latency_targets={key[len("target_"):]: parse_duration(value)
+                         for key, value in targets.items() if key.startswith("target_")},
+        peak_daily_cost=float(daily_costs.max(initial=0.0)),
+        days_over_budget=int((daily_costs > daily_budget).sum()) if daily_budget else 0,
+        projected_monthly_cost=projected,
+        budget_utilization=utilization,
+        budget_status=status
+    )
@@ -0,0 +1,72 @@
+"""
+HUGAI Template Cache
+
+In-memory Jinja2 bytecode cache shared by every template environment in the process.
+Environments that load the same template file (for example one sync manager per
+repository, all using the shared sync-templates) compile it once and reuse the code.
+Jinja2 checks the source checksum on load, so edited templates are recompiled.
+Compiled code depends on the lexer and compiler options of the environment (for
+example trim_blocks), so buckets are keyed by a digest of those options as well.
+
+Kept out of the package namespace so tools without Jinja2 can import hugai_config.
+
+Example:
+    env = Environment(loader=FileSystemLoader("config/sync-templates"),
+                      bytecode_cache=TEMPLATE_BYTECODE_CACHE)
+"""
+
+import hashlib
+import threading
+from typing import Dict, Optional
+
+from jinja2 import BytecodeCache, Environment
+from jinja2.bccache import Bucket
+
+
+def environment_digest(environment: Environment) -> str:
+    """Digest of the environment options that change the compiled code of a template"""
+    options = (
+        environment.block_start_string, environment.block_end_string,
+        environment.variable_start_string, environment.variable_end_string,
+        environment.comment_start_string, environment.comment_end_string,
+        environment.line_statement_prefix, environment.line_comment_prefix,
+        environment.trim_blocks, environment.lstrip_blocks,
+        environment.newline_sequence, environment.keep_trailing_newline,
+        environment.optimized, environment.is_async, environment.finalize is not None,
+        getattr(environment.autoescape, "__qualname__", environment.autoescape),
+        sorted(environment.extensions)
+    )
+    return hashlib.sha1(repr(options).encode("utf-8")).hexdigest()
+
+
+class MemoryBytecodeCache(BytecodeCache):
+    """Process-wide bytecode cache keyed by template name, filename and environment options"""
+
+    def __init__(self):
+        self._bytecode: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def get_bucket(self, environment: Environment, name: str, filename: Optional[str],
+                   source: str) -> Bucket:
+        key = f"{self.get_cache_key(name, filename)}:{environment_digest(environment)}"
+        bucket = Bucket(environment, key, self.get_source_checksum(source))
+        self.load_bytecode(bucket)
+        return bucket
+
+    def load_bytecode(self, bucket: Bucket):
+        with self._lock:
+            bytecode = self._bytecode.get(bucket.key)
+        if bytecode is not None:
+            bucket.bytecode_from_string(bytecode)
+
+    def dump_bytecode(self, bucket: Bucket):
+        bytecode = bucket.bytecode_to_string()
+        with self._lock:
+            self._bytecode[bucket.key] = bytecode
+
+    def clear(self):
+        with self._lock:
+            self._bytecode.clear()
+
+
+TEMPLATE_BYTECODE_CACHE = MemoryBytecodeCache()
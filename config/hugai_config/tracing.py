@@ -0,0 +1,234 @@
+"""
+HUGAI Tooling Tracing
+
+Lightweight span-based tracing for the configuration tools. Spans are context managers
+carrying attributes; finished spans are handed to pluggable exporters that write a
+Chrome trace-event file (for chrome://tracing, Perfetto or speedscope flame views) or
+an OTLP-JSON file (for OpenTelemetry collectors).
+
+When a tracer has no exporters it is disabled and ``span()`` returns a shared no-op
+span, so instrumented code pays only a method call and an attribute check.
+
+The open span stack is a context variable: work handed to a thread pool through
+``contextvars.copy_context().run`` keeps the submitting span as its parent.
+
+Example:
+    tracer = Tracer([ChromeTraceExporter(Path("sync-trace.json"))])
+    with tracer.span("render", config="router-agent") as span:
+        span.set_attribute("template", "agent-doc-template.md")
+    tracer.flush()
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+# Finished spans kept for export, so long watch sessions stay bounded
+MAX_RETAINED_SPANS = 100_000
+
+
+class Span:
+    """A timed operation with attributes"""
+
+    __slots__ = ("name", "attributes", "trace_id", "span_id", "parent_id",
+                 "thread_id", "start_ns", "end_ns", "error", "_tracer")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any],
+                 trace_id: str, parent_id: Optional[str]):
+        self._tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.thread_id = threading.get_ident()
+        self.start_ns = 0
+        self.end_ns = 0
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self._tracer._push(self)
+        self.start_ns = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end_ns = time.time_ns()
+        if exc_type is not None:
+            self.error = f"{exc_type.__name__}: {exc_value}"
+        self._tracer._pop(self)
+        return False
+
+
+class NoopSpan:
+    """Span returned by a disabled tracer"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def __enter__(self) -> "NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NOOP_SPAN = NoopSpan()
+
+
+class Tracer:
+    """Creates spans and forwards finished spans to exporters"""
+
+    def __init__(self, exporters: Optional[Sequence["SpanExporter"]] = None):
+        self.exporters = list(exporters or [])
+        self.enabled = bool(self.exporters)
+        self._finished: Deque[Span] = deque(maxlen=MAX_RETAINED_SPANS)
+        self._stack: contextvars.ContextVar[Tuple[Span, ...]] = \
+            contextvars.ContextVar(f"hugai_span_stack_{id(self)}", default=())
+        self._lock = threading.Lock()
+
+    def span(self, name: str, **attributes):
+        """Start a span; use as a context manager"""
+        if not self.enabled:
+            return NOOP_SPAN
+        stack = self._stack.get()
+        if stack:
+            parent = stack[-1]
+            return Span(self, name, attributes, parent.trace_id, parent.span_id)
+        return Span(self, name, attributes, os.urandom(16).hex(), None)
+
+    def _push(self, span: Span):
+        self._stack.set(self._stack.get() + (span,))
+
+    def _pop(self, span: Span):
+        stack = self._stack.get()
+        if stack and stack[-1] is span:
+            self._stack.set(stack[:-1])
+        with self._lock:
+            self._finished.append(span)
+
+    def finished_spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._finished)
+
+    def flush(self):
+        """Write all finished spans through every exporter"""
+        if not self.enabled:
+            return
+        spans = self.finished_spans()
+        for exporter in self.exporters:
+            exporter.export(spans)
+
+
+class SpanExporter:
+    """Base class for span exporters writing to a file"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def export(self, spans: List[Span]):
+        raise NotImplementedError
+
+    def _write_json(self, data: Dict):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, default=str)
+        os.replace(temp_path, self.path)
+
+
+class ChromeTraceExporter(SpanExporter):
+    """Chrome trace-event format (complete events), viewable as a flame chart"""
+
+    def export(self, spans: List[Span]):
+        pid = os.getpid()
+        events = []
+        for span in spans:
+            args = dict(span.attributes)
+            if span.error:
+                args["error"] = span.error
+            events.append({
+                "name": span.name,
+                "cat": "hugai",
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": args
+            })
+        self._write_json({"traceEvents": events, "displayTimeUnit": "ms"})
+
+
+class OtlpJsonExporter(SpanExporter):
+    """OTLP-JSON file format, as accepted by OpenTelemetry collectors"""
+
+    def __init__(self, path: Path, service_name: str = "hugai-config"):
+        super().__init__(path)
+        self.service_name = service_name
+
+    def _attribute(self, key: str, value: Any) -> Dict:
+        if isinstance(value, bool):
+            typed = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        return {"key": key, "value": typed}
+
+    def export(self, spans: List[Span]):
+        otlp_spans = []
+        for span in spans:
+            otlp_span = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [self._attribute(k, v) for k, v in span.attributes.items()],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1}
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            otlp_spans.append(otlp_span)
+
+        self._write_json({
+            "resourceSpans": [{
+                "resource": {"attributes": [self._attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "hugai_config.tracing"},
+                    "spans": otlp_spans
+                }]
+            }]
+        })
+
+
+EXPORTERS = {
+    "chrome": ChromeTraceExporter,
+    "otlp-json": OtlpJsonExporter
+}
+
+
+def create_tracer(exporter_configs: Sequence[Dict[str, str]], root_dir: Optional[Path] = None) -> Tracer:
+    """Create a tracer from exporter settings such as {"type": "chrome", "path": "trace.json"};
+    relative paths are resolved against ``root_dir`` when given"""
+    exporters = []
+    for exporter_config in exporter_configs:
+        exporter_type = exporter_config.get("type")
+        if exporter_type not in EXPORTERS:
+            raise ValueError(f"Unknown trace exporter: {exporter_type}")
+        path = Path(exporter_config["path"])
+        exporters.append(EXPORTERS[exporter_type](Path(root_dir) / path if root_dir else path))
+    return Tracer(exporters)
@@ -0,0 +1,398 @@
+"""
+HUGAI Vector Memory Index
+
+Local, offline stand-in for the vector database of tools/context-store.yaml
+(``agent_memory.semantic_memory``). Embeddings are L2-normalized and stored in
+memory-mapped files in an index directory, so cosine similarity is a dot product:
+
+    meta.json      dimension, count, capacity, quantization, embedder, IVF lists
+    ids.jsonl      one id per row, in row order
+    vectors.f32    float32 rows, or
+    vectors.i8     int8 rows with one float32 scale per row in scales.f32
+    centroids.npy  IVF centroids and lists.i32 the list of every row (when trained)
+
+Data files are preallocated in doubling capacity and extended in place, so appends
+write only the new rows and never rebuild the index; ``count`` in meta.json is updated
+last and is the commit point.
+
+Search is exact by default: stored rows are scanned in chunks and multiplied with a
+batch of queries at once, keeping the top k per query. int8 quantization stores a
+quarter of the bytes at a small recall cost. For large corpora, train_ivf() clusters
+the rows with spherical k-means into inverted lists; searches then scan only the
+``nprobe`` lists nearest each query, reading every probed list once per batch of
+queries, and appended rows join their nearest list.
+
+Texts are embedded by a pluggable embedder: any object with a ``name``, a
+``dimension`` and ``embed(texts) -> ndarray``. HashingEmbedder is a deterministic
+feature-hashing embedder for tests and offline use.
+
+NumPy is required, so this module is not imported by the package namespace.
+
+Example:
+    index = VectorIndex(Path("memory-index"), embedder=HashingEmbedder(256))
+    index.add(["m1", "m2"], texts=["oauth2 login flow", "retry with backoff"])
+    index.search(texts=["authentication"], k=5)
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+VECTOR_INDEX_FORMAT = 1
+
+# Rows scanned per matrix multiplication in exact search
+SEARCH_CHUNK = 65536
+
+MIN_CAPACITY = 1024
+
+DEFAULT_NPROBE = 8
+KMEANS_ITERATIONS = 10
+# Rows sampled per centroid to train the IVF lists
+KMEANS_SAMPLE_PER_LIST = 64
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+
+
+class HashingEmbedder:
+    """Deterministic embedder hashing words and word bigrams into signed buckets;
+    texts sharing words are similar, the same text always maps to the same vector"""
+
+    def __init__(self, dimension: int = 256):
+        self.dimension = dimension
+        self.name = f"hashing-{dimension}"
+
+    def _features(self, text: str) -> List[str]:
+        words = _TOKEN_PATTERN.findall(text.lower())
+        return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+    def embed(self, texts: Iterable[str]) -> np.ndarray:
+        texts = list(texts)
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+                vectors[row, digest % self.dimension] += 1.0 if digest >> 63 else -1.0
+        return vectors
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Rows scaled to unit length as float32; zero rows stay zero"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def quantize(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization; returns (codes, scales)"""
+    scales = np.abs(vectors).max(axis=1) / 127
+    scales[scales == 0] = 1
+    codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def _top_k(scores: np.ndarray, rows: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Best k (score, row) per query of a (queries, candidates) score matrix"""
+    if scores.shape[1] > k:
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(scores, best, axis=1)
+        rows = np.take_along_axis(np.broadcast_to(rows, (len(scores), len(rows))) if rows.ndim == 1
+                                  else rows, best, axis=1)
+    elif rows.ndim == 1:
+        rows = np.broadcast_to(rows, scores.shape)
+    return scores, rows
+
+
+class VectorIndex:
+    """Memory-mapped cosine index with optional int8 codes and IVF lists"""
+
+    def __init__(self, path: Path, dimension: Optional[int] = None, quantized: bool = False,
+                 embedder: Any = None):
+        self.path = Path(path)
+        self.embedder = embedder
+        self._lock = threading.RLock()
+        meta_file = self.path / "meta.json"
+
+        if meta_file.exists():
+            meta = json.loads(meta_file.read_text())
+            if meta.get("format") != VECTOR_INDEX_FORMAT:
+                raise ValueError(f"Unsupported vector index format in {self.path}: {meta.get('format')}")
+            if dimension is not None and dimension != meta["dimension"]:
+                raise ValueError(f"Index {self.path} has dimension {meta['dimension']}, not {dimension}")
+        else:
+            dimension = dimension or (embedder.dimension if embedder is not None else None)
+            if not dimension:
+                raise ValueError(f"No vector index in {self.path}; a dimension is needed to create one")
+            meta = {"format": VECTOR_INDEX_FORMAT, "dimension": dimension, "count": 0, "capacity": 0,
+                    "ids_size": 0, "quantized": quantized, "nlist": 0,
+                    "embedder": embedder.name if embedder is not None else None}
+            self.path.mkdir(parents=True, exist_ok=True)
+            (self.path / "ids.jsonl").touch()
+
+        if embedder is not None:
+            if embedder.dimension != meta["dimension"]:
+                raise ValueError(f"Embedder {embedder.name} has dimension {embedder.dimension}, "
+                                 f"index {self.path} has {meta['dimension']}")
+            if meta.get("embedder") and meta["embedder"] != embedder.name:
+                raise ValueError(f"Index {self.path} was built with embedder {meta['embedder']}, "
+                                 f"not {embedder.name}")
+
+        self.dimension: int = meta["dimension"]
+        self.quantized: bool = meta["quantized"]
+        self._meta = meta
+        self.count: int = meta["count"]
+
+        with open(self.path / "ids.jsonl") as f:
+            self.ids: List[str] = [json.loads(line) for _, line in zip(range(self.count), f)]
+        self._rows = {row_id: row for row, row_id in enumerate(self.ids)}
+
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: List[List[np.ndarray]] = []
+        self._map_files()
+        if meta["nlist"]:
+            self._centroids = np.load(self.path / "centroids.npy")
+            self._build_lists(np.asarray(self._assignments[:self.count]))
+        self._write_meta()
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def nlist(self) -> int:
+        """Number of IVF lists, 0 before train_ivf()"""
+        return self._meta["nlist"]
+
+    # Storage
+
+    def _files(self) -> List[Tuple[str, Any, int]]:
+        """(file, dtype, values per row) of every row-aligned data file"""
+        files = [("vectors.i8", np.int8, self.dimension), ("scales.f32", np.float32, 1)] if self.quantized \
+            else [("vectors.f32", np.float32, self.dimension)]
+        if self._meta["nlist"]:
+            files.append(("lists.i32", np.int32, 1))
+        return files
+
+    def _map_files(self):
+        capacity = self._meta["capacity"]
+        maps = {}
+        for name, dtype, width in self._files():
+            file = self.path / name
+            size = capacity * width * np.dtype(dtype).itemsize
+            with open(file, "ab") as f:
+                if f.tell() < size:
+                    f.truncate(size)
+            maps[name] = np.memmap(file, dtype=dtype, mode="r+", shape=(capacity, width)) \
+                if capacity else np.zeros((0, width), dtype=dtype)
+        self._maps = maps
+        if self.quantized:
+            self._codes, self._scales = maps["vectors.i8"], maps["scales.f32"][:, 0]
+        else:
+            self._vectors = maps["vectors.f32"]
+        self._assignments = maps["lists.i32"][:, 0] if "lists.i32" in maps else None
+
+    def _flush(self):
+        for array in self._maps.values():
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    def _reserve(self, rows: int):
+        """Grow the data files to hold ``rows`` rows, doubling the capacity"""
+        if rows <= self._meta["capacity"]:
+            return
+        self._flush()
+        capacity = max(MIN_CAPACITY, self._meta["capacity"])
+        while capacity < rows:
+            capacity *= 2
+        self._meta["capacity"] = capacity
+        self._map_files()
+
+    def _write_meta(self):
+        self._meta["count"] = self.count
+        temp = self.path / "meta.json.tmp"
+        temp.write_text(json.dumps(self._meta, indent=2))
+        os.replace(temp, self.path / "meta.json")
+
+    def _block(self, start: int, end: int) -> np.ndarray:
+        """Stored rows [start, end) as float32"""
+        if self.quantized:
+            return self._codes[start:end].astype(np.float32) * self._scales[start:end, None]
+        return np.asarray(self._vectors[start:end])
+
+    def _gather(self, rows: np.ndarray) -> np.ndarray:
+        if self.quantized:
+            return self._codes[rows].astype(np.float32) * self._scales[rows, None]
+        return self._vectors[rows]
+
+    # Writes
+
+    def _embed(self, vectors: Optional[np.ndarray], texts: Optional[Sequence[str]]) -> np.ndarray:
+        if vectors is None:
+            if texts is None:
+                raise ValueError("Either vectors or texts are required")
+            if self.embedder is None:
+                raise ValueError("Embedding texts needs an embedder")
+            vectors = self.embedder.embed(texts)
+        vectors = normalize(vectors)
+        if vectors.shape[1] != self.dimension:
+            raise ValueError(f"Vectors have dimension {vectors.shape[1]}, index has {self.dimension}")
+        return vectors
+
+    def add(self, ids: Sequence[str], vectors: Optional[np.ndarray] = None,
+            texts: Optional[Sequence[str]] = None) -> int:
+        """Append rows by id, from vectors or from texts with the embedder; returns the
+        new row count. Ids must be new."""
+        vectors = self._embed(vectors, texts)
+        ids = [str(row_id) for row_id in ids]
+        if len(ids) != len(vectors):
+            raise ValueError(f"{len(ids)} ids for {len(vectors)} vectors")
+        if len(set(ids)) != len(ids):
+            raise ValueError("Duplicate ids in one add()")
+
+        with self._lock:
+            existing = [row_id for row_id in ids if row_id in self._rows]
+            if existing:
+                raise ValueError(f"Ids already indexed: {', '.join(existing[:5])}")
+            start, end = self.count, self.count + len(ids)
+            self._reserve(end)
+            if self.quantized:
+                self._codes[start:end], self._scales[start:end] = quantize(vectors)
+            else:
+                self._vectors[start:end] = vectors
+            if self._centroids is not None:
+                assignments = self._assign(vectors)
+                self._assignments[start:end] = assignments
+                self._extend_lists(assignments, start)
+            self._flush()
+
+            with open(self.path / "ids.jsonl", "r+b") as f:
+                # Drop ids of an append that never reached meta.json
+                f.truncate(self._meta["ids_size"])
+                f.seek(0, os.SEEK_END)
+                f.write("".join(json.dumps(row_id) + "\n" for row_id in ids).encode())
+                self._meta["ids_size"] = f.tell()
+            self.ids.extend(ids)
+            self._rows.update((row_id, start + offset) for offset, row_id in enumerate(ids))
+            self.count = end
+            self._write_meta()
+        return self.count
+
+    # IVF
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self._centroids.T, axis=1).astype(np.int32)
+
+    def _build_lists(self, assignments: np.ndarray):
+        order = np.argsort(assignments, kind="stable")
+        bounds = np.searchsorted(assignments[order], np.arange(len(self._centroids) + 1))
+        self._lists = [[order[bounds[n]:bounds[n + 1]]] for n in range(len(self._centroids))]
+
+    def _extend_lists(self, assignments: np.ndarray, start: int):
+        order = np.argsort(assignments, kind="stable")
+        bounds = np.searchsorted(assignments[order], np.arange(len(self._centroids) + 1))
+        for number in np.unique(assignments):
+            self._lists[number].append(order[bounds[number]:bounds[number + 1]] + start)
+
+    def train_ivf(self, nlist: Optional[int] = None, seed: int = 0) -> int:
+        """Cluster the stored rows into ``nlist`` inverted lists (default: the square
+        root of the row count) with spherical k-means; returns the list count"""
+        with self._lock:
+            if not self.count:
+                raise ValueError("Cannot train IVF lists on an empty index")
+            nlist = max(1, min(nlist or int(np.sqrt(self.count)), self.count))
+            rng = np.random.default_rng(seed)
+            sample_size = min(self.count, nlist * KMEANS_SAMPLE_PER_LIST)
+            sample = self._gather(np.sort(rng.choice(self.count, sample_size, replace=False)))
+            centroids = sample[rng.choice(sample_size, nlist, replace=False)]
+            for _ in range(KMEANS_ITERATIONS):
+                labels = np.argmax(sample @ centroids.T, axis=1)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, labels, sample)
+                empty = ~np.bincount(labels, minlength=nlist).astype(bool)
+                sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+                centroids = normalize(sums)
+
+            self._centroids = centroids
+            np.save(self.path / "centroids.npy", centroids)
+            self._meta["nlist"] = nlist
+            self._map_files()
+            for start in range(0, self.count, SEARCH_CHUNK):
+                end = min(start + SEARCH_CHUNK, self.count)
+                self._assignments[start:end] = self._assign(self._block(start, end))
+            self._flush()
+            self._build_lists(np.asarray(self._assignments[:self.count]))
+            self._write_meta()
+            return nlist
+
+    # Search
+
+    def search(self, vectors: Optional[np.ndarray] = None, texts: Optional[Sequence[str]] = None,
+               k: int = 10, nprobe: Optional[int] = None,
+               min_score: Optional[float] = None) -> List[List[Tuple[str, float]]]:
+        """Top k (id, cosine similarity) per query, best first. With trained IVF lists
+        and ``nprobe``, only the nprobe nearest lists are scanned; otherwise the search
+        is exact."""
+        queries = self._embed(vectors, texts)
+        with self._lock:
+            count = self.count
+            k = min(k, count)
+            if not k:
+                return [[] for _ in range(len(queries))]
+            if nprobe and self._centroids is not None and nprobe < len(self._centroids):
+                results = self._search_lists(queries, k, nprobe)
+            else:
+                results = self._search_exact(queries, k, count)
+
+        hits = []
+        for scores, rows in results:
+            order = np.argsort(-scores)
+            hits.append([(self.ids[rows[n]], float(scores[n])) for n in order
+                         if min_score is None or scores[n] >= min_score])
+        return hits
+
+    def _search_exact(self, queries: np.ndarray, k: int, count: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+        best_rows = np.zeros((len(queries), 0), dtype=np.int64)
+        for start in range(0, count, SEARCH_CHUNK):
+            end = min(start + SEARCH_CHUNK, count)
+            scores = queries @ self._block(start, end).T
+            scores, rows = _top_k(scores, np.arange(start, end), k)
+            best_scores, best_rows = _top_k(np.concatenate([best_scores, scores], axis=1),
+                                            np.concatenate([best_rows, rows], axis=1), k)
+        return list(zip(best_scores, best_rows))
+
+    def _list_rows(self, number: int) -> np.ndarray:
+        """Rows of an IVF list, merging the chunks appended since the last search"""
+        if len(self._lists[number]) > 1:
+            self._lists[number] = [np.concatenate(self._lists[number])]
+        return self._lists[number][0]
+
+    def _search_lists(self, queries: np.ndarray, k: int, nprobe: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        # Group the queries by probed list, so every probed list is read once per batch
+        # and scored against all of its queries in one matrix multiplication
+        probes = np.argpartition(-(queries @ self._centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+        pairs = np.argsort(probes, axis=None, kind="stable")
+        lists = probes.reshape(-1)[pairs]
+        bounds = np.flatnonzero(np.r_[True, lists[1:] != lists[:-1], True])
+
+        best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        best_rows = np.full((len(queries), k), -1, dtype=np.int64)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            rows = self._list_rows(lists[start])
+            if not len(rows):
+                continue
+            members = pairs[start:end] // nprobe
+            scores, found = _top_k(queries[members] @ self._gather(rows).T, rows, k)
+            best_scores[members], best_rows[members] = _top_k(
+                np.concatenate([best_scores[members], scores], axis=1),
+                np.concatenate([best_rows[members], found], axis=1), k
+            )
+
+        # Queries whose probed lists hold fewer than k rows keep only the rows found
+        return [(scores[rows >= 0], rows[rows >= 0]) for scores, rows in zip(best_scores, best_rows)]
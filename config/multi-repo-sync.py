@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+HUGAI Multi-Repository Synchronization Driver
+
+This script runs configuration-documentation synchronization across many repositories
+from a single process. Jobs are taken from a SQLite work queue by a bounded pool of
+workers, so interpreter startup, imports, compiled templates and compiled schemas are
+shared by every repository instead of being repeated per run.
+
+Features:
+- One ConfigDocSyncManager job per repository root
+- Bounded worker pool over a persistent SQLite work queue
+- Shared template bytecode and schema validators across jobs
+- Resumable after interruption; finished repositories are not synced again
+- One aggregated report for all repositories
+
+Usage:
+    python multi-repo-sync.py [<repo>...] [--repos-file <file>] [--workers <n>] [--resume]
+
+Examples:
+    # Sync three repositories with four workers
+    python multi-repo-sync.py ../billing ../search ../gateway --workers 4
+
+    # Sync every repository listed in a file (one root per line)
+    python multi-repo-sync.py --repos-file repos.txt --report sync-report.json
+
+    # Continue an interrupted run, skipping repositories that already finished
+    python multi-repo-sync.py --repos-file repos.txt --resume
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Name under which the sync script is registered in sys.modules
+SYNC_MODULE_NAME = "hugai_sync_automation"
+
+
+def load_sync_module():
+    """Load sync-automation.py, which is not importable by name due to its filename"""
+    module = sys.modules.get(SYNC_MODULE_NAME)
+    if module is None:
+        path = Path(__file__).parent / "sync-automation.py"
+        spec = importlib.util.spec_from_file_location(SYNC_MODULE_NAME, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[SYNC_MODULE_NAME] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+class SyncJobQueue:
+    """Persistent work queue of repository sync jobs, backed by SQLite"""
+
+    def __init__(self, queue_file: Path):
+        self.queue_file = Path(queue_file)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.queue_file), check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                root TEXT PRIMARY KEY,
+                position INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                result TEXT,
+                started_at TEXT,
+                finished_at TEXT
+            )"""
+        )
+        self._conn.commit()
+
+    def enqueue(self, roots: List[str], resume: bool = False):
+        """Queue repository roots; without resume, any previous run is discarded"""
+        with self._lock:
+            if not resume:
+                self._conn.execute("DELETE FROM jobs")
+
+            # Jobs interrupted while running are retried
+            self._conn.execute("UPDATE jobs SET status = 'pending' WHERE status = 'running'")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO jobs (root, position) VALUES (?, ?)",
+                [(root, position) for position, root in enumerate(roots)]
+            )
+            self._conn.commit()
+
+    def claim(self) -> Optional[str]:
+        """Take the next pending job, or None when the queue is drained"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT root FROM jobs WHERE status = 'pending' ORDER BY position LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = ? WHERE root = ?",
+                (datetime.now().isoformat(), row[0])
+            )
+            self._conn.commit()
+            return row[0]
+
+    def complete(self, root: str, status: str, result: Dict):
+        """Record the outcome of a job"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, finished_at = ? WHERE root = ?",
+                (status, json.dumps(result), datetime.now().isoformat(), root)
+            )
+            self._conn.commit()
+
+    def results(self) -> List[Dict]:
+        """All jobs with their outcome, in queue order"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT root, status, attempts, result FROM jobs ORDER BY position"
+            ).fetchall()
+        return [
+            {
+                "root": root,
+                "status": status,
+                "attempts": attempts,
+                **(json.loads(result) if result else {})
+            }
+            for root, status, attempts, result in rows
+        ]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class MultiRepoSyncDriver:
+    """Runs ConfigDocSyncManager jobs for many repositories on a bounded worker pool"""
+
+    def __init__(self, queue: SyncJobQueue, workers: int = 4, config_dir: str = "config",
+                 docs_dir: str = "docs", dry_run: bool = False):
+        self.queue = queue
+        self.workers = max(1, workers)
+        self.config_dir = config_dir
+        self.docs_dir = docs_dir
+        self.dry_run = dry_run
+        self.sync_module = load_sync_module()
+        self._print_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def log_message(self, message: str):
+        """Print a progress message without interleaving worker output"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._print_lock:
+            print(f"[{timestamp}] {message}")
+
+    def run_job(self, root: str) -> Dict:
+        """Synchronize one repository and return its results"""
+        root_dir = Path(root)
+        config_dir = root_dir / self.config_dir
+        if not config_dir.is_dir():
+            raise FileNotFoundError(f"Configuration directory not found: {config_dir}")
+
+        manager = self.sync_module.ConfigDocSyncManager(
+            str(config_dir), str(root_dir / self.docs_dir), str(root_dir)
+        )
+
+        # Keep per-repository logs in the repository, off the shared console
+        channels = manager.sync_config["notifications"]["channels"]
+        manager.sync_config["notifications"]["channels"] = [c for c in channels if c != "console"]
+
+        return manager.sync_all(self.dry_run)
+
+    def worker(self):
+        """Process jobs until the queue is drained"""
+        while not self._stop.is_set():
+            root = self.queue.claim()
+            if root is None:
+                return
+
+            start = time.perf_counter()
+            try:
+                results = self.run_job(root)
+                status = "failed" if results["failed"] else "done"
+                outcome = {**results, "duration": round(time.perf_counter() - start, 3)}
+                icon = "❌" if results["failed"] else "✅"
+                self.log_message(
+                    f"{icon} {root}: {results['success']} success, {results['failed']} failed, "
+                    f"{results['skipped']} skipped ({outcome['duration']}s)"
+                )
+            except Exception as e:
+                status = "error"
+                outcome = {"error": str(e), "duration": round(time.perf_counter() - start, 3)}
+                self.log_message(f"❌ {root}: {e}")
+
+            self.queue.complete(root, status, outcome)
+
+    def run(self) -> Dict:
+        """Drain the queue on the worker pool and return the aggregated report"""
+        start = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hugai-sync")
+        futures = [executor.submit(self.worker) for _ in range(self.workers)]
+        try:
+            for future in futures:
+                future.result()
+        except KeyboardInterrupt:
+            # Let running jobs finish and record their outcome, but claim no new ones
+            self._stop.set()
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+        return self.build_report(time.perf_counter() - start)
+
+    def build_report(self, duration: float) -> Dict:
+        """Aggregate the results of every job in the queue, including resumed ones"""
+        repositories = self.queue.results()
+        totals = {"success": 0, "failed": 0, "skipped": 0}
+        for repository in repositories:
+            for key in totals:
+                totals[key] += repository.get(key, 0)
+
+        statuses = [repository["status"] for repository in repositories]
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "duration": round(duration, 3),
+            "workers": self.workers,
+            "dry_run": self.dry_run,
+            "repositories": {
+                "total": len(repositories),
+                "done": statuses.count("done"),
+                "failed": statuses.count("failed"),
+                "error": statuses.count("error"),
+                "pending": statuses.count("pending") + statuses.count("running")
+            },
+            "files": totals,
+            "results": repositories
+        }
+
+
+def read_repo_roots(repos: List[str], repos_file: Optional[str]) -> List[str]:
+    """Collect repository roots from the command line and a roots file, without duplicates"""
+    roots = list(repos)
+    if repos_file:
+        with open(repos_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    roots.append(line)
+
+    return list(dict.fromkeys(os.path.abspath(root) for root in roots))
+
+
+def print_report(report: Dict):
+    """Print the aggregated report"""
+    repositories = report["repositories"]
+    files = report["files"]
+
+    print("\n📊 Multi-Repository Sync Report")
+    print("=" * 50)
+    print(f"Repositories: {repositories['total']} "
+          f"({repositories['done']} done, {repositories['failed']} failed, "
+          f"{repositories['error']} errors, {repositories['pending']} pending)")
+    print(f"Files: {files['success']} success, {files['failed']} failed, {files['skipped']} skipped")
+    print(f"Duration: {report['duration']}s with {report['workers']} workers")
+
+    problems = [r for r in report["results"] if r["status"] in ("failed", "error")]
+    if problems:
+        print("\n❌ Repositories needing attention:")
+        for repository in problems:
+            detail = repository.get("error") or f"{repository.get('failed', 0)} files failed"
+            print(f"  • {repository['root']}: {detail}")
+
+
+def main():
+    """Main function to handle command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="HUGAI Multi-Repository Synchronization Driver",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        "repos",
+        nargs="*",
+        help="Repository root directories to synchronize"
+    )
+
+    parser.add_argument(
+        "--repos-file", "-f",
+        type=str,
+        help="File listing repository roots, one per line"
+    )
+
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Number of concurrent sync jobs (default: min(4, CPUs))"
+    )
+
+    parser.add_argument(
+        "--queue",
+        type=str,
+        default=".hugai-sync-queue.sqlite",
+        help="SQLite work queue file (default: .hugai-sync-queue.sqlite)"
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume the previous run, skipping repositories that already finished"
+    )
+
+    parser.add_argument(
+        "--dry-run", "-d",
+        action="store_true",
+        help="Show what would be changed without making changes"
+    )
+
+    parser.add_argument(
+        "--config-dir",
+        type=str,
+        default="config",
+        help="Configuration directory within each repository (default: config)"
+    )
+
+    parser.add_argument(
+        "--docs-dir",
+        type=str,
+        default="docs",
+        help="Documentation directory within each repository (default: docs)"
+    )
+
+    parser.add_argument(
+        "--report",
+        type=str,
+        help="Write the aggregated report as JSON to this file"
+    )
+
+    args = parser.parse_args()
+
+    roots = read_repo_roots(args.repos, args.repos_file)
+    if not roots and not args.resume:
+        print("❌ No repositories given. Pass repository roots or --repos-file.")
+        sys.exit(1)
+
+    queue = SyncJobQueue(Path(args.queue))
+    queue.enqueue(roots, resume=args.resume)
+
+    driver = MultiRepoSyncDriver(queue, args.workers, args.config_dir, args.docs_dir, args.dry_run)
+    driver.log_message(f"🚀 Synchronizing repositories with {driver.workers} workers...")
+
+    try:
+        report = driver.run()
+    except KeyboardInterrupt:
+        driver.log_message("⏹️  Interrupted. Continue with --resume.")
+        queue.close()
+        sys.exit(130)
+
+    queue.close()
+    print_report(report)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📄 Report written to {args.report}")
+
+    # Exit with error code if any repository failed
+    if report["repositories"]["failed"] or report["repositories"]["error"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
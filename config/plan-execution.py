@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+HUGAI Execution Planner
+
+This script turns the dependency graphs declared by the configurations into execution
+schedules: maximal parallel waves, the critical path, and the makespan under the
+orchestrator's concurrency limit. Durations are the configured timeouts, so makespans
+are upper bounds. Dependency cycles are reported and the tasks caught in or behind them
+are listed as blocked.
+
+Two graphs can be planned:
+  • workflow: the staged workflow definitions of tools/workflow-orchestrator.yaml
+    (task and stage depends_on, task timeouts, the workflow task_timeout as default)
+  • catalog:  configurations of one type from index.yaml (declared dependencies, each
+    configuration's own timeout, --default-timeout otherwise)
+
+Usage:
+    python plan-execution.py [--workflow <name>] [--parallelism <n>] [--json]
+    python plan-execution.py --catalog [--type <type>] [--default-timeout <duration>]
+
+Examples:
+    # Plan the HUGAI development workflow with the orchestrator's parallelism
+    python plan-execution.py
+
+    # Size agent concurrency from the agent dependency graph
+    python plan-execution.py --catalog --type agent
+
+    # Same, assuming 4 workers
+    python plan-execution.py --catalog --type agent --parallelism 4
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError as e:
+    print(f"❌ Missing required dependencies: {e}")
+    print("💡 Install with: pip install pyyaml")
+    sys.exit(1)
+
+from hugai_config.documents import load_yaml
+from hugai_config.planner import (
+    ExecutionPlan, catalog_tasks, find_parallelism, find_workflows, format_duration,
+    parse_duration, plan_execution, workflow_tasks
+)
+from hugai_config.query import CatalogGraph, UnknownConfigurationError
+
+# Used when no timeout is configured anywhere for a catalog configuration
+DEFAULT_TIMEOUT = "2h"
+
+
+def print_plan(title: str, plan: ExecutionPlan, durations: dict):
+    """Print a plan in the emoji style of the other tools"""
+    print(f"\n🗓️  {title}")
+    print("=" * 50)
+    limit = plan.parallelism if plan.parallelism is not None else "unbounded"
+    print(f"Tasks: {len(durations)}  Waves: {len(plan.waves)}  "
+          f"Peak parallelism: {plan.peak_parallelism}  Parallelism limit: {limit}")
+
+    for number, wave in enumerate(plan.waves, 1):
+        longest = max(durations[task] for task in wave)
+        print(f"\n🌊 Wave {number} ({len(wave)} tasks, up to {format_duration(longest)})")
+        for task in wave:
+            slack = plan.slack[task]
+            marker = "🔥" if task in plan.critical_path else "  "
+            note = f", slack {format_duration(slack)}" if slack else ""
+            print(f"   {marker} {task} ({format_duration(durations[task])}{note})")
+
+    print(f"\n🔥 Critical path ({format_duration(plan.critical_path_length)}):")
+    if plan.critical_path:
+        print("   " + " → ".join(plan.critical_path))
+    print(f"⏱️  Makespan: {format_duration(plan.makespan)} "
+          f"(barrier waves: {format_duration(plan.wave_makespan)})")
+
+    for cycle in plan.cycles:
+        print(f"⚠️  Cycle: {' → '.join(cycle + cycle[:1])}")
+    if plan.blocked:
+        print(f"❌ Blocked by cycles ({len(plan.blocked)}): {', '.join(plan.blocked)}")
+
+
+def plan_to_dict(plan: ExecutionPlan, durations: dict) -> dict:
+    """JSON-serializable form of a plan"""
+    data = plan._asdict()
+    data["durations"] = durations
+    return data
+
+
+def positive_int(value: str) -> int:
+    """argparse type accepting integers of at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main():
+    """Main function to handle command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="HUGAI Execution Planner",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        "--config-dir",
+        type=str,
+        default=str(Path(__file__).parent),
+        help="Configuration directory (default: the directory of this script)"
+    )
+
+    parser.add_argument(
+        "--catalog", "-c",
+        action="store_true",
+        help="Plan configurations from index.yaml instead of the orchestrator workflows"
+    )
+
+    parser.add_argument(
+        "--type",
+        type=str,
+        default="agent",
+        help="Configuration type to plan with --catalog (default: agent)"
+    )
+
+    parser.add_argument(
+        "--workflow", "-w",
+        type=str,
+        help="Workflow definition to plan (default: all)"
+    )
+
+    parser.add_argument(
+        "--parallelism", "-p",
+        type=positive_int,
+        help="Maximum concurrent tasks (default: the orchestrator's parallelism setting)"
+    )
+
+    parser.add_argument(
+        "--default-timeout",
+        type=str,
+        default=DEFAULT_TIMEOUT,
+        help=f"Duration of catalog configurations without a timeout (default: {DEFAULT_TIMEOUT})"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the plans as JSON"
+    )
+
+    args = parser.parse_args()
+
+    config_dir = Path(args.config_dir)
+    orchestrator_file = config_dir / "tools" / "workflow-orchestrator.yaml"
+
+    try:
+        orchestrator = load_yaml(orchestrator_file) or {}
+        default_timeout = parse_duration(args.default_timeout)
+    except (OSError, yaml.YAMLError) as e:
+        print(f"❌ Error loading {orchestrator_file}: {e}")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    parallelism = args.parallelism if args.parallelism is not None else find_parallelism(orchestrator)
+
+    plans = {}
+    try:
+        if args.catalog:
+            graph = CatalogGraph.load(config_dir / "index.yaml")
+            durations, dependencies = catalog_tasks(graph, config_dir.parent, args.type, default_timeout)
+            plans[f"{args.type} dependencies"] = (durations, dependencies)
+        else:
+            workflows = find_workflows(orchestrator)
+            if args.workflow:
+                if args.workflow not in workflows:
+                    print(f"❌ Unknown workflow: {args.workflow} (available: {', '.join(workflows)})")
+                    sys.exit(1)
+                workflows = {args.workflow: workflows[args.workflow]}
+            for name, definition in workflows.items():
+                plans[name] = workflow_tasks(definition)
+    except (OSError, yaml.YAMLError) as e:
+        print(f"❌ Error loading catalog: {e}")
+        sys.exit(1)
+    except (UnknownConfigurationError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    try:
+        results = {
+            name: (plan_execution(durations, dependencies, parallelism), durations)
+            for name, (durations, dependencies) in plans.items()
+        }
+    except ValueError as e:
+        # A parallelism setting below 1 in the orchestrator configuration
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps({name: plan_to_dict(plan, durations)
+                          for name, (plan, durations) in results.items()}, indent=2))
+    else:
+        for name, (plan, durations) in results.items():
+            print_plan(name, plan, durations)
+
+    if any(plan.blocked for plan, _ in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+HUGAI Configuration Catalog Query
+
+This script answers dependency questions over the config/index.yaml catalog: what a
+configuration depends on, what depends on it, the blast radius of changing it, and the
+shortest dependency chain between two configurations. Queries run against an in-memory
+graph with bitset-encoded transitive closures (see hugai_config/query.py).
+
+Usage:
+    python query-config.py --deps <name> [--transitive] [--type <type>]
+    python query-config.py --rdeps <name> [--transitive] [--type <type>]
+    python query-config.py --impact <name> [--type <type>]
+    python query-config.py --path <from> <to>
+    python query-config.py --list [--type <type>]
+
+Examples:
+    # Agents that transitively depend on the security agent
+    python query-config.py --rdeps security-agent --transitive --type agent
+
+    # Everything affected by a change to the context store
+    python query-config.py --impact context-store
+
+    # How the maintenance phase reaches the context store
+    python query-config.py --path maintenance context-store
+
+    # All tool configurations, as JSON
+    python query-config.py --list --type tool --json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError as e:
+    print(f"❌ Missing required dependencies: {e}")
+    print("💡 Install with: pip install pyyaml")
+    sys.exit(1)
+
+from hugai_config.query import CatalogGraph, UnknownConfigurationError
+
+
+def run_query(graph: CatalogGraph, args) -> tuple:
+    """Run the selected query and return (title, result)"""
+    if args.deps:
+        kind = "Transitive dependencies" if args.transitive else "Dependencies"
+        return f"{kind} of {args.deps}", graph.dependencies(args.deps, args.transitive, args.type)
+    if args.rdeps:
+        kind = "Transitive dependents" if args.transitive else "Dependents"
+        return f"{kind} of {args.rdeps}", graph.dependents(args.rdeps, args.transitive, args.type)
+    if args.impact:
+        return f"Impact of changing {args.impact}", graph.impact(args.impact, args.type)
+    if args.path:
+        source, target = args.path
+        return f"Shortest path from {source} to {target}", graph.shortest_path(source, target)
+    return f"Configurations{f' of type {args.type}' if args.type else ''}", graph.select(args.type)
+
+
+def main():
+    """Main function to handle command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="HUGAI Configuration Catalog Query",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    query = parser.add_mutually_exclusive_group(required=True)
+    query.add_argument(
+        "--deps", "-d",
+        metavar="NAME",
+        help="Configurations NAME depends on"
+    )
+
+    query.add_argument(
+        "--rdeps", "-r",
+        metavar="NAME",
+        help="Configurations that depend on NAME"
+    )
+
+    query.add_argument(
+        "--impact", "-i",
+        metavar="NAME",
+        help="Configurations affected by a change to NAME (transitive dependents)"
+    )
+
+    query.add_argument(
+        "--path", "-p",
+        nargs=2,
+        metavar=("FROM", "TO"),
+        help="Shortest dependency chain from FROM to TO"
+    )
+
+    query.add_argument(
+        "--list", "-l",
+        action="store_true",
+        help="List configurations"
+    )
+
+    parser.add_argument(
+        "--transitive", "-t",
+        action="store_true",
+        help="Follow dependencies transitively for --deps and --rdeps"
+    )
+
+    parser.add_argument(
+        "--type",
+        type=str,
+        help="Only report configurations of this type (agent, lifecycle, tool, llm)"
+    )
+
+    parser.add_argument(
+        "--index",
+        type=str,
+        default=str(Path(__file__).parent / "index.yaml"),
+        help="Catalog file (default: index.yaml next to this script)"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the result as JSON"
+    )
+
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="Report graph load and query times"
+    )
+
+    args = parser.parse_args()
+
+    load_start = time.perf_counter()
+    try:
+        graph = CatalogGraph.load(Path(args.index))
+    except (OSError, yaml.YAMLError) as e:
+        print(f"❌ Error loading catalog {args.index}: {e}")
+        sys.exit(1)
+    load_time = time.perf_counter() - load_start
+
+    query_start = time.perf_counter()
+    try:
+        title, result = run_query(graph, args)
+    except UnknownConfigurationError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    query_time = time.perf_counter() - query_start
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    elif result is None:
+        print(f"🔍 {title}: not reachable")
+    else:
+        separator = " → " if args.path else "\n  • "
+        print(f"🔍 {title} ({len(result)}):")
+        if result:
+            print(("  " if args.path else "  • ") + separator.join(result))
+
+    if args.timing:
+        print(f"⏱️  Loaded {len(graph.nodes)} configurations in {load_time * 1000:.1f}ms, "
+              f"query took {query_time * 1e6:.1f}µs", file=sys.stderr)
+
+    if result is None:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
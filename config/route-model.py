@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+HUGAI Model Router
+
+This script compiles the model selection rules of llms/model-llm.yaml (weighted
+routing criteria, task-based routing, fallback chains and routing rules, see
+hugai_config/routing.py) and resolves the primary and fallback models of a request.
+Without --task it prints the compiled routing table.
+
+Usage:
+    python route-model.py [--config <file>] [--json]
+    python route-model.py --task <task> [--input-tokens <n>] [--output-tokens <n>] [--unavailable <models>]
+    python route-model.py --benchmark <requests> [--seed <n>]
+
+Examples:
+    # Show the compiled candidates of every task type
+    python route-model.py
+
+    # Route a 50k token code generation request while Anthropic is down
+    python route-model.py --task code_generation --input-tokens 50000 \\
+        --unavailable claude_3_5_sonnet,claude_3_haiku
+
+    # Measure routing throughput on 100000 synthetic requests
+    python route-model.py --benchmark 100000
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError as e:
+    print(f"❌ Missing required dependencies: {e}")
+    print("💡 Install with: pip install pyyaml")
+    sys.exit(1)
+
+from hugai_config.documents import load_yaml
+from hugai_config.routing import RoutingEngine
+
+# Request mix of the synthetic benchmark stream: input token sizes and how often
+# a model is reported unavailable
+BENCHMARK_INPUT_TOKENS = (200, 2000, 8000, 30000, 120000)
+BENCHMARK_OUTAGE_RATE = 0.1
+
+
+def print_table(engine: RoutingEngine):
+    """Print the scores and the compiled candidates of every task type"""
+    print("\n🧭 Model scores")
+    print("=" * 50)
+    for name in engine.by_score:
+        profile = engine.models[name]
+        print(f"   {engine.scores[name]:.3f}  {name:<20} {profile.provider:<13} "
+              f"{profile.context_window:>7} tokens")
+
+    print(f"\n📋 Task routing (max {engine.max_fallbacks} fallbacks)")
+    print("=" * 50)
+    for task in engine.task_types:
+        print(f"   {task}: {' → '.join(engine.candidates(task))}")
+    print(f"   (other tasks): {' → '.join(engine.candidates(''))}")
+
+
+def synthetic_requests(engine: RoutingEngine, count: int, seed: int) -> list:
+    """Seeded stream of (task type, input tokens, unavailable models)"""
+    rng = random.Random(seed)
+    tasks = engine.task_types + ["unrouted_task"]
+    models = list(engine.models)
+    requests = []
+    for _ in range(count):
+        unavailable = frozenset([rng.choice(models)]) if rng.random() < BENCHMARK_OUTAGE_RATE else frozenset()
+        requests.append((rng.choice(tasks), rng.choice(BENCHMARK_INPUT_TOKENS), unavailable))
+    return requests
+
+
+def benchmark(configuration: dict, count: int, seed: int):
+    """Time compiled routing against compiling the rules for every request"""
+    start = time.perf_counter()
+    engine = RoutingEngine(configuration)
+    compile_time = time.perf_counter() - start
+
+    requests = synthetic_requests(engine, count, seed)
+
+    start = time.perf_counter()
+    routed = [engine.route(task, tokens, unavailable=unavailable)
+              for task, tokens, unavailable in requests]
+    compiled_time = time.perf_counter() - start
+
+    # Evaluating the rules from the configuration on every request
+    sample = requests[:max(1, count // 100)]
+    start = time.perf_counter()
+    for (task, tokens, unavailable), expected in zip(sample, routed):
+        if RoutingEngine(configuration).route(task, tokens, unavailable=unavailable) != expected:
+            print(f"❌ Compiled route differs for {task} ({tokens} tokens)")
+            sys.exit(1)
+    uncompiled_time = (time.perf_counter() - start) / len(sample) * count
+
+    unroutable = sum(route is None for route in routed)
+    print(f"⏱️  Compile: {compile_time * 1000:.2f}ms")
+    print(f"⏱️  Compiled routing of {count} requests: {compiled_time * 1000:.1f}ms "
+          f"({count / compiled_time:,.0f} requests/s, {compiled_time / count * 1e6:.2f}µs per request)")
+    print(f"⏱️  Uncompiled (estimated from {len(sample)}): {uncompiled_time * 1000:.1f}ms "
+          f"({count / uncompiled_time:,.0f} requests/s, {uncompiled_time / compiled_time:.0f}x slower)")
+    if unroutable:
+        print(f"⚠️  {unroutable} requests fit no available model")
+
+
+def main():
+    """Main function to handle command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="HUGAI Model Router",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=str(Path(__file__).parent / "llms" / "model-llm.yaml"),
+        help="LLM configuration file (default: llms/model-llm.yaml)"
+    )
+
+    parser.add_argument(
+        "--task", "-t",
+        type=str,
+        help="Task type to route"
+    )
+
+    parser.add_argument(
+        "--input-tokens", "-i",
+        type=int,
+        default=0,
+        help="Input tokens of the request (default: 0)"
+    )
+
+    parser.add_argument(
+        "--output-tokens",
+        type=int,
+        default=0,
+        help="Expected output tokens of the request (default: 0)"
+    )
+
+    parser.add_argument(
+        "--unavailable", "-u",
+        type=str,
+        default="",
+        help="Comma-separated models to skip"
+    )
+
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="REQUESTS",
+        help="Measure routing throughput on a synthetic request stream"
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the benchmark request stream (default: 0)"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the route or routing table as JSON"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        configuration = load_yaml(Path(args.config)) or {}
+        engine = RoutingEngine(configuration)
+    except (OSError, yaml.YAMLError) as e:
+        print(f"❌ Error loading {args.config}: {e}")
+        sys.exit(1)
+
+    if args.benchmark:
+        benchmark(configuration, args.benchmark, args.seed)
+        return
+
+    if not args.task:
+        if args.json:
+            print(json.dumps({
+                "scores": engine.scores,
+                "max_fallbacks": engine.max_fallbacks,
+                "tasks": {task: engine.candidates(task) for task in engine.task_types},
+                "default": engine.candidates("")
+            }, indent=2))
+        else:
+            print_table(engine)
+        return
+
+    unavailable = frozenset(name.strip() for name in args.unavailable.split(",") if name.strip())
+    unknown = unavailable - set(engine.models)
+    if unknown:
+        print(f"❌ Unknown models: {', '.join(sorted(unknown))}")
+        sys.exit(1)
+
+    route = engine.route(args.task, args.input_tokens, args.output_tokens, unavailable)
+    if args.json:
+        print(json.dumps(route._asdict() if route else None, indent=2))
+    elif route is None:
+        print(f"❌ No available model fits {args.input_tokens + args.output_tokens} tokens")
+    else:
+        cost = engine.estimate_cost(route.model, args.input_tokens, args.output_tokens)
+        print(f"🎯 {args.task} → {route.model} (via {route.rule}, est. ${cost:.4f})")
+        if route.fallbacks:
+            print(f"   fallbacks: {' → '.join(route.fallbacks)}")
+
+    if route is None:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+HUGAI LLM Cost and Latency Simulator
+
+This script replays a request trace against llms/model-llm.yaml with NumPy (see
+hugai_config/simulator.py): requests are routed with the compiled model selection
+rules, throttled by the provider rate limits with fallbacks, priced with the model
+prices and timed with per-latency-class estimates. The result is compared with the
+daily and monthly budgets and the latency targets of the configuration.
+
+A trace is a CSV or Parquet file with task_type, input_tokens and output_tokens
+columns and an optional timestamp column in seconds; without timestamps requests
+arrive evenly at --rate per second. Parquet needs pyarrow.
+
+What-if policies are YAML overlays deep-merged onto the configuration (same layout as
+model-llm.yaml, only the keys to change), each simulated on the same trace.
+
+Usage:
+    python simulate-costs.py --trace <file> [--rate <rps>] [--what-if <overlay.yaml> ...] [--json]
+    python simulate-costs.py --synthetic <requests> [--seed <n>] [--save-trace <file>]
+
+Examples:
+    # Simulate a recorded trace
+    python simulate-costs.py --trace requests.csv
+
+    # One million synthetic requests at 20 requests per second
+    python simulate-costs.py --synthetic 1000000 --rate 20
+
+    # Compare the current policy with one that disables Anthropic
+    python simulate-costs.py --trace requests.csv --what-if no-anthropic.yaml
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+
+try:
+    import yaml
+    # Used through hugai_config.simulator; checked here for the install hint
+    if importlib.util.find_spec("numpy") is None:
+        raise ImportError("No module named 'numpy'")
+except ImportError as e:
+    print(f"❌ Missing required dependencies: {e}")
+    print("💡 Install with: pip install numpy pyyaml")
+    sys.exit(1)
+
+from hugai_config.documents import load_yaml
+from hugai_config.routing import RoutingEngine
+from hugai_config.simulator import (
+    DEFAULT_RATE, SimulationResult, apply_overlay, read_trace, simulate, synthetic_trace,
+    write_trace
+)
+
+# Task type of synthetic requests that no task routing covers
+GENERAL_TASK = "general"
+
+
+def print_result(title: str, result: SimulationResult, duration: float):
+    """Print one simulation in the emoji style of the other tools"""
+    print(f"\n💰 {title}")
+    print("=" * 50)
+    print(f"Requests: {result.requests:,}  Served: {result.served:,}  "
+          f"Via fallback: {result.fallbacks:,}  Throttled: {result.throttled:,}  "
+          f"Unroutable: {result.unroutable:,}  ({duration:.2f}s)")
+    print(f"Total cost: ${result.total_cost:,.2f}  Peak day: ${result.peak_daily_cost:,.2f}"
+          + (f"  Days over budget: {result.days_over_budget}" if result.days_over_budget else ""))
+    if result.projected_monthly_cost is not None:
+        icon = {"ok": "✅", "warning": "⚠️ ", "critical": "🔥"}.get(result.budget_status, "❌")
+        print(f"{icon} Projected month: ${result.projected_monthly_cost:,.2f} "
+              f"({result.budget_utilization:.0f}% of budget, {result.budget_status})")
+
+    latency = "  ".join(
+        f"{key} {value:.2f}s" + (f" (target {result.latency_targets[key]:g}s)"
+                                  if key in result.latency_targets else "")
+        for key, value in result.latency.items()
+    )
+    print(f"⏱️  Latency: {latency}")
+
+    print("\n   Model                 Requests        Cost")
+    for name, count in sorted(result.requests_by_model.items(), key=lambda item: -item[1]):
+        print(f"   {name:<20} {count:>9,} {result.cost_by_model[name]:>11,.2f}")
+    print("\n   Task type             Cost")
+    for task, cost in sorted(result.cost_by_task.items(), key=lambda item: -item[1]):
+        print(f"   {task:<20} {cost:>9,.2f}")
+
+
+def print_comparison(results: dict):
+    """Side-by-side totals of the baseline and the what-if policies"""
+    print("\n📊 Policy comparison")
+    print("=" * 50)
+    print(f"   {'Policy':<24} {'Cost':>11} {'Month':>11} {'p95':>7} {'Throttled':>10}")
+    for name, (result, _) in results.items():
+        month = f"{result.projected_monthly_cost:,.0f}" if result.projected_monthly_cost is not None else "-"
+        print(f"   {name:<24} {result.total_cost:>11,.2f} {month:>11} "
+              f"{result.latency['p95']:>6.1f}s {result.throttled:>10,}")
+
+
+def main():
+    """Main function to handle command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="HUGAI LLM Cost and Latency Simulator",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=str(Path(__file__).parent / "llms" / "model-llm.yaml"),
+        help="LLM configuration file (default: llms/model-llm.yaml)"
+    )
+
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--trace",
+        type=str,
+        help="Request trace (.csv, or .parquet with pyarrow)"
+    )
+    source.add_argument(
+        "--synthetic",
+        type=int,
+        metavar="REQUESTS",
+        help="Simulate a seeded synthetic trace of this many requests"
+    )
+
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help="Requests per second of traces without timestamps and of synthetic traces "
+             "(default: target_rps of the configuration)"
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the synthetic trace (default: 0)"
+    )
+
+    parser.add_argument(
+        "--save-trace",
+        type=str,
+        help="Write the simulated trace as CSV"
+    )
+
+    parser.add_argument(
+        "--what-if", "-w",
+        action="append",
+        default=[],
+        metavar="OVERLAY",
+        help="YAML overlay with policy changes to compare (repeatable)"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the results as JSON"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        configuration = load_yaml(Path(args.config)) or {}
+        overlays = {Path(path).stem: load_yaml(Path(path)) or {} for path in args.what_if}
+    except (OSError, yaml.YAMLError) as e:
+        print(f"❌ Error loading configuration: {e}")
+        sys.exit(1)
+
+    throughput = (((configuration.get("configuration") or {}).get("performance_monitoring") or {})
+                  .get("performance_metrics") or {}).get("throughput_monitoring") or {}
+    rate = args.rate or float(throughput.get("target_rps", DEFAULT_RATE))
+
+    engine = RoutingEngine(configuration)
+    try:
+        if args.trace:
+            trace = read_trace(Path(args.trace), rate)
+        else:
+            trace = synthetic_trace(engine.task_types + [GENERAL_TASK], args.synthetic, rate, args.seed)
+    except ImportError as e:
+        print(f"❌ Missing optional dependency: {e}")
+        print("💡 Install with: pip install pyarrow")
+        sys.exit(1)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error reading trace: {e}")
+        sys.exit(1)
+
+    # Misspelled or unknown task types take the default route; stderr keeps --json output clean
+    unrouted = sorted(set(trace.task_types.tolist()) - set(engine.task_types) - {GENERAL_TASK})
+    if args.trace and unrouted:
+        print(f"⚠️  {len(unrouted)} task types have no routing entry and use the default ranking: "
+              f"{', '.join(unrouted)}", file=sys.stderr)
+
+    if args.save_trace:
+        write_trace(trace, Path(args.save_trace))
+        print(f"💾 Wrote {len(trace):,} requests to {args.save_trace}")
+
+    policies = {"baseline": configuration}
+    policies.update({name: apply_overlay(configuration, overlay) for name, overlay in overlays.items()})
+
+    results = {}
+    for name, policy in policies.items():
+        start = time.perf_counter()
+        results[name] = (simulate(policy, trace), time.perf_counter() - start)
+
+    if args.json:
+        print(json.dumps({name: result._asdict() for name, (result, _) in results.items()}, indent=2))
+        return
+
+    for name, (result, duration) in results.items():
+        print_result(name, result, duration)
+    if len(results) > 1:
+        print_comparison(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -27,17 +27,25 @@ Examples:
     python sync-automation.py --dry-run
     
     # Sync specific configuration type
-    python sync-automation.py --mode agents --target config/agents/
+    python sync-automation.py --mode agents
+    
+    # Sync a directory and a glob of files in one batch
+    python sync-automation.py --target config/agents/ --target "config/tools/*-search.yaml"
 """
 
 import argparse
+import contextvars
+import glob
+import importlib.metadata
 import json
 import os
+import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 import hashlib
 import subprocess
 import shutil
@@ -47,12 +55,46 @@ try:
     import jsonschema
     from watchdog.observers import Observer
     from watchdog.events import FileSystemEventHandler
-    from jinja2 import Environment, FileSystemLoader
+    from jinja2 import Environment, FileSystemLoader, meta
 except ImportError as e:
     print(f"❌ Missing required dependencies: {e}")
     print("💡 Install with: pip install pyyaml jsonschema watchdog jinja2")
     sys.exit(1)
 
+import hugai_config
+from hugai_config.bundle import BundleError, build_bundle, inputs_digest, read_bundle_digest
+from hugai_config.cache import CACHE, cache_key
+from hugai_config.config_types import detect_config_type, detect_type_from_path
+from hugai_config.documents import DOCUMENTS, parse_yaml
+from hugai_config.metrics import MetricsRegistry
+from hugai_config.schemas import get_schema_registry
+from hugai_config.semantic_diff import semantic_hash
+from hugai_config.templates import TEMPLATE_BYTECODE_CACHE
+from hugai_config.tracing import create_tracer
+
+
+# Version of this script, the hugai_config package and the libraries whose output is
+# cached; part of every render and validation cache key, so upgrades never reuse stale results
+TOOL_VERSION = cache_key(
+    Path(__file__).read_bytes(),
+    *(source.read_bytes() for source in sorted(Path(hugai_config.__file__).parent.glob("*.py"))),
+    importlib.metadata.version("jinja2"),
+    importlib.metadata.version("jsonschema")
+)[:16]
+
+# Marker-delimited regions of a doc that are owned by the generator; everything
+# outside them is hand-written and never touched by fragment regeneration.
+GENERATED_REGION_PATTERN = re.compile(
+    r'<!-- hugai:generated:start section="(?P<section>[\w-]+)"(?: hash="(?P<hash>\w*)")? -->\n?'
+    r'(?P<body>.*?)\n?'
+    r'<!-- hugai:generated:end section="(?P=section)" -->',
+    re.DOTALL
+)
+
+# Outputs of one configuration file rendered concurrently. Rendering holds the GIL,
+# so this mainly overlaps template loading and file I/O between outputs.
+RENDER_WORKERS = 4
+
 
 class ConfigDocSyncHandler(FileSystemEventHandler):
     """File system event handler for configuration-documentation synchronization"""
@@ -78,6 +120,7 @@ class ConfigDocSyncHandler(FileSystemEventHandler):
         """Handle file modification with debouncing"""
         current_time = time.time()
         self.pending_changes[file_path] = current_time
+        self.sync_manager.watch_queue_depth.set(len(self.pending_changes))
         
         # Use a timer to debounce rapid changes
         def process_change():
@@ -86,6 +129,7 @@ class ConfigDocSyncHandler(FileSystemEventHandler):
                 current_time == self.pending_changes[file_path]):
                 
                 del self.pending_changes[file_path]
+                self.sync_manager.watch_queue_depth.set(len(self.pending_changes))
                 self.sync_manager.handle_file_change(file_path)
         
         import threading
@@ -96,37 +140,241 @@ class ConfigDocSyncHandler(FileSystemEventHandler):
         self.sync_manager.handle_file_deletion(file_path)
 
 
+class ConfigDocSnapshot:
+    """Filesystem snapshot of the config and docs trees shared by every operation in a run.
+    
+    Built from a single ``os.scandir`` pass and kept current by watch events through
+    ``update`` and ``remove`` instead of rescanning.
+    """
+    
+    def __init__(self, config_dir: Path, docs_mapping: Dict[str, Path]):
+        self.config_dir = config_dir
+        self.docs_mapping = docs_mapping
+        self.configs: Dict[str, Dict[str, Path]] = {}
+        self.docs: Dict[str, Dict[str, Path]] = {}
+        self.stats: Dict[Path, Tuple[int, int]] = {}
+        
+        # Resolved directory -> (kind, config type, directory) for incremental updates
+        self.directories: Dict[Path, Tuple[str, str, Path]] = {}
+        for config_type, docs_dir in docs_mapping.items():
+            type_dir = config_dir / config_type
+            self.directories[type_dir.resolve()] = ("config", config_type, type_dir)
+            self.directories[docs_dir.resolve()] = ("doc", config_type, docs_dir)
+        
+        self.scan()
+    
+    def scan(self):
+        """Scan all config and docs directories once"""
+        self.configs, self.docs, self.stats = {}, {}, {}
+        for kind, config_type, directory in self.directories.values():
+            entries = self._scan_directory(directory, kind)
+            if entries is not None:
+                target = self.configs if kind == "config" else self.docs
+                target[config_type] = entries
+    
+    def _scan_directory(self, directory: Path, kind: str) -> Optional[Dict[str, Path]]:
+        """Collect matching files and their stat data, or None if the directory is missing"""
+        try:
+            iterator = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        
+        entries = {}
+        with iterator:
+            for entry in iterator:
+                path = directory / entry.name
+                if entry.is_file() and self._is_tracked(path, kind):
+                    stat = entry.stat()
+                    self.stats[path] = (stat.st_mtime_ns, stat.st_size)
+                    entries[path.stem] = path
+        return entries
+    
+    def _is_tracked(self, path: Path, kind: str) -> bool:
+        """Check whether a file belongs in the snapshot"""
+        if kind == "config":
+            return path.suffix == ".yaml"
+        return path.suffix == ".md" and path.name != "index.md"
+    
+    def _locate(self, file_path: Path) -> Optional[Tuple[str, str, Path]]:
+        """Map a (possibly absolute) event path onto a snapshot directory and file path"""
+        located = self.directories.get(Path(file_path).resolve().parent)
+        if located is None:
+            return None
+        kind, config_type, directory = located
+        path = directory / Path(file_path).name
+        return (kind, config_type, path) if self._is_tracked(path, kind) else None
+    
+    def update(self, file_path: Path):
+        """Refresh a single created or modified file"""
+        located = self._locate(file_path)
+        if located is None:
+            return
+        kind, config_type, path = located
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self.remove(path)
+            return
+        
+        target = self.configs if kind == "config" else self.docs
+        target.setdefault(config_type, {})[path.stem] = path
+        self.stats[path] = (stat.st_mtime_ns, stat.st_size)
+    
+    def remove(self, file_path: Path):
+        """Drop a deleted file"""
+        located = self._locate(file_path)
+        if located is None:
+            return
+        kind, config_type, path = located
+        target = self.configs if kind == "config" else self.docs
+        target.get(config_type, {}).pop(path.stem, None)
+        self.stats.pop(path, None)
+    
+    def config_files(self) -> List[Path]:
+        """All configuration files in the snapshot"""
+        return [path for config_type in self.docs_mapping
+                for _, path in sorted(self.configs.get(config_type, {}).items())]
+
+
+class SyncJournal:
+    """Append-only journal of the files completed by a sync run.
+    
+    Every record is flushed and fsynced before the next file is processed, so a crash
+    or interruption loses at most the file in progress. A run that finishes removes
+    its journal; a journal left behind belongs to an interrupted run.
+    """
+    
+    def __init__(self, journal_file: Path):
+        self.journal_file = journal_file
+    
+    def load(self) -> Optional[Dict]:
+        """Read the journal of an interrupted run, or None if there is none"""
+        if not self.journal_file.exists():
+            return None
+        
+        state = {"files": [], "deleted": [], "done": {}, "forgotten": set()}
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-write
+                    break
+                
+                if record["event"] == "start":
+                    state["files"] = record["files"]
+                    state["deleted"] = record["deleted"]
+                elif record["event"] == "done":
+                    state["done"][record["file"]] = record
+                elif record["event"] == "deleted":
+                    state["forgotten"].add(record["file"])
+        return state
+    
+    def start(self, files: List[str], deleted: List[str]):
+        """Begin a new run, replacing any previous journal"""
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_file, 'w', encoding='utf-8') as f:
+            self._write(f, {"event": "start", "started_at": datetime.now().isoformat(),
+                            "files": files, "deleted": deleted})
+    
+    def record(self, event: str, **fields):
+        """Durably append a record"""
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            self._write(f, {"event": event, **fields})
+    
+    def finish(self):
+        """Mark the run complete by removing its journal"""
+        self.journal_file.unlink(missing_ok=True)
+    
+    def _write(self, f, record: Dict):
+        f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
 class ConfigDocSyncManager:
     """Main synchronization manager for configurations and documentation"""
     
-    def __init__(self, config_dir: str = "config", docs_dir: str = "docs"):
+    CONFIG_TYPES = ("agents", "lifecycle", "tools", "llms")
+    
+    # Documentation subdirectory for each configuration type
+    DOCS_SUBDIRS = {
+        "agents": "agents",
+        "lifecycle": "methodology",
+        "tools": "tools",
+        "llms": "llms"
+    }
+    
+    def __init__(self, config_dir: str = "config", docs_dir: str = "docs", root_dir: str = ".",
+                 config_types: Optional[Sequence[str]] = None):
+        # Working files (backups, metadata, logs, target patterns) are relative to root_dir
+        self.root_dir = Path(root_dir)
         self.config_dir = Path(config_dir)
         self.docs_dir = Path(docs_dir)
-        self.backup_dir = Path("backups/sync")
-        self.sync_metadata_file = Path(".sync-metadata.json")
+        
+        # Configuration types in scope (--mode); nothing outside them is scanned or synced
+        self.config_types = tuple(config_types or self.CONFIG_TYPES)
+        unknown = set(self.config_types) - set(self.CONFIG_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown configuration types: {', '.join(sorted(unknown))}")
+        
+        self.docs_mapping = {
+            config_type: self.docs_dir / self.DOCS_SUBDIRS[config_type]
+            for config_type in self.config_types
+        }
+        self.snapshot: Optional[ConfigDocSnapshot] = None
+        # Git blob IDs of the configs as seen by this run's change detection
+        self.current_object_ids: Dict[str, str] = {}
+        self._render_pool: Optional[ThreadPoolExecutor] = None
+        # Templates referenced by each (template name, source hash), None when dynamic
+        self._template_references: Dict[Tuple[str, str], Optional[List[str]]] = {}
+        self.backup_dir = self.root_dir / "backups" / "sync"
+        self.sync_metadata_file = self.root_dir / ".sync-metadata.json"
+        self.journal = SyncJournal(self.root_dir / ".sync-journal.jsonl")
+        self.schema_registry = get_schema_registry(self.config_dir / "schemas")
         
         # Initialize Jinja2 environment
         template_dirs = [
             str(self.config_dir / "templates"),
             str(Path(__file__).parent / "sync-templates")
         ]
-        self.jinja_env = Environment(loader=FileSystemLoader(template_dirs))
+        self.jinja_env = Environment(
+            loader=FileSystemLoader(template_dirs),
+            bytecode_cache=TEMPLATE_BYTECODE_CACHE
+        )
         
         # Load sync configuration
         self.sync_config = self.load_sync_config()
         
-        # Create necessary directories
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
-        
         # Load sync metadata
         self.sync_metadata = self.load_sync_metadata()
+        
+        # Sync pipeline metrics, exported in OpenMetrics format
+        self.metrics = MetricsRegistry()
+        self.files_processed = self.metrics.counter(
+            "hugai_sync_files", "Configuration files processed by sync", ["result"])
+        self.phase_duration = self.metrics.histogram(
+            "hugai_sync_phase_duration_seconds", "Latency of each sync phase", ["phase"])
+        self.watch_queue_depth = self.metrics.gauge(
+            "hugai_sync_watch_queue_depth", "File changes waiting for the watch debounce")
+        self.backup_size = self.metrics.gauge(
+            "hugai_sync_backup_size_bytes", "Total size of the sync backup directory")
+        self.watch_queue_depth.set(0)
+        self.backup_size.set(0)
+        
+        # Span tracing of the sync pipeline, a no-op unless enabled
+        tracing_config = self.sync_config.get("tracing", {})
+        self.tracer = create_tracer(
+            tracing_config.get("exporters", []) if tracing_config.get("enabled") else [],
+            self.root_dir
+        )
     
     def load_sync_config(self) -> Dict:
         """Load synchronization configuration"""
         config_file = self.config_dir / "sync-config.yaml"
         if config_file.exists():
             with open(config_file, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+                return parse_yaml(f) or {}
         
         # Default sync configuration
         default_config = {
@@ -135,7 +383,24 @@ class ConfigDocSyncManager:
                     "agents": {
                         "source_pattern": "config/agents/*.yaml",
                         "target_pattern": "docs/agents/{name}.md",
-                        "template": "agent-doc-template.md"
+                        "template": "agent-doc-template.md",
+                        "fragments": {
+                            "role": ["configuration.role", "configuration.capabilities"],
+                            "dependencies": ["configuration.dependencies"],
+                            "integration": ["integration"],
+                            "validation": ["validation"],
+                            "cli_usage": ["cli_usage"]
+                        },
+                        "outputs": [
+                            {
+                                "template": "config-summary-template.json",
+                                "target_pattern": "docs/data/agents/{name}.json"
+                            },
+                            {
+                                "template": "config-digest-template.txt",
+                                "target_pattern": "docs/agents/{name}.llms.txt"
+                            }
+                        ]
                     },
                     "lifecycle": {
                         "source_pattern": "config/lifecycle/*.yaml",
@@ -174,6 +439,25 @@ class ConfigDocSyncManager:
                 "enabled": True,
                 "channels": ["console", "file"],
                 "log_file": "sync.log"
+            },
+            "change_detection": {
+                "backend": "auto"  # Options: auto, git, hash
+            },
+            "metrics": {
+                "enabled": True,
+                "textfile": "sync-metrics.prom",
+                "http_port": None
+            },
+            "bundle": {
+                "enabled": True,
+                "path": "config/hugai-configs.bundle"
+            },
+            "tracing": {
+                "enabled": False,
+                "exporters": [
+                    {"type": "chrome", "path": "sync-trace.json"},
+                    {"type": "otlp-json", "path": "sync-trace.otlp.json"}
+                ]
             }
         }
         
@@ -195,6 +479,9 @@ class ConfigDocSyncManager:
         return {
             "last_sync": None,
             "file_hashes": {},
+            "git_object_ids": {},
+            "file_stats": {},
+            "semantic_hashes": {},
             "sync_history": [],
             "conflicts": [],
             "schema_version": "1.0"
@@ -205,51 +492,274 @@ class ConfigDocSyncManager:
         with open(self.sync_metadata_file, 'w', encoding='utf-8') as f:
             json.dump(self.sync_metadata, f, indent=2, default=str)
     
+    def get_snapshot(self) -> ConfigDocSnapshot:
+        """Get the filesystem snapshot for this run, scanning on first use"""
+        if self.snapshot is None:
+            self.snapshot = ConfigDocSnapshot(self.config_dir, self.docs_mapping)
+        return self.snapshot
+    
     def calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA-256 hash of file content"""
         if not file_path.exists():
             return ""
         
-        hasher = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        # Read through the document cache so validation and rendering reuse the bytes
+        with self.tracer.span("hash", file=str(file_path)):
+            return DOCUMENTS.load(file_path).digest
+    
+    def run_git(self, args: List[str]) -> Optional[str]:
+        """Run a git command from the configuration directory, returning stdout or None"""
+        try:
+            with self.tracer.span("git", command=args[0]):
+                result = subprocess.run(
+                    ["git", "-C", str(self.config_dir)] + args,
+                    check=True, capture_output=True, text=True
+                )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        return result.stdout
+    
+    def get_change_detection_backend(self) -> str:
+        """Resolve the configured change detection backend (git or hash)"""
+        backend = self.sync_config.get("change_detection", {}).get("backend", "auto")
+        if backend == "hash":
+            return "hash"
+        
+        inside_repo = (self.run_git(["rev-parse", "--is-inside-work-tree"]) or "").strip() == "true"
+        if inside_repo:
+            return "git"
+        
+        if backend == "git":
+            self.log_message("⚠️  Not inside a git repository, falling back to hash change detection")
+        return "hash"
     
     def detect_changes(self) -> Dict[str, List[Path]]:
         """Detect changed files since last sync"""
+        with self.tracer.span("detect_changes") as span:
+            backend = self.get_change_detection_backend()
+            changes = self.detect_changes_git() if backend == "git" else None
+            if changes is None:
+                backend = "hash"
+                changes = self.detect_changes_hash()
+            
+            span.set_attribute("backend", backend)
+            for change_type, files in changes.items():
+                span.set_attribute(change_type, len(files))
+            return changes
+    
+    def detect_changes_git(self) -> Optional[Dict[str, List[Path]]]:
+        """Detect changed files using git object IDs instead of re-hashing file contents.
+        
+        ``git ls-files -s`` yields the blob ID of every tracked config; modified and
+        untracked configs (minus ignored ones) are hashed with ``git hash-object``. The IDs
+        are compared with the ``git_object_ids`` recorded when each file was last synced,
+        so uncommitted edits, reverts and checkouts of other commits are all detected.
+        """
+        changes = {
+            "modified": [],
+            "added": [],
+            "deleted": []
+        }
+        pathspecs = ["--"] + list(self.config_types)
+        
+        output = self.run_git(["ls-files", "-s", "-z"] + pathspecs)
+        if output is None:
+            return None
+        object_ids = {}
+        for entry in filter(None, output.split("\0")):
+            # Entry format: "<mode> <object id> <stage>\t<path>"
+            info, file_key = entry.split("\t", 1)
+            if self._is_config_key(file_key):
+                object_ids[file_key] = info.split()[1]
+        
+        # The index does not reflect working tree edits or untracked files, so hash those
+        dirty = []
+        for args in (["ls-files", "-m", "-z"], ["ls-files", "--others", "--exclude-standard", "-z"]):
+            output = self.run_git(args + pathspecs)
+            if output is None:
+                return None
+            dirty.extend(key for key in filter(None, output.split("\0")) if self._is_config_key(key))
+        for file_key in dirty:
+            object_ids.pop(file_key, None)
+        object_ids.update(self.hash_objects([key for key in dirty if (self.config_dir / key).is_file()]))
+        self.current_object_ids.update(object_ids)
+        
+        stored_ids = self.sync_metadata.setdefault("git_object_ids", {})
+        for file_key, object_id in sorted(object_ids.items()):
+            stored_id = stored_ids.get(file_key)
+            if stored_id is None:
+                changes["added"].append(self.config_dir / file_key)
+            elif stored_id != object_id:
+                changes["modified"].append(self.config_dir / file_key)
+        
+        # Check for deleted files, ignoring files of types outside the current scope
+        for file_key in stored_ids:
+            if file_key not in object_ids and self._is_config_key(file_key):
+                changes["deleted"].append(self.config_dir / file_key)
+        
+        return changes
+    
+    def hash_objects(self, file_keys: List[str]) -> Dict[str, str]:
+        """Git blob IDs of the current contents of files relative to the config directory"""
+        if not file_keys:
+            return {}
+        output = self.run_git(["hash-object", "--"] + list(file_keys))
+        if output is None:
+            return {}
+        return dict(zip(file_keys, output.split()))
+    
+    def _is_config_key(self, file_key: str) -> bool:
+        """Check whether a path relative to the config directory is a syncable config"""
+        parts = Path(file_key).parts
+        return len(parts) == 2 and parts[0] in self.config_types and file_key.endswith(".yaml")
+    
+    def in_scope(self, config_file: Path) -> bool:
+        """Whether a file is a configuration of a type in scope for this run"""
+        return config_file.suffix == ".yaml" and config_file.parent.name in self.config_types
+    
+    def resolve_targets(self, targets: Sequence[str]) -> List[Path]:
+        """Expand file, directory and glob targets into in-scope configuration files.
+        
+        Files are returned under the config directory as a full run sees them (so their
+        metadata keys match); files outside it raise ValueError.
+        """
+        config_dir = self.config_dir.resolve()
+        files = []
+        for target in targets:
+            path = Path(target)
+            if any(char in target for char in "*?["):
+                matches = [Path(match) for match in sorted(glob.glob(target, recursive=True))]
+            elif path.is_dir():
+                matches = sorted(path.rglob("*.yaml"))
+            elif path.is_file():
+                matches = [path]
+            else:
+                raise FileNotFoundError(f"Target not found: {target}")
+            
+            for match in matches:
+                if not (match.is_file() and self.in_scope(match)):
+                    continue
+                try:
+                    files.append(self.config_dir / match.resolve().relative_to(config_dir))
+                except ValueError:
+                    raise ValueError(f"Target is outside the config directory {self.config_dir}: {match}")
+        
+        return list(dict.fromkeys(files))
+    
+    def detect_changes_hash(self) -> Dict[str, List[Path]]:
+        """Detect changed files by comparing SHA-256 hashes with the stored ones"""
         changes = {
             "modified": [],
             "added": [],
             "deleted": []
         }
         
+        snapshot = self.get_snapshot()
+        file_hashes = self.sync_metadata["file_hashes"]
+        file_stats = self.sync_metadata.setdefault("file_stats", {})
+        seen_keys = set()
+        
         # Check configuration files
-        for config_type in ["agents", "lifecycle", "tools", "llms"]:
-            config_dir = self.config_dir / config_type
-            if config_dir.exists():
-                for config_file in config_dir.glob("*.yaml"):
-                    file_key = str(config_file.relative_to(self.config_dir))
-                    current_hash = self.calculate_file_hash(config_file)
-                    stored_hash = self.sync_metadata["file_hashes"].get(file_key, "")
-                    
-                    if stored_hash == "":
-                        changes["added"].append(config_file)
-                    elif current_hash != stored_hash:
-                        changes["modified"].append(config_file)
-                    
-                    # Update hash
-                    self.sync_metadata["file_hashes"][file_key] = current_hash
-        
-        # Check for deleted files
-        for file_key in list(self.sync_metadata["file_hashes"].keys()):
-            file_path = self.config_dir / file_key
-            if not file_path.exists():
-                changes["deleted"].append(file_path)
-                del self.sync_metadata["file_hashes"][file_key]
+        for config_file in snapshot.config_files():
+            file_key = str(config_file.relative_to(self.config_dir))
+            seen_keys.add(file_key)
+            stored_hash = file_hashes.get(file_key, "")
+            
+            # Unchanged size and mtime means unchanged content, so skip re-hashing
+            current_stat = list(snapshot.stats[config_file])
+            if stored_hash and file_stats.get(file_key) == current_stat:
+                current_hash = stored_hash
+            else:
+                current_hash = self.calculate_file_hash(config_file)
+            
+            # Hashes of changed files are committed only once their docs are written
+            if stored_hash == "":
+                changes["added"].append(config_file)
+            elif current_hash != stored_hash:
+                changes["modified"].append(config_file)
+            else:
+                file_stats[file_key] = current_stat
+        
+        # Check for deleted files, ignoring files of types outside the current scope
+        for file_key in list(file_hashes.keys()):
+            if file_key not in seen_keys and self._is_config_key(file_key):
+                changes["deleted"].append(self.config_dir / file_key)
         
         return changes
     
+    def get_file_key(self, config_file: Path) -> str:
+        """Metadata key of a configuration file, relative to the config directory"""
+        try:
+            return str(config_file.relative_to(self.config_dir))
+        except ValueError:
+            return str(config_file)
+    
+    def calculate_semantic_hash(self, config_file: Path) -> Optional[str]:
+        """Hash of the parsed configuration, or None if it cannot be parsed"""
+        try:
+            return semantic_hash(DOCUMENTS.load(config_file).data)
+        except Exception:
+            return None
+    
+    def commit_file_state(self, config_file: Path) -> Dict:
+        """Record the content a file's documentation was generated from.
+        
+        Called only after the documentation has been written, so files whose sync
+        failed or was interrupted are detected as changed again on the next run.
+        """
+        file_key = self.get_file_key(config_file)
+        document = DOCUMENTS.get(config_file) or DOCUMENTS.load(config_file)
+        state = {
+            "file": file_key,
+            "hash": document.digest,
+            "stat": list(document.stat),
+            "semantic_hash": self.calculate_semantic_hash(config_file),
+            "object_id": self.current_object_ids.get(file_key)
+        }
+        self.apply_file_state(state)
+        return state
+    
+    def apply_file_state(self, state: Dict):
+        """Store a committed file state in the sync metadata"""
+        file_key = state["file"]
+        self.sync_metadata["file_hashes"][file_key] = state["hash"]
+        self.sync_metadata.setdefault("file_stats", {})[file_key] = state["stat"]
+        if state.get("semantic_hash"):
+            self.sync_metadata.setdefault("semantic_hashes", {})[file_key] = state["semantic_hash"]
+        if state.get("object_id"):
+            self.sync_metadata.setdefault("git_object_ids", {})[file_key] = state["object_id"]
+    
+    def forget_file_state(self, file_key: str):
+        """Drop the stored state of a deleted file"""
+        for section in ("file_hashes", "file_stats", "semantic_hashes", "git_object_ids"):
+            self.sync_metadata.get(section, {}).pop(file_key, None)
+    
+    def recover_journal(self) -> Optional[Dict]:
+        """Commit the progress of an interrupted run and return its journal state"""
+        state = self.journal.load()
+        if state is None:
+            return None
+        
+        for file_state in state["done"].values():
+            self.apply_file_state(file_state)
+        for file_key in state["forgotten"]:
+            self.forget_file_state(file_key)
+        self.save_sync_metadata()
+        
+        self.log_message(
+            f"⏯️  Recovered interrupted run: {len(state['done'])} of {len(state['files'])} files completed"
+        )
+        return state
+    
+    def is_semantically_unchanged(self, config_file: Path) -> bool:
+        """Whether a changed file parses to the same tree as at its last sync"""
+        stored_hash = self.sync_metadata.get("semantic_hashes", {}).get(self.get_file_key(config_file))
+        target_paths = self.get_target_paths(config_file)
+        if not stored_hash or not target_paths or not all(path.exists() for path in target_paths):
+            return False
+        
+        return self.calculate_semantic_hash(config_file) == stored_hash
+    
     def check_naming_consistency(self) -> Dict[str, List[Dict]]:
         """Check for naming inconsistencies between configs and docs"""
         inconsistencies = {
@@ -258,29 +768,17 @@ class ConfigDocSyncManager:
             "naming_mismatches": []
         }
         
-        for config_type in ["agents", "lifecycle", "tools", "llms"]:
+        snapshot = self.get_snapshot()
+        
+        for config_type in self.config_types:
             config_dir = self.config_dir / config_type
+            docs_dir = self.docs_mapping[config_type]
             
-            # Map for different documentation directories
-            docs_mapping = {
-                "agents": self.docs_dir / "agents",
-                "lifecycle": self.docs_dir / "methodology", 
-                "tools": self.docs_dir / "tools",
-                "llms": self.docs_dir / "llms"
-            }
-            
-            docs_dir = docs_mapping.get(config_type, self.docs_dir / config_type)
-            
-            if not config_dir.exists():
+            if config_type not in snapshot.configs:
                 continue
-                
-            # Get all config files
-            config_files = {f.stem: f for f in config_dir.glob("*.yaml")}
             
-            # Get all doc files
-            doc_files = {}
-            if docs_dir.exists():
-                doc_files = {f.stem: f for f in docs_dir.glob("*.md") if f.name != "index.md"}
+            config_files = snapshot.configs[config_type]
+            doc_files = snapshot.docs.get(config_type, {})
             
             # Check for configs without docs
             for config_name, config_path in config_files.items():
@@ -347,13 +845,19 @@ class ConfigDocSyncManager:
     
     def create_backup(self, files: List[Path]) -> Path:
         """Create backup of files before modification"""
+        with self.tracer.span("backup", files=len(files),
+                              compress=bool(self.sync_config["backup"]["compress"])):
+            return self._create_backup(files)
+    
+    def _create_backup(self, files: List[Path]) -> Path:
+        """Copy files into a timestamped backup, compressing it if enabled"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = self.backup_dir / f"backup_{timestamp}"
         backup_path.mkdir(parents=True, exist_ok=True)
         
         for file_path in files:
             if file_path.exists():
-                relative_path = file_path.relative_to(Path.cwd())
+                relative_path = Path(os.path.relpath(file_path.resolve(), self.root_dir.resolve()))
                 backup_file = backup_path / relative_path
                 backup_file.parent.mkdir(parents=True, exist_ok=True)
                 shutil.copy2(file_path, backup_file)
@@ -377,102 +881,326 @@ class ConfigDocSyncManager:
                 shutil.rmtree(backup_file)
             else:
                 backup_file.unlink()
+        
+        self.backup_size.set(sum(
+            path.stat().st_size for path in self.backup_dir.rglob("*") if path.is_file()
+        ))
     
     def validate_configuration(self, config_file: Path) -> Tuple[bool, List[str]]:
         """Validate configuration file against schema"""
         if not self.sync_config["validation"]["enabled"]:
             return True, []
         
+        # Reuse the result for the same bytes, schema and tool version
+        config_type = detect_type_from_path(config_file)
+        try:
+            key = cache_key(
+                TOOL_VERSION, config_type, self.schema_registry.digest(config_type) or "",
+                DOCUMENTS.load(config_file).digest
+            ) if config_type else None
+        except Exception:
+            key = None
+        
+        if key is not None:
+            cached = CACHE.get("validation", key)
+            if cached is not None:
+                return cached[0], cached[1]
+        
+        is_valid, errors = self._validate_configuration(config_file)
+        if key is not None:
+            CACHE.put("validation", key, [is_valid, errors])
+        return is_valid, errors
+    
+    def _validate_configuration(self, config_file: Path) -> Tuple[bool, List[str]]:
+        """Parse a configuration file and validate it against its compiled schema"""
         errors = []
         
-        # Load configuration
+        # Load configuration through the shared document cache
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
+            with self.tracer.span("yaml_parse", file=str(config_file)):
+                config_data = DOCUMENTS.load(config_file).data
         except Exception as e:
             return False, [f"YAML parsing error: {e}"]
         
-        # Determine configuration type and validate against schema
-        config_type = self.determine_config_type(config_file)
-        schema_file = self.config_dir / "schemas" / f"{config_type}-schema.json"
+        # Determine configuration type and validate against its compiled schema
+        config_type = detect_config_type(config_file, config_data)
+        if config_type is None:
+            return True, []
         
-        if schema_file.exists():
-            try:
-                with open(schema_file, 'r', encoding='utf-8') as f:
-                    schema = json.load(f)
-                
-                jsonschema.validate(instance=config_data, schema=schema)
-            except jsonschema.ValidationError as e:
-                errors.append(f"Schema validation error: {e.message}")
-            except Exception as e:
-                errors.append(f"Schema loading error: {e}")
+        try:
+            with self.tracer.span("schema_validate", file=str(config_file), schema=config_type):
+                self.schema_registry.check(config_data, config_type)
+        except jsonschema.ValidationError as e:
+            errors.append(f"Schema validation error: {e.message}")
+        except Exception as e:
+            errors.append(f"Schema loading error: {e}")
         
         return len(errors) == 0, errors
     
-    def determine_config_type(self, config_file: Path) -> str:
-        """Determine configuration type from file path"""
-        if "/agents/" in str(config_file):
-            return "agent"
-        elif "/lifecycle/" in str(config_file):
-            return "lifecycle"
-        elif "/tools/" in str(config_file):
-            return "tool"
-        elif "/llms/" in str(config_file):
-            return "llm"
-        else:
-            return "unknown"
+    def get_sync_rule(self, config_file: Path) -> Optional[Dict]:
+        """Get the config-to-docs rule for a configuration file (keyed by its directory)"""
+        sync_rules = self.sync_config["sync_rules"]["config_to_docs"]
+        return sync_rules.get(config_file.parent.name)
+    
+    def get_outputs(self, config_file: Path) -> List[Dict]:
+        """List the outputs of a configuration file's rule, primary documentation first.
+        
+        The rule's own ``template``/``target_pattern`` is the primary output; each entry
+        of its optional ``outputs`` list adds another template rendered to another target.
+        """
+        rule = self.get_sync_rule(config_file)
+        if rule is None:
+            return []
+        
+        primary = {
+            "template": rule["template"],
+            "target_pattern": rule["target_pattern"],
+            "fragments": rule.get("fragments", {})
+        }
+        return [primary] + list(rule.get("outputs", []))
+    
+    def get_output_path(self, config_file: Path, output: Dict) -> Path:
+        """Determine the file an output of a configuration file is written to"""
+        return self.root_dir / output["target_pattern"].format(name=config_file.stem)
+    
+    def get_target_paths(self, config_file: Path) -> List[Path]:
+        """Determine every file generated for a configuration file, primary documentation first"""
+        return [self.get_output_path(config_file, output) for output in self.get_outputs(config_file)]
+    
+    def get_target_path(self, config_file: Path) -> Optional[Path]:
+        """Determine the documentation file generated for a configuration file"""
+        target_paths = self.get_target_paths(config_file)
+        return target_paths[0] if target_paths else None
     
     def generate_documentation(self, config_file: Path) -> Optional[Path]:
         """Generate documentation from configuration file"""
-        config_type = self.determine_config_type(config_file)
-        sync_rules = self.sync_config["sync_rules"]["config_to_docs"]
+        with self.tracer.span("generate_documentation", file=str(config_file)):
+            return self._generate_documentation(config_file)
+    
+    def _generate_documentation(self, config_file: Path) -> Optional[Path]:
+        """Render every output of a configuration file and return the primary target path.
         
-        if config_type not in sync_rules:
+        The configuration is parsed once; all outputs render from the same in-memory
+        document, concurrently when the rule has more than one.
+        """
+        outputs = self.get_outputs(config_file)
+        if not outputs:
             return None
         
-        rule = sync_rules[config_type]
-        template_name = rule["template"]
-        
-        # Load configuration data
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
-        
-        # Determine target file path
-        config_name = config_file.stem
-        target_pattern = rule["target_pattern"]
-        target_path = Path(target_pattern.format(name=config_name))
-        
-        # Create target directory if it doesn't exist
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Render documentation using template
         try:
-            template = self.jinja_env.get_template(template_name)
-            doc_content = template.render(
-                config=config_data,
-                config_name=config_name,
-                config_type=config_type,
-                config_file=str(config_file),
-                generated_at=datetime.now().isoformat(),
-                sync_version="1.0"
-            )
+            # Parse up front so concurrent renders share one in-memory document
+            document = DOCUMENTS.load(config_file)
+            with self.tracer.span("yaml_parse", file=str(config_file), cached=document.parsed):
+                document.data
             
-            # Write documentation file
-            with open(target_path, 'w', encoding='utf-8') as f:
-                f.write(doc_content)
+            if len(outputs) == 1:
+                target_paths = [self.write_output(config_file, outputs[0])]
+            else:
+                # Each task runs in a copy of this context, so its spans nest under ours
+                futures = [
+                    self.get_render_pool().submit(contextvars.copy_context().run,
+                                                  self.write_output, config_file, output)
+                    for output in outputs
+                ]
+                target_paths = [future.result() for future in futures]
             
-            return target_path
+            return target_paths[0]
             
         except Exception as e:
             self.log_message(f"❌ Error generating documentation for {config_file}: {e}")
             return None
     
+    def get_render_pool(self) -> ThreadPoolExecutor:
+        """Worker pool rendering the outputs of a configuration file, created on first use"""
+        if self._render_pool is None:
+            self._render_pool = ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix="hugai-render")
+        return self._render_pool
+    
+    def close(self):
+        """Shut down the render workers; the pool is recreated if the manager is used again"""
+        if self._render_pool is not None:
+            self._render_pool.shutdown()
+            self._render_pool = None
+    
+    def write_output(self, config_file: Path, output: Dict) -> Path:
+        """Render one output and write it to its target path when it changed"""
+        target_path = self.get_output_path(config_file, output)
+        
+        # Create target directory if it doesn't exist
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        existing_content = None
+        if target_path.exists():
+            with open(target_path, 'r', encoding='utf-8') as f:
+                existing_content = f.read()
+        
+        content = self.render_output(config_file, output, existing_content)
+        
+        # Write the output file only when its content changed
+        if content != existing_content:
+            with self.tracer.span("write", file=str(target_path)):
+                with open(target_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+            
+            if self.snapshot is not None:
+                self.snapshot.update(target_path)
+        
+        return target_path
+    
+    def render_documentation(self, config_file: Path, existing_content: Optional[str] = None) -> str:
+        """Render the primary documentation of a configuration file in memory"""
+        return self.render_output(config_file, self.get_outputs(config_file)[0], existing_content)
+    
+    def render_output(self, config_file: Path, output: Dict, existing_content: Optional[str] = None) -> str:
+        """Render one output of a configuration file in memory.
+        
+        When the output defines fragments and ``existing_content`` is given, only the
+        generated regions whose hash changed are spliced into it. Renders are kept in
+        the shared result cache keyed by input hash, so long-running processes (watch
+        mode, the MkDocs hook) and runs restoring an exported cache skip unchanged configs.
+        The hash covers the output rule and every template the render loads.
+        """
+        config_type = detect_config_type(config_file) or "unknown"
+        template_name = output["template"]
+        fragments = output.get("fragments", {})
+        splice_into_existing = bool(fragments) and existing_content is not None
+        
+        # Load configuration source and template source
+        document = DOCUMENTS.load(config_file)
+        config_source = document.source
+        template_sources = self.template_sources(template_name)
+        # Templates without dependencies keep hashing their own source, as before
+        template_source = template_sources[template_name] if len(template_sources) == 1 \
+            else json.dumps(sorted(template_sources.items()))
+        
+        input_hash = cache_key(
+            TOOL_VERSION, config_file.as_posix(), config_source,
+            json.dumps(output, sort_keys=True, default=str), template_source,
+            existing_content if splice_into_existing else ""
+        )
+        cached = CACHE.get("render", input_hash)
+        if cached is not None:
+            return cached
+        
+        with self.tracer.span("yaml_parse", file=str(config_file), cached=document.parsed):
+            config_data = document.data
+        template = self.jinja_env.get_template(template_name)
+        context = {
+            "config": config_data,
+            "config_name": config_file.stem,
+            "config_type": config_type,
+            "config_file": str(config_file),
+            "generated_at": datetime.now().isoformat(),
+            "sync_version": "1.0",
+            # Include the template sources so template edits also regenerate regions
+            "fragment_hashes": {
+                section: self.calculate_fragment_hash(config_data, paths, template_source)
+                for section, paths in fragments.items()
+            }
+        }
+        
+        # Splice changed regions into existing docs instead of overwriting them
+        with self.tracer.span("render", template=template_name, fragments=splice_into_existing):
+            if splice_into_existing:
+                doc_content = self.splice_doc_fragments(config_file, existing_content, template, context)
+            else:
+                doc_content = GENERATED_REGION_PATTERN.sub(
+                    lambda match: self.format_generated_region(
+                        match.group("section"), match.group("hash") or "", match.group("body")
+                    ),
+                    template.render(**context)
+                )
+        
+        CACHE.put("render", input_hash, doc_content)
+        return doc_content
+    
+    def template_sources(self, template_name: str) -> Dict[str, str]:
+        """Sources of a template and of every template it includes, extends or imports.
+        
+        A reference with a computed name could load any template, so then the sources
+        of all templates are returned.
+        """
+        sources = {}
+        pending = [template_name]
+        while pending:
+            name = pending.pop()
+            if name in sources:
+                continue
+            source = self.jinja_env.loader.get_source(self.jinja_env, name)[0]
+            sources[name] = source
+            
+            key = (name, hashlib.sha256(source.encode('utf-8')).hexdigest())
+            if key not in self._template_references:
+                references = list(meta.find_referenced_templates(self.jinja_env.parse(source)))
+                self._template_references[key] = None if None in references else references
+            references = self._template_references[key]
+            pending.extend(self.jinja_env.list_templates() if references is None else references)
+        return sources
+    
+    def calculate_fragment_hash(self, config_data: Dict, paths: List[str], template_source: str = "") -> str:
+        """Calculate a stable hash of the config subtrees a generated region is built from"""
+        subtrees = [template_source]
+        for dotted_path in paths:
+            node = config_data
+            for key in dotted_path.split("."):
+                node = node.get(key) if isinstance(node, dict) else None
+            subtrees.append(node)
+        
+        canonical = json.dumps(subtrees, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+    
+    def format_generated_region(self, section: str, fragment_hash: str, body: str) -> str:
+        """Format a generated region with its start and end markers"""
+        return (f'<!-- hugai:generated:start section="{section}" hash="{fragment_hash}" -->\n'
+                f'{body.strip(chr(10))}\n'
+                f'<!-- hugai:generated:end section="{section}" -->')
+    
+    def splice_doc_fragments(self, config_file: Path, existing_content: str, template, context: Dict) -> str:
+        """Re-render only the generated regions whose config subtree hash changed.
+        
+        Each region maps to a template block of the same name. Content outside the
+        markers is preserved as is.
+        """
+        fragment_hashes = context["fragment_hashes"]
+        found_sections = []
+        updated_sections = []
+        
+        def splice(match):
+            section = match.group("section")
+            found_sections.append(section)
+            current_hash = fragment_hashes.get(section)
+            if current_hash is None or section not in template.blocks:
+                return match.group(0)
+            if match.group("hash") == current_hash:
+                return match.group(0)
+            
+            block_render = template.blocks[section](template.new_context(context))
+            updated_sections.append(section)
+            return self.format_generated_region(section, current_hash, "".join(block_render))
+        
+        new_content = GENERATED_REGION_PATTERN.sub(splice, existing_content)
+        
+        if not found_sections:
+            self.log_message(f"ℹ️  No generated regions for {config_file}, leaving hand-written page untouched")
+        elif updated_sections:
+            self.log_message(f"🧩 Regenerated sections for {config_file}: {', '.join(updated_sections)}")
+        
+        return new_content
+    
     def sync_single_file(self, config_file: Path, dry_run: bool = False) -> bool:
         """Synchronize a single configuration file"""
+        with self.tracer.span("sync_single_file", file=str(config_file), dry_run=dry_run) as span:
+            success = self._sync_single_file(config_file, dry_run)
+            span.set_attribute("success", success)
+            return success
+    
+    def _sync_single_file(self, config_file: Path, dry_run: bool = False) -> bool:
+        """Validate, back up and regenerate the documentation of a configuration file"""
         self.log_message(f"🔄 Syncing {config_file}...")
         
         # Validate configuration
-        is_valid, validation_errors = self.validate_configuration(config_file)
+        with self.phase_duration.time(phase="validate"):
+            is_valid, validation_errors = self.validate_configuration(config_file)
         if not is_valid:
             self.log_message(f"❌ Validation failed for {config_file}:")
             for error in validation_errors:
@@ -485,24 +1213,17 @@ class ConfigDocSyncManager:
         
         # Create backup
         if self.sync_config["backup"]["enabled"]:
-            existing_docs = []
             # Find existing documentation files that would be modified
-            config_type = self.determine_config_type(config_file)
-            sync_rules = self.sync_config["sync_rules"]["config_to_docs"]
-            
-            if config_type in sync_rules:
-                rule = sync_rules[config_type]
-                target_pattern = rule["target_pattern"]
-                target_path = Path(target_pattern.format(name=config_file.stem))
-                if target_path.exists():
-                    existing_docs.append(target_path)
+            existing_docs = [path for path in self.get_target_paths(config_file) if path.exists()]
             
             if existing_docs:
-                backup_path = self.create_backup(existing_docs)
+                with self.phase_duration.time(phase="backup"):
+                    backup_path = self.create_backup(existing_docs)
                 self.log_message(f"📦 Created backup: {backup_path}")
         
         # Generate documentation
-        doc_file = self.generate_documentation(config_file)
+        with self.phase_duration.time(phase="render"):
+            doc_file = self.generate_documentation(config_file)
         if doc_file:
             self.log_message(f"✅ Generated documentation: {doc_file}")
             
@@ -521,17 +1242,79 @@ class ConfigDocSyncManager:
             self.log_message(f"❌ Failed to generate documentation for {config_file}")
             return False
     
-    def sync_all(self, dry_run: bool = False) -> Dict[str, int]:
-        """Synchronize all configuration files"""
+    def sync_all(self, dry_run: bool = False, resume: bool = False,
+                 targets: Optional[List[Path]] = None) -> Dict[str, int]:
+        """Synchronize all configuration files, or only the given target files"""
+        try:
+            with self.phase_duration.time(phase="total"), \
+                    self.tracer.span("sync_all", dry_run=dry_run, resume=resume,
+                                     targets=len(targets) if targets is not None else -1) as span:
+                results = self.sync_changes(dry_run, resume, targets)
+                for key, value in results.items():
+                    span.set_attribute(key, value)
+                if not dry_run:
+                    self.update_bundle()
+            
+            for result, key in [("synced", "success"), ("failed", "failed"), ("skipped", "skipped")]:
+                self.files_processed.inc(results[key], result=result)
+            return results
+        finally:
+            # Dry runs leave no files behind
+            if not dry_run:
+                self.export_metrics()
+            self.tracer.flush()
+            self.close()
+    
+    def sync_changes(self, dry_run: bool = False, resume: bool = False,
+                     targets: Optional[List[Path]] = None) -> Dict[str, int]:
+        """Detect changed configuration files and synchronize them.
+        
+        Progress is checkpointed per file to the sync journal. With ``resume`` the files
+        left over by an interrupted run are processed instead of detecting changes again.
+        Explicit ``targets`` are synced as one batch without scanning anything else.
+        """
         results = {"success": 0, "failed": 0, "skipped": 0}
         
         self.log_message("🚀 Starting full synchronization...")
         
-        # Detect changes
-        changes = self.detect_changes()
+        # Commit whatever an interrupted run completed before looking for changes
+        interrupted = None if dry_run else self.recover_journal()
+        previously_synced = []
+        
+        if targets is not None:
+            changes = {"modified": list(targets), "added": [], "deleted": []}
+            self.log_message(f"🎯 Syncing {len(targets)} targeted files")
+        elif resume and interrupted:
+            done = interrupted["done"]
+            changes = {
+                "modified": [self.config_dir / key for key in interrupted["files"] if key not in done],
+                "added": [],
+                "deleted": [self.config_dir / key for key in interrupted["deleted"]
+                            if key not in interrupted["forgotten"]]
+            }
+            previously_synced = [self.config_dir / key for key in done]
+            self.log_message(f"⏯️  Resuming with {len(changes['modified'])} remaining files")
+        else:
+            if resume:
+                self.log_message("ℹ️  No interrupted run to resume, running a full synchronization")
+            
+            # Detect changes
+            with self.phase_duration.time(phase="detect"):
+                changes = self.detect_changes()
+        
+        # Files not seen by git change detection still record the blob ID they synced
+        if (targets is not None or (resume and interrupted)) and self.get_change_detection_backend() == "git":
+            self.current_object_ids.update(self.hash_objects(
+                [self.get_file_key(f) for f in changes["modified"] if f.is_file()]
+            ))
+        
         total_changes = len(changes["modified"]) + len(changes["added"])
+        if targets is None:
+            results["skipped"] = max(len(self.get_snapshot().config_files()) - total_changes, 0)
         
-        if total_changes == 0:
+        if total_changes == 0 and not changes["deleted"]:
+            if not dry_run:
+                self.journal.finish()
             self.log_message("✅ No changes detected. All files are up to date.")
             return results
         
@@ -540,14 +1323,37 @@ class ConfigDocSyncManager:
             if files:
                 self.log_message(f"   {change_type.title()}: {len(files)} files")
         
-        # Process changes
-        all_files = changes["modified"] + changes["added"]
+        if not dry_run:
+            self.journal.start(
+                [self.get_file_key(f) for f in changes["modified"] + changes["added"]],
+                [self.get_file_key(f) for f in changes["deleted"]]
+            )
+        
+        # Skip files that were only reformatted, reordered or re-commented
+        all_files = []
+        for config_file in changes["modified"] + changes["added"]:
+            if targets is None and self.is_semantically_unchanged(config_file):
+                results["skipped"] += 1
+                if not dry_run:
+                    self.journal.record("done", **self.commit_file_state(config_file))
+            else:
+                all_files.append(config_file)
+        
+        unchanged = total_changes - len(all_files)
+        if unchanged:
+            self.log_message(f"⏭️  Skipped {unchanged} files without semantic changes")
+        
+        # Process changes, checkpointing each file once its documentation is written
+        synced_files = list(previously_synced)
         
         for config_file in all_files:
             try:
                 success = self.sync_single_file(config_file, dry_run)
                 if success:
                     results["success"] += 1
+                    synced_files.append(config_file)
+                    if not dry_run:
+                        self.journal.record("done", **self.commit_file_state(config_file))
                 else:
                     results["failed"] += 1
             except Exception as e:
@@ -558,11 +1364,16 @@ class ConfigDocSyncManager:
         for deleted_file in changes["deleted"]:
             self.log_message(f"🗑️  Configuration deleted: {deleted_file}")
             # TODO: Implement documentation cleanup for deleted configs
+            if not dry_run:
+                file_key = self.get_file_key(deleted_file)
+                self.forget_file_state(file_key)
+                self.journal.record("deleted", file=file_key)
         
         # Update metadata
         if not dry_run:
             self.sync_metadata["last_sync"] = datetime.now().isoformat()
             self.save_sync_metadata()
+            self.journal.finish()
             
             # Cleanup old backups
             if self.sync_config["backup"]["enabled"]:
@@ -573,16 +1384,78 @@ class ConfigDocSyncManager:
             self.sync_config["git_integration"]["enabled"] and 
             results["success"] > 0):
             
-            self.git_commit_changes(all_files[:results["success"]])
+            with self.phase_duration.time(phase="git"):
+                self.git_commit_changes(synced_files)
         
         self.log_message(f"🎉 Synchronization complete: {results['success']} success, {results['failed']} failed")
         return results
     
+    def update_bundle(self):
+        """Rebuild the configuration bundle when any configuration or schema changed"""
+        bundle_config = self.sync_config.get("bundle") or {}
+        if not bundle_config.get("enabled") or not bundle_config.get("path"):
+            return
+        
+        bundle_file = self.root_dir / bundle_config["path"]
+        with self.phase_duration.time(phase="bundle"), self.tracer.span("update_bundle"):
+            # The recorded inputs digest needs no parsing, so an unchanged tree costs only hashing
+            if read_bundle_digest(bundle_file) == inputs_digest(self.config_dir, self.schema_registry):
+                return
+            try:
+                stats = build_bundle(self.config_dir, bundle_file, self.schema_registry)
+            except (OSError, BundleError) as e:
+                self.log_message(f"❌ Error building configuration bundle: {e}")
+                return
+        
+        self.log_message(f"📦 Rebuilt configuration bundle {bundle_file} ({stats['configs']} configurations)")
+        for file, error in stats["errors"]:
+            self.log_message(f"   ⚠️  Not bundled, {file}: {error}")
+    
+    def export_metrics(self):
+        """Write the sync metrics to the configured OpenMetrics textfile"""
+        metrics_config = self.sync_config.get("metrics", {})
+        if not metrics_config.get("enabled", True) or not metrics_config.get("textfile"):
+            return
+        
+        try:
+            self.metrics.write_textfile(self.root_dir / metrics_config["textfile"])
+        except OSError as e:
+            self.log_message(f"⚠️  Could not write metrics textfile: {e}")
+    
+    def import_cache(self, cache_file: Path):
+        """Load a render and validation cache artifact"""
+        if not cache_file.exists():
+            self.log_message(f"ℹ️  No result cache at {cache_file}, starting cold")
+            return
+        
+        try:
+            count = CACHE.import_file(cache_file)
+            self.log_message(f"💾 Loaded {count} cached results from {cache_file}")
+        except (OSError, EOFError, ValueError) as e:
+            self.log_message(f"⚠️  Could not load result cache {cache_file}: {e}")
+    
+    def export_cache(self, cache_file: Path):
+        """Write the results used by this run to a cache artifact"""
+        try:
+            count = CACHE.export(cache_file)
+            self.log_message(
+                f"💾 Saved {count} cached results to {cache_file} "
+                f"({CACHE.hits} hits, {CACHE.misses} misses this run)"
+            )
+        except OSError as e:
+            self.log_message(f"⚠️  Could not save result cache {cache_file}: {e}")
+    
     def git_commit_changes(self, files: List[Path]):
         """Commit synchronized changes to git"""
         try:
-            # Add changed files to git
-            subprocess.run(["git", "add", "docs/"], check=True, capture_output=True)
+            # Stage only the documentation generated for the synced configs
+            doc_paths = [str(path.resolve()) for config_file in files
+                         for path in self.get_target_paths(config_file)]
+            if not doc_paths:
+                return
+            with self.tracer.span("git", command="add", files=len(doc_paths)):
+                subprocess.run(["git", "-C", str(self.root_dir), "add", "--"] + doc_paths,
+                               check=True, capture_output=True)
             
             # Create commit message
             file_names = [f.stem for f in files]
@@ -595,8 +1468,9 @@ class ConfigDocSyncManager:
             
             # Only commit if auto_commit is enabled
             if self.sync_config["git_integration"]["auto_commit"]:
-                subprocess.run(["git", "commit", "-m", commit_message], 
-                             check=True, capture_output=True)
+                with self.tracer.span("git", command="commit"):
+                    subprocess.run(["git", "-C", str(self.root_dir), "commit", "-m", commit_message], 
+                                 check=True, capture_output=True)
                 self.log_message(f"📝 Git commit created: {commit_message}")
             else:
                 self.log_message(f"📝 Git changes staged. Commit message: {commit_message}")
@@ -615,26 +1489,47 @@ class ConfigDocSyncManager:
             any(part in file_path.parts for part in ['agents', 'lifecycle', 'tools', 'llms'])):
             
             self.log_message(f"📁 File changed: {file_path}")
-            self.sync_single_file(file_path)
+            self.get_snapshot().update(file_path)
+            try:
+                success = self.sync_single_file(file_path)
+                if success:
+                    self.commit_file_state(file_path)
+            except Exception as e:
+                self.log_message(f"❌ Error syncing {file_path}: {e}")
+                success = False
+            self.files_processed.inc(result="synced" if success else "failed")
             self.save_sync_metadata()
+            self.update_bundle()
+            self.export_metrics()
+            self.tracer.flush()
     
     def handle_file_deletion(self, file_path: str):
         """Handle file deletion event from watcher"""
         file_path = Path(file_path)
+        self.get_snapshot().remove(file_path)
         self.log_message(f"🗑️  File deleted: {file_path}")
         # TODO: Implement documentation cleanup
+        self.update_bundle()
     
-    def watch_for_changes(self):
+    def watch_for_changes(self, metrics_port: Optional[int] = None):
         """Watch for file changes and sync automatically"""
         self.log_message("👀 Starting file watcher...")
         
+        # Optionally expose metrics over a local HTTP endpoint
+        if metrics_port is None:
+            metrics_port = self.sync_config.get("metrics", {}).get("http_port")
+        if metrics_port:
+            self.metrics.serve(int(metrics_port))
+            self.log_message(f"📈 Serving metrics on http://127.0.0.1:{metrics_port}/metrics")
+        
         event_handler = ConfigDocSyncHandler(self)
         observer = Observer()
         
-        # Watch configuration directories
-        for config_type in ["agents", "lifecycle", "tools", "llms"]:
-            config_dir = self.config_dir / config_type
-            if config_dir.exists():
+        # Watch configuration directories found by the snapshot
+        snapshot = self.get_snapshot()
+        for config_type in self.config_types:
+            if config_type in snapshot.configs:
+                config_dir = self.config_dir / config_type
                 observer.schedule(event_handler, str(config_dir), recursive=True)
                 self.log_message(f"📂 Watching: {config_dir}")
         
@@ -648,6 +1543,8 @@ class ConfigDocSyncManager:
             observer.stop()
         
         observer.join()
+        self.close()
+        self.metrics.shutdown()
     
     def log_message(self, message: str):
         """Log message to configured channels"""
@@ -660,7 +1557,7 @@ class ConfigDocSyncManager:
         
         # File logging
         if "file" in self.sync_config["notifications"]["channels"]:
-            log_file = self.sync_config["notifications"]["log_file"]
+            log_file = self.root_dir / self.sync_config["notifications"]["log_file"]
             with open(log_file, 'a', encoding='utf-8') as f:
                 f.write(formatted_message + "\n")
     
@@ -683,6 +1580,8 @@ class ConfigDocSyncManager:
 
 ## Role and Capabilities
 
+<!-- hugai:generated:start section="role" hash="{{ fragment_hashes.role }}" -->
+{% block role %}
 ### Primary Role
 {{ config.configuration.role.primary }}
 
@@ -695,9 +1594,13 @@ class ConfigDocSyncManager:
 {% for capability in config.configuration.capabilities %}
 - {{ capability }}
 {% endfor %}
+{% endblock %}
+<!-- hugai:generated:end section="role" -->
 
 ## Dependencies
 
+<!-- hugai:generated:start section="dependencies" hash="{{ fragment_hashes.dependencies }}" -->
+{% block dependencies %}
 {% if config.configuration.dependencies.agents %}
 ### Agent Dependencies
 {% for agent in config.configuration.dependencies.agents %}
@@ -711,9 +1614,13 @@ class ConfigDocSyncManager:
 - {{ tool }}
 {% endfor %}
 {% endif %}
+{% endblock %}
+<!-- hugai:generated:end section="dependencies" -->
 
 ## Integration
 
+<!-- hugai:generated:start section="integration" hash="{{ fragment_hashes.integration }}" -->
+{% block integration %}
 ### Triggers
 {% for trigger in config.integration.triggers %}
 - **{{ trigger.event }}**: {{ trigger.condition }}
@@ -728,9 +1635,13 @@ class ConfigDocSyncManager:
 {% for output in config.integration.outputs %}
 - **{{ output.name }}** ({{ output.type }}): {{ output.description }}
 {% endfor %}
+{% endblock %}
+<!-- hugai:generated:end section="integration" -->
 
 ## Validation
 
+<!-- hugai:generated:start section="validation" hash="{{ fragment_hashes.validation }}" -->
+{% block validation %}
 ### Quality Gates
 {% for gate in config.validation.quality_gates %}
 - **{{ gate.name }}**: {{ gate.criteria }}
@@ -740,9 +1651,18 @@ class ConfigDocSyncManager:
 {% for metric in config.validation.metrics %}
 - **{{ metric.name }}** ({{ metric.type }}): Threshold {{ metric.threshold }}
 {% endfor %}
+{% endblock %}
+<!-- hugai:generated:end section="validation" -->
 
 ## CLI Usage
 
+<!-- hugai:generated:start section="cli_usage" hash="{{ fragment_hashes.cli_usage }}" -->
+{% block cli_usage %}
+{% if config.cli_usage is string %}
+```bash
+{{ config.cli_usage | trim }}
+```
+{% else %}
 {% for command in config.cli_usage.commands %}
 ### {{ command.command }}
 {{ command.description }}
@@ -751,6 +1671,9 @@ class ConfigDocSyncManager:
 {{ command.example }}
 ```
 {% endfor %}
+{% endif %}
+{% endblock %}
+<!-- hugai:generated:end section="cli_usage" -->
 
 ---
 *This documentation was automatically generated from `{{ config_file }}` on {{ generated_at }}*
@@ -759,6 +1682,41 @@ class ConfigDocSyncManager:
         with open(templates_dir / "agent-doc-template.md", 'w', encoding='utf-8') as f:
             f.write(agent_template)
         
+        # Machine-readable summary, rendered from the same parse as the documentation
+        summary_template = """{% set metadata = config.metadata if config.metadata is mapping else {} -%}
+{
+  "name": {{ metadata.name | default(config_name) | tojson }},
+  "type": {{ config_type | tojson }},
+  "version": {{ metadata.version | default(none) | tojson }},
+  "description": {{ metadata.description | default(none) | tojson }},
+  "category": {{ metadata.category | default(none) | tojson }},
+  "tags": {{ metadata.tags | default([]) | tojson }},
+  "dependencies": {{ metadata.dependencies | default([]) | tojson }},
+  "sections": {{ config.keys() | list | tojson }},
+  "source": {{ config_file | tojson }}
+}
+"""
+        
+        with open(templates_dir / "config-summary-template.json", 'w', encoding='utf-8') as f:
+            f.write(summary_template)
+        
+        # Plain-text digest in the llms.txt style, for LLM context windows
+        digest_template = """{% set metadata = config.metadata if config.metadata is mapping else {} -%}
+# {{ metadata.name | default(config_name) }}
+
+> {{ metadata.description | default("No description") }}
+
+- Type: {{ config_type }}
+- Version: {{ metadata.version | default("unversioned") }}
+{% if metadata.category %}- Category: {{ metadata.category }}
+{% endif %}{% if metadata.tags %}- Tags: {{ metadata.tags | join(", ") }}
+{% endif %}{% if metadata.dependencies %}- Depends on: {{ metadata.dependencies | join(", ") }}
+{% endif %}- Source: {{ config_file }}
+"""
+        
+        with open(templates_dir / "config-digest-template.txt", 'w', encoding='utf-8') as f:
+            f.write(digest_template)
+        
         self.log_message(f"✅ Created sync templates in {templates_dir}")
 
 
@@ -792,8 +1750,9 @@ def main():
     
     parser.add_argument(
         "--target", "-t",
+        action="append",
         type=str,
-        help="Target specific file or directory"
+        help="Target a file, directory or glob; may be repeated (all targets sync as one batch)"
     )
     
     parser.add_argument(
@@ -828,10 +1787,62 @@ def main():
         help="Generate detailed consistency report"
     )
     
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve OpenMetrics on this local port in watch mode"
+    )
+    
+    parser.add_argument(
+        "--trace-chrome",
+        type=str,
+        help="Write a Chrome trace-event JSON file of the sync pipeline"
+    )
+    
+    parser.add_argument(
+        "--trace-otlp",
+        type=str,
+        help="Write an OTLP-JSON trace file of the sync pipeline"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted synchronization with the files it had not finished"
+    )
+    
+    parser.add_argument(
+        "--import-cache",
+        type=str,
+        help="Load render and validation results from a cache artifact before syncing"
+    )
+    
+    parser.add_argument(
+        "--export-cache",
+        type=str,
+        help="Write the render and validation results used by this run to a cache artifact"
+    )
+    
     args = parser.parse_args()
     
     # Initialize sync manager
-    sync_manager = ConfigDocSyncManager(args.config_dir, args.docs_dir)
+    sync_manager = ConfigDocSyncManager(
+        args.config_dir, args.docs_dir,
+        config_types=None if args.mode == "full" else [args.mode]
+    )
+    
+    # Enable tracing if requested on the command line
+    trace_exporters = []
+    if args.trace_chrome:
+        trace_exporters.append({"type": "chrome", "path": args.trace_chrome})
+    if args.trace_otlp:
+        trace_exporters.append({"type": "otlp-json", "path": args.trace_otlp})
+    if trace_exporters:
+        sync_manager.tracer = create_tracer(trace_exporters, sync_manager.root_dir)
+    
+    # Restore results of previous runs, e.g. from the GitHub Actions cache
+    if args.import_cache:
+        sync_manager.import_cache(Path(args.import_cache))
     
     # Setup templates if requested
     if args.setup_templates:
@@ -865,18 +1876,25 @@ def main():
     try:
         if args.watch:
             # Watch mode
-            sync_manager.watch_for_changes()
+            sync_manager.watch_for_changes(args.metrics_port)
         elif args.target:
-            # Sync specific target
-            target_path = Path(args.target)
-            if target_path.is_file():
-                sync_manager.sync_single_file(target_path, args.dry_run)
-            else:
-                sync_manager.log_message(f"❌ Target not found or not a file: {target_path}")
+            # Sync the targeted files in one batch
+            try:
+                targets = sync_manager.resolve_targets(args.target)
+            except (FileNotFoundError, ValueError) as e:
+                sync_manager.log_message(f"❌ {e}")
+                sys.exit(1)
+            
+            if not targets:
+                sync_manager.log_message(f"❌ No configuration files in scope match: {', '.join(args.target)}")
+                sys.exit(1)
+            
+            results = sync_manager.sync_all(args.dry_run, targets=targets)
+            if results["failed"] > 0:
                 sys.exit(1)
         else:
             # Full synchronization
-            results = sync_manager.sync_all(args.dry_run)
+            results = sync_manager.sync_all(args.dry_run, args.resume)
             
             # Exit with error code if there were failures
             if results["failed"] > 0:
@@ -888,6 +1906,9 @@ def main():
     except Exception as e:
         sync_manager.log_message(f"❌ Synchronization failed: {e}")
         sys.exit(1)
+    finally:
+        if args.export_cache:
+            sync_manager.export_cache(Path(args.export_cache))
 
 
 if __name__ == "__main__":
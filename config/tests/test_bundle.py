@@ -0,0 +1,67 @@
+"""Tests for hugai_config.bundle"""
+
+import struct
+from datetime import date
+
+import pytest
+
+from hugai_config.bundle import (
+    BundleError, ConfigBundle, build_bundle, inputs_digest, read_bundle_digest
+)
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    config_dir = tmp_path / "config"
+    (config_dir / "agents").mkdir(parents=True)
+    (config_dir / "tools").mkdir()
+    (config_dir / "agents" / "router-agent.yaml").write_text(
+        "metadata:\n  name: router-agent\n  created: 2024-12-19\n  tags: [routing, core]\n"
+    )
+    (config_dir / "tools" / "code-search.yaml").write_text("metadata:\n  name: code-search\n")
+    (config_dir / "tools" / "broken.yaml").write_text("metadata: [unclosed\n")
+    return config_dir
+
+
+def test_build_and_read_round_trip(config_dir, tmp_path):
+    bundle_file = tmp_path / "hugai-configs.bundle"
+    result = build_bundle(config_dir, bundle_file)
+
+    assert result["configs"] == 2
+    assert [file for file, _ in result["errors"]] == ["tools/broken.yaml"]
+    with ConfigBundle(bundle_file) as bundle:
+        assert sorted(bundle) == ["code-search", "router-agent"]
+        assert bundle.names("agent") == ["router-agent"]
+        assert bundle["router-agent"] == {
+            "metadata": {"name": "router-agent", "created": date(2024, 12, 19), "tags": ["routing", "core"]}
+        }
+        assert bundle.entries["code-search"].file == "tools/code-search.yaml"
+        assert bundle.get("broken") is None
+        assert bundle.digest == result["digest"]
+
+
+def test_stale_digest_after_a_config_changes(config_dir, tmp_path):
+    bundle_file = tmp_path / "hugai-configs.bundle"
+    build_bundle(config_dir, bundle_file)
+    assert read_bundle_digest(bundle_file) == inputs_digest(config_dir)
+
+    (config_dir / "tools" / "code-search.yaml").write_text("metadata:\n  name: code-search-v2\n")
+    assert read_bundle_digest(bundle_file) != inputs_digest(config_dir)
+
+    (config_dir / "tools" / "code-search.yaml").unlink()
+    assert read_bundle_digest(bundle_file) != inputs_digest(config_dir)
+
+
+def test_other_format_versions_are_rejected(config_dir, tmp_path):
+    bundle_file = tmp_path / "hugai-configs.bundle"
+    build_bundle(config_dir, bundle_file)
+    data = bytearray(bundle_file.read_bytes())
+    struct.pack_into("<H", data, 8, 99)
+    bundle_file.write_bytes(bytes(data))
+
+    assert read_bundle_digest(bundle_file) is None
+    with pytest.raises(BundleError):
+        ConfigBundle(bundle_file)
+    bundle_file.write_bytes(b"not a bundle")
+    with pytest.raises(BundleError):
+        ConfigBundle(bundle_file)
@@ -0,0 +1,36 @@
+"""Tests for hugai_config.context_store"""
+
+import time
+from pathlib import Path
+
+from hugai_config.context_store import ContextStore
+
+CONTEXT_STORE_CONFIG = Path(__file__).resolve().parent.parent / "tools" / "context-store.yaml"
+
+DAY = 86400
+
+
+def test_sweep_keeps_full_text_search_in_sync(tmp_path):
+    now = time.time()
+    with ContextStore.load(tmp_path / "context.db", CONTEXT_STORE_CONFIG, batch_size=2) as store:
+        # agent_interactions are kept for 30 days; sweep in several small batches
+        store.insert("agent_interactions", [
+            {"content": f"oauth2 login flow {number}", "timestamp": now - 40 * DAY}
+            for number in range(5)
+        ])
+        kept = store.insert("agent_interactions", [
+            {"content": "oauth2 token refresh", "timestamp": now - DAY},
+        ])
+        store.insert("decisions", [{"reasoning": "Use oauth2 with JWT", "timestamp": now - 40 * DAY}])
+        assert len(store.search("oauth2")) == 7
+
+        deleted = store.sweep(now)
+        store.optimize()
+
+        assert deleted["agent_interactions"] == 5
+        assert deleted["decisions"] == 0
+        assert store.counts()["agent_interactions"] == 1
+        hits = store.search("oauth2", tables=["agent_interactions"])
+        assert [hit["id"] for hit in hits] == kept
+        assert store.search("login") == []
+        assert sorted(hit["table"] for hit in store.search("oauth2")) == ["agent_interactions", "decisions"]
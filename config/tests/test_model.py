@@ -0,0 +1,60 @@
+"""Tests for hugai_config.model"""
+
+import pickle
+from pathlib import Path
+
+from hugai_config.documents import load_yaml
+from hugai_config.model import LAZY_THRESHOLD, ConfigModels
+
+SCHEMAS_DIR = Path(__file__).resolve().parent.parent / "schemas"
+
+
+def _large_section(name: str, body: str) -> str:
+    lines = [f"{name}:\n", body]
+    lines.extend(f"  key_{number}: {'v' * 40}\n" for number in range(LAZY_THRESHOLD // 40))
+    return "".join(lines)
+
+
+def test_alias_to_anchor_in_earlier_section(tmp_path):
+    path = tmp_path / "aliases.yaml"
+    path.write_text("a: &shared\n  level: high\n  tags: [x, y]\n" + _large_section("b", "  ref: *shared\n"))
+
+    model = ConfigModels(SCHEMAS_DIR).load(path)
+
+    assert model.b["ref"] == {"level": "high", "tags": ["x", "y"]}
+    assert model.to_dict() == load_yaml(path)
+
+
+def test_merge_key_across_sections(tmp_path):
+    path = tmp_path / "merge.yaml"
+    path.write_text("base: &base\n  timeout: 30\n" + _large_section("service", "  <<: *base\n  retries: 3\n"))
+
+    model = ConfigModels(SCHEMAS_DIR).load(path)
+
+    assert model.service["timeout"] == 30
+    assert model.to_dict() == load_yaml(path)
+
+
+def test_large_sections_without_aliases_stay_deferred(tmp_path):
+    path = tmp_path / "plain.yaml"
+    path.write_text("a:\n  note: use **bold** and a && b\n" + _large_section("b", "  ref: plain\n"))
+
+    model = ConfigModels(SCHEMAS_DIR).load(path)
+
+    assert "b" in model._pending
+    assert model.to_dict() == load_yaml(path)
+
+
+def test_models_pickle_with_their_data(tmp_path):
+    models = ConfigModels(SCHEMAS_DIR)
+    path = tmp_path / "llms" / "model-llm.yaml"
+    path.parent.mkdir()
+    path.write_text("metadata:\n  name: model-llm\n  version: 1.0.0\n"
+                    + _large_section("configuration", "  providers: [a, b]\n"))
+    model = models.load(path)
+
+    copy = pickle.loads(pickle.dumps(model))
+    assert copy.to_dict() == load_yaml(path)
+    assert copy.metadata.name == "model-llm"
+    assert type(copy).__name__ == type(model).__name__
+    assert pickle.loads(pickle.dumps(model.metadata)).version == "1.0.0"
@@ -0,0 +1,48 @@
+"""Tests for hugai_config.planner"""
+
+import pytest
+
+from hugai_config.planner import parse_duration, plan_execution
+
+DURATIONS = {"a": 10, "b": 20, "c": 5, "d": 15, "e": 1}
+DEPENDENCIES = {"b": ["a"], "c": ["a"], "d": ["b", "c"]}
+
+
+def test_waves_critical_path_and_slack():
+    plan = plan_execution(DURATIONS, DEPENDENCIES)
+
+    assert plan.waves == [["a", "e"], ["b", "c"], ["d"]]
+    assert plan.critical_path == ["a", "b", "d"]
+    assert plan.critical_path_length == 45
+    assert plan.earliest_start == {"a": 0, "b": 10, "c": 10, "d": 30, "e": 0}
+    assert plan.slack == {"a": 0, "b": 0, "c": 15, "d": 0, "e": 44}
+    assert plan.makespan == plan.wave_makespan == 45
+    assert plan.peak_parallelism == 2
+    assert plan.cycles == [] and plan.blocked == []
+
+
+def test_bounded_parallelism():
+    plan = plan_execution(DURATIONS, DEPENDENCIES, parallelism=1)
+
+    assert plan.makespan == plan.wave_makespan == sum(DURATIONS.values())
+    with pytest.raises(ValueError):
+        plan_execution(DURATIONS, DEPENDENCIES, parallelism=0)
+
+
+def test_cycles_block_their_dependents():
+    plan = plan_execution({"x": 1, "y": 1, "z": 1, "w": 2},
+                          {"x": ["y"], "y": ["x"], "z": ["x", "unknown"]})
+
+    assert plan.cycles == [["x", "y"]]
+    assert plan.blocked == ["x", "y", "z"]
+    assert plan.waves == [["w"]]
+    assert plan.critical_path == ["w"]
+
+
+def test_parse_duration():
+    assert parse_duration("30m") == 1800
+    assert parse_duration("1.5d") == 129600
+    assert parse_duration("30 minutes") == 1800
+    assert parse_duration(90) == 90
+    with pytest.raises(ValueError):
+        parse_duration("soon")
@@ -0,0 +1,59 @@
+"""Tests for hugai_config.query"""
+
+from pathlib import Path
+
+from hugai_config.query import CatalogGraph
+
+INDEX_FILE = Path(__file__).resolve().parent.parent / "index.yaml"
+
+
+def _catalog(**dependencies):
+    """Catalog without a graph section, so CatalogGraph resolves the dependencies itself"""
+    entries = [{"name": name, "dependencies": list(depends)} for name, depends in dependencies.items()]
+    return {"catalog": {"tools": {"configurations": entries}}}
+
+
+def test_aliases_resolve_to_their_entry():
+    catalog = _catalog(engine=["cache-layer"], agent=["workflow-engine"])
+    catalog["catalog"]["tools"]["configurations"][0]["aliases"] = ["workflow-engine", "cache-layer"]
+    graph = CatalogGraph(catalog)
+
+    assert graph.dependencies("agent") == ["engine"]
+    # An entry declaring one of its own aliases is not its own dependency
+    assert graph.adjacency["engine"] == []
+
+
+def test_impact_through_aliased_dependencies():
+    graph = CatalogGraph.load(INDEX_FILE)
+
+    assert graph.impact("workflow-orchestrator") == ["escalation-manager-agent"]
+    assert graph.impact("security-agent") == [
+        "architecture-agent", "deployment", "deployment-agent", "design-architecture",
+        "devops-agent", "documentation-writer-agent", "implementation", "implementation-agent",
+        "internal-reviewer-agent", "maintenance", "maintenance-agent", "test-agent",
+        "testing-quality-assurance",
+    ]
+
+
+def test_transitive_closures_and_cycles():
+    graph = CatalogGraph(_catalog(app=["api", "ui"], api=["db", "cache"], ui=["api"],
+                                  cache=["db"], db=[], a=["b"], b=["a"]))
+
+    assert graph.dependencies("app") == ["api", "ui"]
+    assert graph.dependencies("app", transitive=True) == ["api", "cache", "db", "ui"]
+    assert graph.dependents("db") == ["api", "cache"]
+    assert graph.impact("db") == ["api", "app", "cache", "ui"]
+    # Members of a cycle reach each other but never list themselves
+    assert graph.dependencies("a", transitive=True) == ["b"]
+    assert graph.depends_on("a", "a")
+
+
+def test_shortest_path():
+    graph = CatalogGraph(_catalog(app=["api", "ui"], api=["db", "cache"], ui=["api"],
+                                  cache=["db"], db=[], worker=["db"]))
+
+    assert graph.shortest_path("app", "db") == ["app", "api", "db"]
+    assert graph.shortest_path("ui", "cache") == ["ui", "api", "cache"]
+    assert graph.shortest_path("db", "db") == ["db"]
+    assert graph.shortest_path("db", "app") is None
+    assert graph.shortest_path("worker", "api") is None
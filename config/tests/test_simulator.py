@@ -0,0 +1,64 @@
+"""Tests for hugai_config.simulator"""
+
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from hugai_config.documents import load_yaml  # noqa: E402
+from hugai_config.simulator import Trace, apply_overlay, read_trace, simulate  # noqa: E402
+
+MODEL_CONFIG = Path(__file__).resolve().parent.parent / "llms" / "model-llm.yaml"
+
+
+def test_daily_quota_counts_only_requests_admitted_per_minute():
+    # 200 security_analysis requests of 400 tokens per minute for one day: the
+    # 40k tokens per minute of claude_3_5_sonnet admit 100 a minute, so its
+    # 5,000 requests per day are all served before the rest fall back to gpt_4
+    requests = 200 * 24 * 60
+    trace = Trace(
+        task_types=np.full(requests, "security_analysis"),
+        input_tokens=np.full(requests, 300),
+        output_tokens=np.full(requests, 100),
+        timestamps=np.arange(requests) * 60 / 200
+    )
+
+    result = simulate(load_yaml(MODEL_CONFIG), trace)
+
+    assert result.requests_by_model["claude_3_5_sonnet"] == 5000
+    assert result.requests_by_model["gpt_4"] == 10000
+    assert result.served + result.throttled + result.unroutable == requests
+
+
+def test_requests_rejected_by_a_window_do_not_use_its_capacity():
+    # A 5,000 token request cannot fit 1,000 tokens per minute, but the two small
+    # requests after it in the same minute still do
+    configuration = apply_overlay(load_yaml(MODEL_CONFIG), {"configuration": {"model_providers": {
+        "anthropic": {"rate_limits": {"tokens_per_minute": 1000}},
+        "openai": {"rate_limits": {"tokens_per_minute": 0}}
+    }}})
+    trace = Trace(
+        task_types=np.full(3, "security_analysis"),
+        input_tokens=np.array([4900, 80, 80]),
+        output_tokens=np.array([100, 20, 20]),
+        timestamps=np.array([0.0, 1.0, 2.0])
+    )
+
+    result = simulate(configuration, trace)
+
+    assert result.requests_by_model["claude_3_5_sonnet"] == 2
+    assert result.throttled == 1
+
+
+def test_read_trace_unquotes_csv_fields(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text('task_type,input_tokens,output_tokens,timestamp\n'
+                    '"code_generation",1000,200,2\n'
+                    '"review, urgent", 300,100,1\n')
+
+    trace = read_trace(path)
+
+    assert trace.task_types.tolist() == ["review, urgent", "code_generation"]
+    assert trace.input_tokens.tolist() == [300, 1000]
+    assert trace.timestamps.tolist() == [1.0, 2.0]
@@ -0,0 +1,34 @@
+"""Tests for hugai_config.vector_index"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from hugai_config.vector_index import VectorIndex  # noqa: E402
+
+DIMENSION = 32
+
+
+def _vectors(seed: int, count: int):
+    return np.random.default_rng(seed).normal(size=(count, DIMENSION)).astype(np.float32)
+
+
+@pytest.mark.parametrize("quantized", [False, True])
+def test_append_after_train_ivf(tmp_path, quantized):
+    index = VectorIndex(tmp_path / "index", DIMENSION, quantized)
+    index.add([f"a{n}" for n in range(2000)], _vectors(0, 2000))
+    assert index.train_ivf(16) == 16
+
+    added = _vectors(1, 300)
+    assert index.add([f"b{n}" for n in range(300)], added) == 2300
+    expected = [f"b{n}" for n in range(300)]
+
+    # Appended rows join their nearest list, which every query probes first
+    hits = index.search(added, k=3, nprobe=2)
+    assert [found[0][0] for found in hits] == expected
+    assert all(len(found) == 3 for found in hits)
+
+    reopened = VectorIndex(tmp_path / "index")
+    assert len(reopened) == 2300 and reopened.nlist == 16
+    assert [found[0][0] for found in reopened.search(added, k=3, nprobe=2)] == expected
+    assert [found[0][0] for found in reopened.search(added, k=3)] == expected
@@ -33,12 +33,17 @@ from typing import Dict, List, Optional, Tuple
 try:
     import jsonschema
     import yaml
-    from jsonschema import validate, ValidationError, SchemaError
+    from jsonschema import ValidationError, SchemaError
 except ImportError as e:
     print(f"❌ Missing required dependencies: {e}")
     print("💡 Install with: pip install jsonschema pyyaml")
     sys.exit(1)
 
+from hugai_config.config_types import TYPE_DIRECTORIES, detect_config_type
+from hugai_config.documents import DOCUMENTS
+from hugai_config.metrics import MetricsRegistry
+from hugai_config.schemas import SCHEMA_FILES, get_schema_registry
+
 
 class ConfigValidator:
     """HUGAI Configuration Validator"""
@@ -47,6 +52,15 @@ class ConfigValidator:
         self.config_dir = Path(config_dir)
         self.schemas_dir = Path(schemas_dir)
         self.schemas = {}
+        self.schema_registry = get_schema_registry(self.schemas_dir)
+        
+        # Validation metrics, exported in OpenMetrics format
+        self.metrics = MetricsRegistry()
+        self.files_validated = self.metrics.counter(
+            "hugai_validation_files", "Configuration files validated", ["result"])
+        self.phase_duration = self.metrics.histogram(
+            "hugai_validation_phase_duration_seconds", "Latency of each validation phase", ["phase"])
+        
         self.load_schemas()
     
     def load_schemas(self) -> None:
@@ -55,19 +69,11 @@ class ConfigValidator:
             print(f"❌ Schemas directory not found: {self.schemas_dir}")
             sys.exit(1)
         
-        schema_files = {
-            'agent': 'agent-schema.json',
-            'lifecycle': 'lifecycle-schema.json',
-            'tool': 'tool-schema.json',
-            'llm': 'llm-schema.json'
-        }
-        
-        for schema_type, filename in schema_files.items():
+        for schema_type, filename in SCHEMA_FILES.items():
             schema_path = self.schemas_dir / filename
             if schema_path.exists():
                 try:
-                    with open(schema_path, 'r', encoding='utf-8') as f:
-                        self.schemas[schema_type] = json.load(f)
+                    self.schemas[schema_type] = self.schema_registry.get(schema_type)
                     print(f"✅ Loaded {schema_type} schema")
                 except json.JSONDecodeError as e:
                     print(f"❌ Invalid JSON in schema {filename}: {e}")
@@ -77,45 +83,12 @@ class ConfigValidator:
     
     def detect_config_type(self, config_path: Path) -> Optional[str]:
         """Detect configuration type based on file path and content"""
-        path_str = str(config_path)
-        
-        # Path-based detection
-        if '/agents/' in path_str:
-            return 'agent'
-        elif '/lifecycle/' in path_str:
-            return 'lifecycle'
-        elif '/tools/' in path_str:
-            return 'tool'
-        elif '/llms/' in path_str:
-            return 'llm'
-        
-        # Content-based detection
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                content = yaml.safe_load(f)
-            
-            if isinstance(content, dict) and 'metadata' in content:
-                metadata = content['metadata']
-                if 'category' in metadata:
-                    if metadata['category'] in ['core', 'specialized', 'utility', 'governance']:
-                        return 'agent'
-                    elif metadata['category'] in ['development', 'testing', 'deployment', 'monitoring', 'security', 'collaboration']:
-                        return 'tool'
-                elif 'phase' in metadata:
-                    return 'lifecycle'
-                elif 'providers' in content.get('configuration', {}):
-                    return 'llm'
-        
-        except Exception:
-            pass
-        
-        return None
+        return detect_config_type(config_path)
     
     def load_yaml_config(self, config_path: Path) -> Optional[Dict]:
         """Load and parse YAML configuration file"""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return DOCUMENTS.load(config_path).data
         except yaml.YAMLError as e:
             print(f"❌ Invalid YAML in {config_path}: {e}")
             return None
@@ -125,10 +98,18 @@ class ConfigValidator:
     
     def validate_config(self, config_path: Path, schema_type: Optional[str] = None) -> Tuple[bool, List[str]]:
         """Validate a single configuration file"""
+        with self.phase_duration.time(phase="total"):
+            is_valid, errors = self._validate_config(config_path, schema_type)
+        self.files_validated.inc(result="valid" if is_valid else "invalid")
+        return is_valid, errors
+    
+    def _validate_config(self, config_path: Path, schema_type: Optional[str] = None) -> Tuple[bool, List[str]]:
+        """Validate a single configuration file without recording metrics"""
         errors = []
         
         # Load configuration
-        config_data = self.load_yaml_config(config_path)
+        with self.phase_duration.time(phase="parse"):
+            config_data = self.load_yaml_config(config_path)
         if config_data is None:
             return False, ["Failed to load configuration file"]
         
@@ -144,7 +125,8 @@ class ConfigValidator:
         
         # Validate against schema
         try:
-            validate(instance=config_data, schema=self.schemas[schema_type])
+            with self.phase_duration.time(phase="schema"):
+                self.schema_registry.check(config_data, schema_type)
             return True, []
         except ValidationError as e:
             error_msg = f"Validation error at {e.json_path}: {e.message}"
@@ -174,12 +156,7 @@ class ConfigValidator:
         results = {}
         
         # Define directories to validate
-        directories = [
-            self.config_dir / "agents",
-            self.config_dir / "lifecycle", 
-            self.config_dir / "tools",
-            self.config_dir / "llms"
-        ]
+        directories = [self.config_dir / directory for directory in TYPE_DIRECTORIES.values()]
         
         for directory in directories:
             if directory.exists():
@@ -254,6 +231,12 @@ def main():
         help="Schemas directory (default: config/schemas)"
     )
     
+    parser.add_argument(
+        "--metrics-file",
+        type=str,
+        help="Write validation metrics to this OpenMetrics textfile"
+    )
+    
     args = parser.parse_args()
     
     # Initialize validator
@@ -276,7 +259,7 @@ def main():
             try:
                 with open(args.schema, 'r', encoding='utf-8') as f:
                     custom_schema = json.load(f)
-                validator.schemas['custom'] = custom_schema
+                validator.schemas['custom'] = validator.schema_registry.register('custom', custom_schema)
                 schema_type = 'custom'
             except Exception as e:
                 print(f"❌ Error loading custom schema: {e}")
@@ -297,6 +280,10 @@ def main():
     # Print results
     validator.print_results(results)
     
+    # Export metrics if requested
+    if args.metrics_file:
+        validator.metrics.write_textfile(Path(args.metrics_file))
+    
     # Exit with error code if any files are invalid
     if any(not is_valid for is_valid, _ in results.values()):
         sys.exit(1)
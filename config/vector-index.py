@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+HUGAI Vector Memory Index
+
+This script manages local vector indexes for the semantic memory of
+tools/context-store.yaml (see hugai_config/vector_index.py): one index directory per
+knowledge category, with embeddings in memory-mapped NumPy files, exact batched cosine
+search, optional int8 quantization and IVF lists for large corpora. Texts are embedded
+with the deterministic hashing embedder at the embedding_dimension of the category;
+model embeddings are added through the Python API.
+
+Documents to add are JSON lines with "id" and "text" fields, or plain text with one
+document per line (ids are <file>:<line>). Appends never rebuild the index.
+
+Usage:
+    python vector-index.py [--category <name>] [--index <dir>] --add <file> [--int8]
+    python vector-index.py [--category <name>] [--index <dir>] --train-ivf [<nlist>]
+    python vector-index.py [--category <name>] [--index <dir>] --search <query> [-k <n>] [--nprobe <n>]
+    python vector-index.py --benchmark [<rows>] [--dimension <n>]
+
+Examples:
+    # Index code patterns, quantized to int8
+    python vector-index.py --category code_patterns --add patterns.jsonl --int8
+
+    # Search the five nearest patterns
+    python vector-index.py --category code_patterns --search "retry with backoff" -k 5
+
+    # Partition a large index and search eight lists
+    python vector-index.py --category code_patterns --train-ivf
+    python vector-index.py --category code_patterns --search "oauth2 login" --nprobe 8
+
+    # Compare exact, int8 and IVF search on 200000 vectors
+    python vector-index.py --benchmark 200000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import numpy as np
+    import yaml
+except ImportError as e:
+    print(f"❌ Missing required dependencies: {e}")
+    print("💡 Install with: pip install numpy pyyaml")
+    sys.exit(1)
+
+from hugai_config.documents import load_yaml
+from hugai_config.vector_index import DEFAULT_NPROBE, HashingEmbedder, VectorIndex
+
+DEFAULT_CATEGORY = "code_patterns"
+DEFAULT_INDEX_ROOT = "memory-index"
+DEFAULT_DIMENSION = 1536
+
+ADD_BATCH = 10000
+
+# Synthetic corpus of the benchmark: points near a random low-dimensional subspace, so
+# nearest neighbors straddle IVF list boundaries and scanning fewer lists costs recall
+BENCHMARK_LATENT_DIMENSION = 16
+BENCHMARK_NOISE = 0.1
+BENCHMARK_QUERIES = 1000
+BENCHMARK_K = 10
+
+
+def read_documents(path: Path):
+    """(ids, texts) of a JSON lines or plain text file"""
+    ids, texts = [], []
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if path.suffix in (".jsonl", ".ndjson"):
+                document = json.loads(line)
+                ids.append(str(document["id"]))
+                texts.append(document["text"])
+            else:
+                ids.append(f"{path.name}:{number}")
+                texts.append(line)
+    return ids, texts
+
+
+def recall(results: list, truth: list) -> float:
+    return float(np.mean([len({hit for hit, _ in found} & {hit for hit, _ in exact}) / max(1, len(exact))
+                          for found, exact in zip(results, truth)]))
+
+
+def synthetic_vectors(rng, basis: np.ndarray, count: int) -> np.ndarray:
+    return (rng.normal(size=(count, len(basis))).astype(np.float32) @ basis
+            + BENCHMARK_NOISE * rng.normal(size=(count, basis.shape[1])).astype(np.float32))
+
+
+def benchmark(directory: Path, rows: int, dimension: int, nprobe: int):
+    """Add synthetic vectors, then compare exact, int8 and IVF search"""
+    rng = np.random.default_rng(0)
+    basis = rng.normal(size=(BENCHMARK_LATENT_DIMENSION, dimension)).astype(np.float32)
+    queries = synthetic_vectors(rng, basis, BENCHMARK_QUERIES)
+
+    truth = None
+    for quantized in (False, True):
+        label = "int8" if quantized else "float32"
+        index = VectorIndex(directory / label, dimension, quantized)
+        vector_rng = np.random.default_rng(1)
+        start = time.perf_counter()
+        for offset in range(0, rows, ADD_BATCH):
+            size = min(ADD_BATCH, rows - offset)
+            index.add([f"v{n}" for n in range(offset, offset + size)], synthetic_vectors(vector_rng, basis, size))
+        add_time = time.perf_counter() - start
+        size = sum(file.stat().st_size for file in (directory / label).glob("vectors.*"))
+        print(f"\n📦 {label}: {rows:,} vectors of {dimension} in {add_time:.1f}s "
+              f"({rows / add_time:,.0f} vectors/s, {size / 2 ** 20:,.0f} MiB on disk)")
+
+        start = time.perf_counter()
+        exact = index.search(queries, k=BENCHMARK_K)
+        search_time = time.perf_counter() - start
+        truth = truth or exact
+        print(f"🔍 Exact search: {len(queries) / search_time:,.0f} queries/s, "
+              f"recall@{BENCHMARK_K} {recall(exact, truth):.3f}")
+
+        start = time.perf_counter()
+        nlist = index.train_ivf()
+        print(f"🧭 IVF training: {nlist} lists in {time.perf_counter() - start:.1f}s")
+
+        for probes in (nprobe, 4 * nprobe):
+            start = time.perf_counter()
+            approximate = index.search(queries, k=BENCHMARK_K, nprobe=probes)
+            search_time = time.perf_counter() - start
+            print(f"🔍 IVF search (nprobe {probes}): {len(queries) / search_time:,.0f} queries/s, "
+                  f"recall@{BENCHMARK_K} {recall(approximate, truth):.3f}")
+
+
+def main():
+    """Main function to handle command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="HUGAI Vector Memory Index",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=str(Path(__file__).parent / "tools" / "context-store.yaml"),
+        help="Context store configuration (default: tools/context-store.yaml)"
+    )
+
+    parser.add_argument(
+        "--category",
+        type=str,
+        default=DEFAULT_CATEGORY,
+        help=f"Semantic memory knowledge category (default: {DEFAULT_CATEGORY})"
+    )
+
+    parser.add_argument(
+        "--index",
+        type=str,
+        help=f"Index directory (default: {DEFAULT_INDEX_ROOT}/<category>)"
+    )
+
+    parser.add_argument(
+        "--dimension",
+        type=int,
+        help="Embedding dimension (default: embedding_dimension of the category)"
+    )
+
+    parser.add_argument(
+        "--add",
+        type=str,
+        metavar="FILE",
+        help="Embed and append documents (.jsonl with id and text, or one text per line)"
+    )
+
+    parser.add_argument(
+        "--int8",
+        action="store_true",
+        help="Store int8 codes instead of float32 (new indexes only)"
+    )
+
+    parser.add_argument(
+        "--train-ivf",
+        type=int,
+        nargs="?",
+        const=0,
+        metavar="NLIST",
+        help="Partition the index into IVF lists (default: square root of the rows)"
+    )
+
+    parser.add_argument(
+        "--search", "-s",
+        type=str,
+        help="Text to search"
+    )
+
+    parser.add_argument(
+        "-k",
+        type=int,
+        default=10,
+        help="Number of results (default: 10)"
+    )
+
+    parser.add_argument(
+        "--nprobe",
+        type=int,
+        help="IVF lists to scan per query (default: exact search; "
+             f"{DEFAULT_NPROBE} for --benchmark)"
+    )
+
+    parser.add_argument(
+        "--min-score",
+        type=float,
+        help="Minimum cosine similarity of results"
+    )
+
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print the index size and layout"
+    )
+
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        nargs="?",
+        const=200000,
+        metavar="ROWS",
+        help="Compare exact, int8 and IVF search on synthetic vectors (default: 200000)"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        configuration = load_yaml(Path(args.config)) or {}
+    except (OSError, yaml.YAMLError) as e:
+        print(f"❌ Error loading {args.config}: {e}")
+        sys.exit(1)
+
+    semantic_memory = (((configuration.get("configuration") or {}).get("agent_memory") or {})
+                       .get("semantic_memory") or {})
+    categories = semantic_memory.get("knowledge_categories") or {}
+    if args.category not in categories and not args.benchmark:
+        print(f"❌ Unknown knowledge category: {args.category} "
+              f"(available: {', '.join(categories) or 'none'})")
+        sys.exit(1)
+    dimension = args.dimension or int((categories.get(args.category) or {})
+                                      .get("embedding_dimension", DEFAULT_DIMENSION))
+
+    if args.benchmark:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            benchmark(Path(temp_dir), args.benchmark, dimension, args.nprobe or DEFAULT_NPROBE)
+        return
+
+    directory = Path(args.index or Path(DEFAULT_INDEX_ROOT) / args.category)
+    try:
+        index = VectorIndex(directory, dimension, args.int8, HashingEmbedder(dimension))
+
+        if args.add:
+            ids, texts = read_documents(Path(args.add))
+            start = time.perf_counter()
+            for offset in range(0, len(ids), ADD_BATCH):
+                index.add(ids[offset:offset + ADD_BATCH], texts=texts[offset:offset + ADD_BATCH])
+            print(f"✅ Added {len(ids):,} documents to {directory} in {time.perf_counter() - start:.1f}s "
+                  f"({len(index):,} total)")
+
+        if args.train_ivf is not None:
+            start = time.perf_counter()
+            nlist = index.train_ivf(args.train_ivf or None)
+            print(f"🧭 {len(index):,} vectors partitioned into {nlist} IVF lists "
+                  f"in {time.perf_counter() - start:.1f}s")
+
+        if args.search:
+            hits = index.search(texts=[args.search], k=args.k, nprobe=args.nprobe, min_score=args.min_score)[0]
+            print(f"🔍 {len(hits)} results for {args.search!r}")
+            for row_id, score in hits:
+                print(f"   {score:6.3f}  {row_id}")
+
+        if args.stats:
+            size = sum(file.stat().st_size for file in directory.iterdir())
+            print(f"📊 {directory}: {len(index):,} vectors of {index.dimension}, "
+                  f"{'int8' if index.quantized else 'float32'}, "
+                  f"{index.nlist or 'no'} IVF lists, {size / 2 ** 20:,.1f} MiB")
+    except (OSError, ValueError, KeyError, json.JSONDecodeError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
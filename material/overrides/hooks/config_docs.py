@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+import sys
+
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.livereload import LiveReloadServer
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.pages import Page
+from pathlib import Path
+
+# -----------------------------------------------------------------------------
+# Hooks
+# -----------------------------------------------------------------------------
+
+# Create the sync manager for this build - the sync module itself is loaded
+# once per process, so its render cache survives rebuilds in `mkdocs serve`
+def on_config(config: MkDocsConfig):
+    global manager, project_dir
+    project_dir = Path(config.config_file_path).parent
+    module = _load_sync_module(project_dir / "config" / "sync-automation.py")
+
+    manager = module.ConfigDocSyncManager(
+        str(project_dir / "config"), config.docs_dir, str(project_dir)
+    )
+    manager.sync_config["notifications"]["channels"] = []
+
+# Inject generated pages for configurations without a page on disk as virtual
+# files, and remember hand-written pages that contain generated regions
+def on_files(files: Files, *, config: MkDocsConfig):
+    fragment_pages.clear()
+    for config_file in manager.get_snapshot().config_files():
+        src_uri = _src_uri_for(config_file, config)
+        if src_uri is None:
+            continue
+
+        # Hand-written pages are only touched inside their generated regions
+        if files.get_file_from_path(src_uri):
+            if manager.get_sync_rule(config_file).get("fragments"):
+                fragment_pages[src_uri] = config_file
+            continue
+
+        # Render the page in memory, never writing it to the docs directory
+        try:
+            content = manager.render_documentation(config_file)
+        except Exception as e:
+            log.warning(f"Unable to render {config_file}: {e}")
+            continue
+
+        files.append(File.generated(config, src_uri, content = content))
+
+    return files
+
+# Splice changed generated regions into hand-written pages
+def on_page_markdown(
+    markdown: str, *, page: Page, config: MkDocsConfig, files: Files
+):
+    config_file = fragment_pages.get(page.file.src_uri)
+    if config_file is None:
+        return
+
+    try:
+        return manager.render_documentation(config_file, markdown)
+    except Exception as e:
+        log.warning(f"Unable to render generated regions of {config_file}: {e}")
+
+# Rebuild when configurations, sync templates or sync rules change
+def on_serve(server: LiveReloadServer, *, config: MkDocsConfig, builder):
+    config_dir = project_dir / "config"
+    for config_type in manager.CONFIG_TYPES:
+        if (config_dir / config_type).is_dir():
+            server.watch(str(config_dir / config_type))
+
+    for path in [config_dir / "sync-templates", config_dir / "sync-config.yaml"]:
+        if path.exists():
+            server.watch(str(path))
+
+# -----------------------------------------------------------------------------
+# Helper functions
+# -----------------------------------------------------------------------------
+
+# Load the sync script, which is not importable by name due to its filename
+def _load_sync_module(path: Path):
+    module = sys.modules.get(MODULE_NAME)
+    if module is None:
+        # Make the shared hugai_config package next to the script importable
+        if str(path.parent) not in sys.path:
+            sys.path.insert(0, str(path.parent))
+
+        spec = importlib.util.spec_from_file_location(MODULE_NAME, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[MODULE_NAME] = module
+        spec.loader.exec_module(module)
+
+    return module
+
+# Resolve the page path of a configuration's documentation within docs_dir
+def _src_uri_for(config_file: Path, config: MkDocsConfig):
+    target_path = manager.get_target_path(config_file)
+    if target_path is None:
+        return None
+
+    path = os.path.relpath(project_dir / target_path, config.docs_dir)
+    if path.startswith(os.pardir):
+        return None
+
+    return Path(path).as_posix()
+
+# -----------------------------------------------------------------------------
+# Data
+# -----------------------------------------------------------------------------
+
+# Name under which the sync script is registered in sys.modules
+MODULE_NAME = "hugai_sync_automation"
+
+# Hand-written pages with generated regions, mapped to their configuration
+fragment_pages: dict[str, Path] = {}
+
+# Sync manager and project directory of the current build
+manager = None
+project_dir: Path | None = None
+
+# Set up logging
+log = logging.getLogger("mkdocs.material.config_docs")